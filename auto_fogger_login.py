@@ -1,3 +1,8 @@
+import time
+
+# FOGGER_STARTUP_PROFILE=1 - process import pasun pahilya frame paryantcha vel
+STARTUP_T0 = time.perf_counter()
+
 from kivymd.app import MDApp
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.screenmanager import MDScreenManager
@@ -15,174 +20,113 @@ from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.graphics import Color, RoundedRectangle, Line, Ellipse, Rectangle
 from kivy.uix.widget import Widget
+from kivy.uix.recycleview import RecycleView
+from kivy.properties import StringProperty, ColorProperty, NumericProperty
 from kivy.lang import Builder
 import math
-import sqlite3
 import os
+from collections import deque
 from datetime import datetime
 
+from fogger_db import (
+    DEFAULT_ZONE_ID, DatabaseManager, DBWorker, EventWriteBuffer, RetentionEngine,
+    RetentionPolicy,
+)
+from fogger_export import ExportJob, export_filename
+from fogger_control import AdaptiveSampler, Zone, ZoneScheduler
+from fogger_programs import ProgramScheduler
+from fogger_telemetry import GridRing, TelemetryBuffer, read_telemetry, sparkline_points
+
 Window.size = (420, 780)
 Window.clearcolor = get_color_from_hex("#0A1628")
 
 
+# Schema DDL / migrations startup la nahi - build() madhe pahila DBWorker job
+db = DatabaseManager(defer_migrate=True)
+# Sagle SQLite calls ya thread var chaltat, results Clock ne UI thread var yetat
+db_worker = DBWorker(db, dispatch=lambda fn: Clock.schedule_once(lambda dt: fn()))
+# Motor/sensor events memory madhe jama hotat, ek transaction madhe lihile jatat
+event_buffer = EventWriteBuffer(db, db_worker, max_rows=50, max_delay_ms=1000)
+# Raw events 90 divas, hourly rollups 180 divas, daily 2 varsh, weekly kayam
+retention = RetentionEngine(db, db_worker, RetentionPolicy(raw_days=90))
+RETENTION_INTERVAL = 6 * 60 * 60
+# Zone la swatacha sensor nasel tar FOGGER_SENSOR=sim | trace:<file.csv> | serial:<port>[@baud]
+DEFAULT_SENSOR = os.environ.get('FOGGER_SENSOR', 'sim')
+# Pratyek zone cha auto/manual logic UI pasun vegla - thresholds zones table madhe
+# (default 40 C la ON, 38.5 C khali OFF, kiman 60s ON / 30s OFF, EMA smoothing).
+# Sagle zones eka Clock timer madhun poll hotat; screens fakt subscribe kartat.
+# Poll interval adaptive: threshold javal 1s, normal 5s, stable 15s, background 60s.
+# Zones DB worker var load hotat (AutoFoggerApp._on_zones_loaded).
+SENSOR_INTERVAL = 5
+scheduler = ZoneScheduler(
+    sampler=AdaptiveSampler(fast_s=1.0, normal_s=SENSOR_INTERVAL, slow_s=15.0, background_s=60.0),
+)
+# Pratyek reading (fakt ON/OFF events nahi) compressed blocks madhe
+telemetry = TelemetryBuffer(db, db_worker, block_size=600, max_age_s=300)
+# Time-of-day fog / block programs (python fogger_programs.py add ...) - pudhcha
+# trigger heap madhe, sensor timer tyachya vel paryantach thambto
+programs = ProgramScheduler(scheduler)
+# Dashboard cards var shevatchya 10 minutes chi sparkline - poll interval kahihi
+# asla tari 5 s grid var ek point
+SPARKLINE_MINUTES = 10
+SPARKLINE_STEP_S = 5
+
+
 # ==========================================
-#  DATABASE MANAGER
+#  DISPLAY FORMATTING
 # ==========================================
-class DatabaseManager:
-    def __init__(self):
-        self.db_path = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            'auto_fogger.db'
-        )
-        self._create_table()
-
-    def _create_table(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                status TEXT NOT NULL,
-                temperature REAL,
-                humidity REAL,
-                duration TEXT,
-                reason TEXT,
-                date TEXT,
-                time TEXT,
-                created_at TEXT
-            )
-        ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password TEXT NOT NULL,
-                role TEXT NOT NULL
-            )
-        ''')
-        # Default admin insert kara
-        cursor.execute("SELECT COUNT(*) FROM users")
-        if cursor.fetchone()[0] == 0:
-            cursor.execute("INSERT INTO users (name, email, password, role) VALUES (?, ?, ?, ?)",
-                         ("Admin", "admin@fogger.com", "admin123", "admin"))
-        conn.commit()
-        conn.close()
-
-    def check_login(self, email, password):
-        """Email + password ne login check kara"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT name, role FROM users WHERE email=? AND password=?",
-                      (email, password))
-        row = cursor.fetchone()
-        conn.close()
-        return row if row else None
-
-    def get_all_users(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name, email, role FROM users ORDER BY id")
-        rows = cursor.fetchall()
-        conn.close()
-        return rows
-
-    def add_user(self, name, email, password, role):
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO users (name, email, password, role) VALUES (?, ?, ?, ?)",
-                          (name, email, password, role))
-            conn.commit()
-            conn.close()
-            return True
-        except:
-            return False
-
-    def delete_user(self, email):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM users WHERE email=? AND email != 'admin@fogger.com'",
-                      (email,))
-        conn.commit()
-        conn.close()
-
-    def save_event(self, status, temperature, humidity, duration, reason):
-        now = datetime.now()
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO history
-            (status, temperature, humidity, duration, reason, date, time, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            status, temperature, humidity, duration, reason,
-            now.strftime("%d %b %Y"),
-            now.strftime("%I:%M %p"),
-            now.strftime("%Y-%m-%d %H:%M:%S")
-        ))
-        conn.commit()
-        conn.close()
-
-    def get_all_events(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT id, status, temperature, humidity, duration, reason, date, time
-            FROM history ORDER BY id DESC LIMIT 50000
-        ''')
-        rows = cursor.fetchall()
-        conn.close()
-        return rows
-
-    def delete_all(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM history')
-        conn.commit()
-        conn.close()
-
-    def get_count(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM history')
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count
-
-
-db = DatabaseManager()
+def format_duration(seconds):
+    """192 -> '3m 12s' (None -> '-')"""
+    if seconds is None:
+        return "-"
+    return f"{seconds // 60}m {seconds % 60}s"
+
+
+def format_date(ts):
+    return datetime.fromtimestamp(ts).strftime("%d %b %Y") if ts is not None else "-"
+
+
+def format_time(ts):
+    return datetime.fromtimestamp(ts).strftime("%I:%M %p") if ts is not None else "-"
 
 
 # ==========================================
 #  NOTIFICATION WIDGET (Popup Banner)
 # ==========================================
 class NotificationBanner(MDCard):
-    """Animated notification banner that slides in from top"""
+    """Animated notification banner that slides in from top.
+
+    Widgets / canvas instructions ekdach banatat; set_message() fakt colors ani
+    text badalto, mhanun NotificationManager banners reuse karto.
+    """
+
+    # type -> (background, accent, text, icon)
+    STYLES = {
+        'warning':  ("#7B2D00", "#FF6D00", "#FFE0B2", 'ALERT'),
+        'danger':   ("#7B0000", "#FF1744", "#FFCDD2", 'DANGER'),
+        'success':  ("#1B5E20", "#00C853", "#C8E6C9", 'OK'),
+        'info':     ("#0D47A1", "#2979FF", "#BBDEFB", 'INFO'),
+    }
 
-    def __init__(self, message, notif_type='warning', **kwargs):
+    def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.size_hint = (0.92, None)
         self.height = dp(70)
         self.pos_hint = {'center_x': 0.5}
         self.elevation = 12
         self.radius = [12]
-
-        # Colors
-        colors = {
-            'warning':  ("#7B2D00", "#FF6D00", "#FFE0B2"),
-            'danger':   ("#7B0000", "#FF1744", "#FFCDD2"),
-            'success':  ("#1B5E20", "#00C853", "#C8E6C9"),
-            'info':     ("#0D47A1", "#2979FF", "#BBDEFB"),
-        }
-        bg_hex, accent_hex, text_hex = colors.get(notif_type, colors['info'])
+        self.notif_type = None
+        self.message = None
+        self.count = 0
+        self.shown_at = 0.0
+        self.dismiss_ev = None
 
         with self.canvas.before:
-            Color(*get_color_from_hex(bg_hex)[:3], 1)
+            self._bg_color = Color(1, 1, 1, 1)
             self._bg_rect = RoundedRectangle(
                 pos=self.pos, size=self.size, radius=[12]
             )
-            Color(*get_color_from_hex(accent_hex)[:3], 1)
+            self._accent_color = Color(1, 1, 1, 1)
             self._left_bar = Rectangle(
                 pos=self.pos, size=(dp(5), self.height)
             )
@@ -194,76 +138,152 @@ class NotificationBanner(MDCard):
             spacing=dp(8),
         )
 
-        # Icon label
-        icon_map = {
-            'warning': 'ALERT',
-            'danger':  'DANGER',
-            'success': 'OK',
-            'info':    'INFO',
-        }
-        icon_lbl = MDLabel(
-            text=icon_map.get(notif_type, 'INFO'),
+        self._icon_lbl = MDLabel(
             bold=True,
             size_hint=(None, None),
             size=(dp(55), dp(28)),
             halign='center',
             font_style="Caption",
             theme_text_color="Custom",
-            text_color=get_color_from_hex(accent_hex),
         )
-        with icon_lbl.canvas.before:
-            Color(*get_color_from_hex(accent_hex)[:3], 0.2)
-            RoundedRectangle(
-                pos=icon_lbl.pos,
-                size=icon_lbl.size,
+        with self._icon_lbl.canvas.before:
+            self._icon_color = Color(1, 1, 1, 0.2)
+            self._icon_rect = RoundedRectangle(
+                pos=self._icon_lbl.pos,
+                size=self._icon_lbl.size,
                 radius=[6]
             )
+        self._icon_lbl.bind(pos=self._update_icon, size=self._update_icon)
 
-        msg_lbl = MDLabel(
-            text=message,
+        self._msg_lbl = MDLabel(
             font_style="Body2",
             theme_text_color="Custom",
-            text_color=get_color_from_hex(text_hex),
         )
 
-        layout.add_widget(icon_lbl)
-        layout.add_widget(msg_lbl)
+        layout.add_widget(self._icon_lbl)
+        layout.add_widget(self._msg_lbl)
         self.add_widget(layout)
 
+    def set_message(self, message, notif_type='warning', count=1):
+        """Text / type badla - type tasach asel tar colors punha set hot nahit"""
+        if notif_type != self.notif_type:
+            bg_hex, accent_hex, text_hex, icon = self.STYLES.get(notif_type, self.STYLES['info'])
+            accent = get_color_from_hex(accent_hex)
+            self._bg_color.rgb = get_color_from_hex(bg_hex)[:3]
+            self._accent_color.rgb = accent[:3]
+            self._icon_color.rgb = accent[:3]
+            self._icon_lbl.text = icon
+            self._icon_lbl.text_color = accent
+            self._msg_lbl.text_color = get_color_from_hex(text_hex)
+            self.notif_type = notif_type
+        self.message = message
+        self.count = count
+        self._msg_lbl.text = f"{message}  \u00d7{count}" if count > 1 else message
+
     def _update_bg(self, *args):
         self._bg_rect.pos = self.pos
         self._bg_rect.size = self.size
         self._left_bar.pos = self.pos
         self._left_bar.size = (dp(5), self.height)
 
+    def _update_icon(self, *args):
+        self._icon_rect.pos = self._icon_lbl.pos
+        self._icon_rect.size = self._icon_lbl.size
+
 
 class NotificationManager:
-    """Handles showing/hiding notification banners"""
+    """Handles showing/hiding notification banners.
+
+    Jast-jast `max_visible` banners ekakhali ek; baki `queue_size` paryant
+    queue madhe. Banners pool madhun reuse hotat. Disnara kiva queue madhla
+    agdi sarkha message navin banner na banavta count vadhavto ("... x5").
+    Tyach type cha vegla message `RATE_LIMITS[type]` seconds chya aat aala
+    tar queue madhe thambto ani limit sampli ki dakhavla jato.
+    """
 
-    def __init__(self, parent_widget):
+    # type -> don navin banners madhle kiman seconds
+    RATE_LIMITS = {'warning': 3.0, 'danger': 1.0, 'success': 2.0, 'info': 2.0}
+    SLOT = dp(78)
+
+    def __init__(self, parent_widget, max_visible=3, queue_size=10):
         self.parent = parent_widget
+        self.max_visible = max_visible
         self._active = []
+        self._pool = []
+        self._queue = deque(maxlen=queue_size)
+        self._drain_ev = None
 
     def show(self, message, notif_type='warning', duration=4):
-        banner = NotificationBanner(message=message, notif_type=notif_type)
-
-        # Position: just below top
+        for banner in self._active:
+            if banner.notif_type == notif_type and banner.message == message:
+                # Coalesce: count vadhva, timer parat suru
+                banner.set_message(message, notif_type, banner.count + 1)
+                self._schedule_dismiss(banner, duration)
+                return
+        for item in self._queue:
+            if item[1] == notif_type and item[0] == message:
+                item[3] += 1
+                return
+        # deque maxlen - sarvat juna queued message sodla jato
+        self._queue.append([message, notif_type, duration, 1])
+        self._drain()
+
+    def _rate_wait(self, notif_type, now):
+        """Ya type cha pudhcha banner kiti seconds nantar (0 = ata)"""
+        limit = self.RATE_LIMITS.get(notif_type, 2.0)
+        shown = [b.shown_at for b in self._active if b.notif_type == notif_type]
+        return max(0.0, limit - (now - max(shown))) if shown else 0.0
+
+    def _drain(self):
+        """Jaga ani rate limit asel tevdhe queued messages kramane dakhva"""
+        if self._drain_ev is not None:
+            self._drain_ev.cancel()
+            self._drain_ev = None
+        now = Clock.get_time()
+        wait = None
+        for item in list(self._queue):
+            if len(self._active) >= self.max_visible:
+                return
+            left = self._rate_wait(item[1], now)
+            if left > 0:
+                wait = left if wait is None else min(wait, left)
+                continue
+            self._queue.remove(item)
+            self._open(*item)
+        if wait is not None:
+            self._drain_ev = Clock.schedule_once(lambda dt: self._drain(), wait)
+
+    def _open(self, message, notif_type, duration, count=1):
+        banner = self._pool.pop() if self._pool else NotificationBanner()
+        banner.set_message(message, notif_type, count)
+        banner.shown_at = Clock.get_time()
+
+        # Position: just below top, aadhichya banners khali
+        Animation.cancel_all(banner)
         banner.y = Window.height + dp(80)
-        banner.x = (Window.width - banner.width * Window.width) / 2
-
         self.parent.add_widget(banner)
         self._active.append(banner)
 
         # Slide in
-        target_y = Window.height - dp(90)
-        anim_in = Animation(y=target_y, duration=0.35, t='out_cubic')
+        anim_in = Animation(y=self._slot_y(len(self._active) - 1), duration=0.35, t='out_cubic')
         anim_in.start(banner)
 
         # Auto dismiss
-        Clock.schedule_once(lambda dt: self._dismiss(banner), duration)
+        self._schedule_dismiss(banner, duration)
+
+    def _slot_y(self, index):
+        return Window.height - dp(90) - index * self.SLOT
+
+    def _schedule_dismiss(self, banner, duration):
+        if banner.dismiss_ev is not None:
+            banner.dismiss_ev.cancel()
+        banner.dismiss_ev = Clock.schedule_once(lambda dt: self._dismiss(banner), duration)
 
     def _dismiss(self, banner):
-        if banner.parent:
+        banner.dismiss_ev = None
+        if banner in self._active:
+            self._active.remove(banner)
+            Animation.cancel_all(banner)
             anim_out = Animation(
                 y=Window.height + dp(80),
                 duration=0.3,
@@ -271,15 +291,26 @@ class NotificationManager:
             )
             anim_out.bind(on_complete=lambda *x: self._remove(banner))
             anim_out.start(banner)
+            self._restack()
+            self._drain()
+
+    def _restack(self):
+        for index, banner in enumerate(self._active):
+            target = self._slot_y(index)
+            if banner.y != target:
+                Animation.cancel_all(banner, 'y')
+                Animation(y=target, duration=0.25, t='out_cubic').start(banner)
 
     def _remove(self, banner):
-        if banner in self._active:
-            self._active.remove(banner)
         if banner.parent:
             banner.parent.remove_widget(banner)
+        if len(self._pool) < self.max_visible:
+            self._pool.append(banner)
 
 
 KV = '''
+#:import get_color_from_hex kivy.utils.get_color_from_hex
+
 <GlowCard>:
     canvas.before:
         Color:
@@ -303,6 +334,169 @@ KV = '''
             pos: self.pos
             size: self.size
             radius: [16]
+
+<HistoryCard>:
+    size_hint_y: None
+    height: dp(130)
+    elevation: 0
+    MDBoxLayout:
+        orientation: 'vertical'
+        padding: [dp(16), dp(10), dp(16), dp(10)]
+        spacing: dp(6)
+        MDBoxLayout:
+            size_hint_y: None
+            height: dp(26)
+            MDLabel:
+                text: root.status_text
+                font_style: "Subtitle1"
+                bold: True
+                theme_text_color: "Custom"
+                text_color: root.status_color
+            MDLabel:
+                text: root.zone_text
+                font_style: "Caption"
+                halign: 'center'
+                shorten: True
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#E8F4FF")
+            MDLabel:
+                text: root.date_text
+                font_style: "Caption"
+                halign: 'right'
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#4A90D9")
+        MDBoxLayout:
+            size_hint_y: None
+            height: dp(22)
+            MDLabel:
+                text: root.time_text
+                font_style: "Caption"
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#B0BEC5")
+            MDLabel:
+                text: root.duration_text
+                font_style: "Caption"
+                halign: 'right'
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#B0BEC5")
+        MDLabel:
+            text: root.reason_text
+            font_style: "Caption"
+            theme_text_color: "Custom"
+            text_color: get_color_from_hex("#4A90D9")
+            size_hint_y: None
+            height: dp(22)
+        MDLabel:
+            text: root.climate_text
+            font_style: "Caption"
+            theme_text_color: "Custom"
+            text_color: get_color_from_hex("#FF7043")
+            size_hint_y: None
+            height: dp(20)
+
+<HistoryList>:
+    viewclass: 'HistoryCard'
+    RecycleBoxLayout:
+        default_size: None, dp(130)
+        default_size_hint: 1, None
+        size_hint_y: None
+        height: self.minimum_height
+        orientation: 'vertical'
+        spacing: dp(10)
+        padding: [0, dp(4), 0, dp(4)]
+
+<ZoneRow>:
+    size_hint_y: None
+    height: dp(72)
+    elevation: 0
+    MDBoxLayout:
+        padding: [dp(16), dp(8), dp(16), dp(8)]
+        spacing: dp(8)
+        MDBoxLayout:
+            orientation: 'vertical'
+            MDLabel:
+                text: root.name_text
+                font_style: "Subtitle2"
+                bold: True
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#E8F4FF")
+            MDLabel:
+                text: root.climate_text
+                font_style: "Caption"
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#FF7043")
+        MDBoxLayout:
+            orientation: 'vertical'
+            MDLabel:
+                text: root.status_text
+                font_style: "Subtitle2"
+                bold: True
+                halign: 'right'
+                theme_text_color: "Custom"
+                text_color: root.status_color
+            MDLabel:
+                text: root.threshold_text
+                font_style: "Caption"
+                halign: 'right'
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#4A90D9")
+
+<ZoneList>:
+    viewclass: 'ZoneRow'
+    RecycleBoxLayout:
+        default_size: None, dp(72)
+        default_size_hint: 1, None
+        size_hint_y: None
+        height: self.minimum_height
+        orientation: 'vertical'
+        spacing: dp(8)
+        padding: [0, dp(4), 0, dp(4)]
+
+<StatsRow>:
+    size_hint_y: None
+    height: dp(64)
+    elevation: 0
+    MDBoxLayout:
+        padding: [dp(16), dp(8), dp(16), dp(8)]
+        spacing: dp(8)
+        MDBoxLayout:
+            orientation: 'vertical'
+            MDLabel:
+                text: root.bucket_text
+                font_style: "Subtitle2"
+                bold: True
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#E8F4FF")
+            MDLabel:
+                text: root.cycles_text
+                font_style: "Caption"
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#4A90D9")
+        MDBoxLayout:
+            orientation: 'vertical'
+            MDLabel:
+                text: root.on_text
+                font_style: "Caption"
+                halign: 'right'
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#69F0AE")
+            MDLabel:
+                text: root.temp_text
+                font_style: "Caption"
+                halign: 'right'
+                theme_text_color: "Custom"
+                text_color: get_color_from_hex("#FF7043")
+
+<StatsList>:
+    viewclass: 'StatsRow'
+    RecycleBoxLayout:
+        default_size: None, dp(64)
+        default_size_hint: 1, None
+        size_hint_y: None
+        height: self.minimum_height
+        orientation: 'vertical'
+        spacing: dp(8)
+        padding: [0, dp(4), 0, dp(4)]
 '''
 Builder.load_string(KV)
 
@@ -314,21 +508,144 @@ class DashCard(MDCard):
     pass
 
 
+class HistoryCard(DashCard):
+    """History row - RecycleView he widgets reuse karto, fakt text badalto"""
+    status_text = StringProperty('')
+    status_color = ColorProperty(get_color_from_hex("#69F0AE"))
+    zone_text = StringProperty('')
+    date_text = StringProperty('')
+    time_text = StringProperty('')
+    duration_text = StringProperty('')
+    reason_text = StringProperty('')
+    climate_text = StringProperty('')
+
+
+class HistoryList(RecycleView):
+    """Fakt visible cards build karto, baki rows plain dicts mhanun rahtat"""
+    pass
+
+
+class StatsRow(DashCard):
+    """Ek rollup bucket (hour/day/week) cha summary"""
+    bucket_text = StringProperty('')
+    cycles_text = StringProperty('')
+    on_text = StringProperty('')
+    temp_text = StringProperty('')
+
+
+class ZoneRow(DashCard):
+    """Zones list madhla ek zone - tap kela ki dashboard var to zone"""
+    zone_id = NumericProperty(0)
+    name_text = StringProperty('')
+    climate_text = StringProperty('')
+    status_text = StringProperty('')
+    status_color = ColorProperty(get_color_from_hex("#546E7A"))
+    threshold_text = StringProperty('')
+
+    def on_release(self):
+        MDApp.get_running_app().root.get_screen('zones').open_zone(self.zone_id)
+
+
+class ZoneList(RecycleView):
+    pass
+
+
+class StatsList(RecycleView):
+    pass
+
+
 # ==========================================
 #  ANIMATED LOGO
 # ==========================================
+LOGO_STEPS = 200   # 1.8 deg / frame -> 200 frames madhe ek pheri
+# Orbit sathi cos/sin table - frame la trig calls nahit. Module level la:
+# class body madhle names comprehension madhe disat nahit.
+LOGO_ORBIT = [(math.cos(2 * math.pi * i / LOGO_STEPS), math.sin(2 * math.pi * i / LOGO_STEPS))
+              for i in range(LOGO_STEPS)]
+
+
 class AnimatedLogo(Widget):
+    """Retained mode: instructions ekdach banatat, frame la fakt orbit dots che
+    pos ani glow che alpha badaltat. start() / stop() - screen disat nasel tar band."""
+
+    FPS = 30
+    STEPS = LOGO_STEPS
+    _ORBIT = LOGO_ORBIT
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.size_hint = (None, None)
         self.size = (dp(100), dp(100))
-        self._angle = 0
+        self._step = 0
         self._pulse = 0.0
         self._pulse_dir = 1
-        Clock.schedule_interval(self._update, 1 / 30)
+        self._ev = None
+        with self.canvas:
+            self._glow_outer = Color(0.12, 0.55, 0.95, 0.08)
+            self._halo_outer = Ellipse()
+            self._glow_inner = Color(0.12, 0.55, 0.95, 0.13)
+            self._halo_inner = Ellipse()
+            Color(0.05, 0.10, 0.22, 1)
+            self._disc = Ellipse()
+            Color(0.12, 0.55, 0.95, 1)
+            self._ring = Line(width=dp(2.5))
+            Color(0.12, 0.55, 0.95, 0.25)
+            self._ring_inner = Line(width=dp(1))
+            Color(0.2, 0.65, 1.0, 1)
+            self._drop = Ellipse(size=(dp(20), dp(22)))
+            Color(0.4, 0.78, 1.0, 0.9)
+            self._drop_left = Ellipse(size=(dp(9), dp(9)))
+            self._drop_right = Ellipse(size=(dp(8), dp(8)))
+            Color(0.5, 0.85, 1.0, 0.8)
+            self._drop_top = Ellipse(size=(dp(11), dp(11)))
+            Color(0.5, 0.9, 1.0, 1)
+            self._dot = Ellipse(size=(dp(10), dp(10)))
+            Color(0.12, 0.55, 0.95, 0.6)
+            self._dot2 = Ellipse(size=(dp(6), dp(6)))
+        self.bind(pos=self._layout, size=self._layout)
+        self._layout()
+
+    def start(self):
+        if self._ev is None:
+            self._ev = Clock.schedule_interval(self._update, 1 / self.FPS)
+
+    def stop(self):
+        if self._ev is not None:
+            self._ev.cancel()
+            self._ev = None
+
+    def on_parent(self, instance, parent):
+        if parent is None:
+            self.stop()
+
+    def _layout(self, *args):
+        """Static geometry - fakt pos / size badlalyavar"""
+        cx, cy = self.center
+        r = dp(45)
+        self._halo_outer.pos = (cx - r - dp(14), cy - r - dp(14))
+        self._halo_outer.size = (r * 2 + dp(28), r * 2 + dp(28))
+        self._halo_inner.pos = (cx - r - dp(7), cy - r - dp(7))
+        self._halo_inner.size = (r * 2 + dp(14), r * 2 + dp(14))
+        self._disc.pos = (cx - r, cy - r)
+        self._disc.size = (r * 2, r * 2)
+        self._ring.circle = (cx, cy, r)
+        self._ring_inner.circle = (cx, cy, r - dp(7))
+        self._drop.pos = (cx - dp(10), cy - dp(6))
+        self._drop_left.pos = (cx - dp(20), cy + dp(12))
+        self._drop_right.pos = (cx + dp(11), cy + dp(13))
+        self._drop_top.pos = (cx - dp(6), cy + dp(20))
+        self._move_dots()
+
+    def _move_dots(self):
+        cx, cy = self.center
+        r = dp(45)
+        cos_a, sin_a = self._ORBIT[self._step]
+        self._dot.pos = (cx + r * cos_a - dp(5), cy + r * sin_a - dp(5))
+        # Dusra dot samor (180 deg)
+        self._dot2.pos = (cx - r * cos_a - dp(3), cy - r * sin_a - dp(3))
 
     def _update(self, dt):
-        self._angle = (self._angle + 1.8) % 360
+        self._step = (self._step + 1) % self.STEPS
         self._pulse += 0.04 * self._pulse_dir
         if self._pulse >= 1.0:
             self._pulse = 1.0
@@ -336,44 +653,32 @@ class AnimatedLogo(Widget):
         elif self._pulse <= 0.0:
             self._pulse = 0.0
             self._pulse_dir = 1
-        self._draw()
+        self._glow_outer.a = 0.08 + self._pulse * 0.07
+        self._glow_inner.a = 0.13 + self._pulse * 0.05
+        self._move_dots()
 
-    def _draw(self, *args):
-        pulse = getattr(self, '_pulse', 0.0)
-        self.canvas.clear()
-        cx = self.center_x
-        cy = self.center_y
-        r = dp(45)
+
+class Sparkline(Widget):
+    """RingBuffer chi chhoti line graph - ekach Line instruction, fakt points badaltat"""
+    line_color = ColorProperty(get_color_from_hex("#FF7043"))
+
+    def __init__(self, ring, **kwargs):
+        super().__init__(**kwargs)
+        self.ring = ring
+        self._points = []
         with self.canvas:
-            Color(0.12, 0.55, 0.95, 0.08 + pulse * 0.07)
-            Ellipse(pos=(cx-r-dp(14), cy-r-dp(14)), size=(r*2+dp(28), r*2+dp(28)))
-            Color(0.12, 0.55, 0.95, 0.13 + pulse * 0.05)
-            Ellipse(pos=(cx-r-dp(7), cy-r-dp(7)), size=(r*2+dp(14), r*2+dp(14)))
-            Color(0.05, 0.10, 0.22, 1)
-            Ellipse(pos=(cx-r, cy-r), size=(r*2, r*2))
-            Color(0.12, 0.55, 0.95, 1)
-            Line(circle=(cx, cy, r), width=dp(2.5))
-            Color(0.12, 0.55, 0.95, 0.25)
-            Line(circle=(cx, cy, r-dp(7)), width=dp(1))
-            Color(0.2, 0.65, 1.0, 1)
-            Ellipse(pos=(cx-dp(10), cy-dp(6)), size=(dp(20), dp(22)))
-            Color(0.4, 0.78, 1.0, 0.9)
-            Ellipse(pos=(cx-dp(20), cy+dp(12)), size=(dp(9), dp(9)))
-            Ellipse(pos=(cx+dp(11), cy+dp(13)), size=(dp(8), dp(8)))
-            Color(0.5, 0.85, 1.0, 0.8)
-            Ellipse(pos=(cx-dp(6), cy+dp(20)), size=(dp(11), dp(11)))
-            angle = getattr(self, '_angle', 0)
-            dot_x = cx + r * math.cos(math.radians(angle))
-            dot_y = cy + r * math.sin(math.radians(angle))
-            Color(0.5, 0.9, 1.0, 1)
-            Ellipse(pos=(dot_x-dp(5), dot_y-dp(5)), size=(dp(10), dp(10)))
-            dot2_x = cx + r * math.cos(math.radians(angle + 180))
-            dot2_y = cy + r * math.sin(math.radians(angle + 180))
-            Color(0.12, 0.55, 0.95, 0.6)
-            Ellipse(pos=(dot2_x-dp(3), dot2_y-dp(3)), size=(dp(6), dp(6)))
+            self._color = Color(rgba=self.line_color)
+            self._line = Line(points=[], width=dp(1.2))
+        self.bind(pos=self.refresh, size=self.refresh)
 
-    def on_size(self, *args): self._draw()
-    def on_pos(self, *args): self._draw()
+    def on_line_color(self, instance, value):
+        if hasattr(self, '_color'):
+            self._color.rgba = value
+
+    def refresh(self, *args):
+        self._line.points = sparkline_points(
+            self.ring, self.x, self.y, self.width, self.height, self._points
+        )
 
 
 # ==========================================
@@ -402,7 +707,8 @@ class LoginScreen(MDScreen):
         # Logo
         logo_row = MDBoxLayout(size_hint_y=None, height=dp(100))
         logo_row.add_widget(Widget())
-        logo_row.add_widget(AnimatedLogo())
+        self.logo = AnimatedLogo()
+        logo_row.add_widget(self.logo)
         logo_row.add_widget(Widget())
         self._layout.add_widget(logo_row)
 
@@ -508,6 +814,13 @@ class LoginScreen(MDScreen):
             lambda dt: Animation(opacity=1, duration=0.7, t='out_cubic').start(self._card), 0.2
         )
 
+    def on_enter(self):
+        self.logo.start()
+
+    def on_leave(self):
+        # Login sodlyavar logo animation band - frame la kahi kaam nahi
+        self.logo.stop()
+
     def _toggle_mode(self, instance):
         """Login <-> Register switch"""
         if self._mode == 'login':
@@ -570,7 +883,12 @@ class LoginScreen(MDScreen):
         self._save_register(name, email, password)
 
     def _save_register(self, name, email, password):
-        success = db.add_user(name, email, password, "user")
+        db_worker.submit(
+            db.add_user, name, email, password, "user",
+            callback=lambda success: self._on_registered(success, name, email, password),
+        )
+
+    def _on_registered(self, success, name, email, password):
         if success:
             self._show_msg(f"Account created! Welcome {name}!", error=False)
             self.action_btn.text = "REGISTER"
@@ -583,7 +901,9 @@ class LoginScreen(MDScreen):
             self.action_btn.disabled = False
 
     def _verify(self, email, password):
-        result = db.check_login(email, password)
+        db_worker.submit(db.check_login, email, password, callback=self._on_verified)
+
+    def _on_verified(self, result):
         if result:
             name, role = result
             self._show_msg(f"Welcome {name}!", error=False)
@@ -632,18 +952,71 @@ class DashboardScreen(MDScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.md_bg_color = get_color_from_hex("#0A1628")
-        self._motor_on = False
-        self._temp = 32.0
-        self._humidity = 65.0
-        self._motor_start_time = None
-        self._last_alert_temp = 0
         self._notif_manager = None
         self._root_float = None
         self._current_user = "admin"
         self._current_role = "admin"
-        self._manual_mode = False  # Manual ON asel tar True
+        self._zone = None
+        capacity = SPARKLINE_MINUTES * 60 // SPARKLINE_STEP_S
+        self._temp_ring = GridRing(capacity, SPARKLINE_STEP_S)
+        self._hum_ring = GridRing(capacity, SPARKLINE_STEP_S)
+        self._spark_pending = None   # Seed query chalu astana aalele (ts, temp, hum)
         self._build_ui()
-        Clock.schedule_interval(self._update_sensors, 5)
+        # Buffer flush zala ki count refresh kara
+        event_buffer.on_flush = lambda n: self._refresh_count()
+        self.select_zone(DEFAULT_ZONE_ID)
+
+    @property
+    def controller(self):
+        return self._zone.controller
+
+    def select_zone(self, zone_id):
+        """Dashboard var dakhavaycha zone - fakt tyacha controller subscribe"""
+        zone = scheduler.get(zone_id) or next(iter(scheduler), None)
+        if zone is None or zone is self._zone:
+            return
+        if self._zone is not None:
+            self._zone.controller.unsubscribe(self._on_controller_event)
+        self._zone = zone
+        zone.controller.subscribe(self._on_controller_event)
+        self.motor_title.text = f"Motor Control - {zone.name}"
+        state = zone.controller.state()
+        if state['temperature'] is not None:
+            self.temp_label.text = f"{state['temperature']} C"
+            self.hum_label.text = f"{state['humidity']} %"
+        self._update_motor_ui()
+        self._load_sparklines(zone.zone_id)
+
+    def _load_sparklines(self, zone_id):
+        """Navin zone - tyache shevatche minutes telemetry madhun"""
+        self._temp_ring.clear()
+        self._hum_ring.clear()
+        self._spark_pending = []
+        self._refresh_sparklines()
+        # Worker FIFO: flush zalele blocks read la distat
+        telemetry.flush()
+        now = int(datetime.now().timestamp())
+        db_worker.submit(
+            read_telemetry, db, zone_id, now - SPARKLINE_MINUTES * 60, now + 1,
+            callback=lambda result: self._seed_sparklines(zone_id, result),
+        )
+
+    def _seed_sparklines(self, zone_id, result):
+        if self._zone is None or self._zone.zone_id != zone_id:
+            return
+        stamps, temps, hums = result
+        # Query chalu astana aalele readings history nantar
+        pending, self._spark_pending = self._spark_pending or [], None
+        self._temp_ring.clear()
+        self._hum_ring.clear()
+        for ts, temp, hum in list(zip(stamps, temps, hums)) + pending:
+            self._temp_ring.add(ts, temp)
+            self._hum_ring.add(ts, hum)
+        self._refresh_sparklines()
+
+    def _refresh_sparklines(self):
+        self.temp_spark.refresh()
+        self.hum_spark.refresh()
 
     def set_user(self, username, role):
         """Login nantarcha user set kara"""
@@ -700,7 +1073,7 @@ class DashboardScreen(MDScreen):
         welcome_card.add_widget(wl)
 
         # Sensor row
-        sensor_row = MDBoxLayout(size_hint_y=None, height=dp(100), spacing=dp(12))
+        sensor_row = MDBoxLayout(size_hint_y=None, height=dp(130), spacing=dp(12))
 
         temp_card = DashCard(elevation=0)
         tl = MDBoxLayout(orientation='vertical', padding=[dp(12), dp(8), dp(12), dp(8)], spacing=dp(4))
@@ -713,6 +1086,11 @@ class DashboardScreen(MDScreen):
             theme_text_color="Custom", text_color=get_color_from_hex("#FF7043"),
         )
         tl.add_widget(self.temp_label)
+        self.temp_spark = Sparkline(
+            self._temp_ring, line_color=get_color_from_hex("#FF7043"),
+            size_hint_y=None, height=dp(30),
+        )
+        tl.add_widget(self.temp_spark)
         temp_card.add_widget(tl)
 
         hum_card = DashCard(elevation=0)
@@ -726,6 +1104,11 @@ class DashboardScreen(MDScreen):
             theme_text_color="Custom", text_color=get_color_from_hex("#29B6F6"),
         )
         hl.add_widget(self.hum_label)
+        self.hum_spark = Sparkline(
+            self._hum_ring, line_color=get_color_from_hex("#29B6F6"),
+            size_hint_y=None, height=dp(30),
+        )
+        hl.add_widget(self.hum_spark)
         hum_card.add_widget(hl)
 
         sensor_row.add_widget(temp_card)
@@ -738,11 +1121,12 @@ class DashboardScreen(MDScreen):
             padding=[dp(20), dp(18), dp(20), dp(18)],
             spacing=dp(14),
         )
-        ml.add_widget(MDLabel(
+        self.motor_title = MDLabel(
             text="Motor Control", font_style="H6", bold=True, halign='center',
             theme_text_color="Custom", text_color=get_color_from_hex("#E8F4FF"),
             size_hint_y=None, height=dp(32),
-        ))
+        )
+        ml.add_widget(self.motor_title)
         self.motor_status_label = MDLabel(
             text="MOTOR OFF", font_style="H5", bold=True, halign='center',
             theme_text_color="Custom", text_color=get_color_from_hex("#546E7A"),
@@ -764,131 +1148,100 @@ class DashboardScreen(MDScreen):
         motor_card.add_widget(ml)
 
         self.db_count_label = MDLabel(
-            text=f"Total Records: {db.get_count()}",
+            text="Total Records: -",
             halign='center', font_style="Caption",
             theme_text_color="Custom", text_color=get_color_from_hex("#3D6A9E"),
             size_hint_y=None, height=dp(20),
         )
 
-        history_btn = MDRaisedButton(
+        nav_row = MDBoxLayout(size_hint_y=None, height=dp(50), spacing=dp(12))
+        nav_row.add_widget(MDRaisedButton(
             text="VIEW HISTORY", size_hint=(1, None), height=dp(50),
             md_bg_color=get_color_from_hex("#0D47A1"), elevation=4,
             on_release=self._go_history,
-        )
+        ))
+        nav_row.add_widget(MDRaisedButton(
+            text="STATS", size_hint=(1, None), height=dp(50),
+            md_bg_color=get_color_from_hex("#0D47A1"), elevation=4,
+            on_release=lambda x: setattr(self.manager, 'current', 'stats'),
+        ))
+        nav_row.add_widget(MDRaisedButton(
+            text="ZONES", size_hint=(1, None), height=dp(50),
+            md_bg_color=get_color_from_hex("#0D47A1"), elevation=4,
+            on_release=lambda x: setattr(self.manager, 'current', 'zones'),
+        ))
 
         main.add_widget(topbar)
         main.add_widget(welcome_card)
         main.add_widget(sensor_row)
         main.add_widget(motor_card)
         main.add_widget(self.db_count_label)
-        main.add_widget(history_btn)
+        main.add_widget(nav_row)
         main.add_widget(Widget())
 
         self._root_float.add_widget(main)
         self.add_widget(self._root_float)
 
-    def _update_sensors(self, dt):
-        import random
-        self._temp = round(28 + random.uniform(0, 16), 1)
-        self._humidity = round(55 + random.uniform(0, 20), 1)
-        self.temp_label.text = f"{self._temp} C"
-        self.hum_label.text = f"{self._humidity} %"
-
-        # ✅ Manual ON asel tar temperature kahi karnar nahi
-        if self._manual_mode:
-            return
-
-        if self._temp >= 40.0:
-            # Auto: Temperature 40C+ - Motor AUTO ON
-            if self._last_alert_temp != 40:
-                self._last_alert_temp = 40
-                if not self._motor_on:
-                    self._auto_start()
+    def _on_controller_event(self, event, data):
+        """FoggerController state badalla - fakt labels / notifications update"""
+        if event == 'reading':
+            self.temp_label.text = f"{data['temperature']} C"
+            self.hum_label.text = f"{data['humidity']} %"
+            now = time.time()
+            self._temp_ring.add(now, data['temperature'])
+            self._hum_ring.add(now, data['humidity'])
+            if self._spark_pending is not None:
+                self._spark_pending.append((now, data['temperature'], data['humidity']))
+            self._refresh_sparklines()
+        elif event == 'alert':
+            motor = {
+                'started': "Motor Chalu Zali!",
+                'running': "Motor aadhich chalu ahe",
+                'deferred': f"Motor {data['wait_s']}s nantar chalu hoil",
+                'blocked': f"Blocked ({data['block']}) - Motor band rahil",
+            }[data['motor']]
+            self._notif_manager.show(
+                f"Temperature {data['temperature']} C Hot - {motor}",
+                notif_type='warning',
+                duration=5
+            )
+        elif event == 'motor':
+            self._update_motor_ui()
+            if data['source'] == 'manual' and data['on']:
+                self._notif_manager.show(
+                    "Motor Manual Chalu Zali!", notif_type='success', duration=3
+                )
+            elif data['source'] == 'manual':
+                self._notif_manager.show(
+                    f"Motor Manual Band Zali! | Duration: {format_duration(data['duration_s'])}",
+                    notif_type='info', duration=3
+                )
+            elif data['source'] == 'program':
+                self._notif_manager.show(data['reason'], notif_type='info', duration=3)
+            elif data['on'] and data['reason'].startswith("Predictive"):
+                self._notif_manager.show(
+                    f"Temperature vadhat ahe ({data['temperature']} C) - Pre-cooling Chalu!",
+                    notif_type='info', duration=4
+                )
+            elif not data['on']:
                 self._notif_manager.show(
-                    f"Temperature {self._temp} C Hot - Motor Chalu Zali!",
-                    notif_type='warning',
+                    f"Temperature Normal {data['temperature']} C - Motor Band Zali!",
+                    notif_type='success',
                     duration=5
                 )
-        else:
-            # Auto: Temperature 40C khali - Motor AUTO OFF
-            if self._last_alert_temp == 40:
-                self._last_alert_temp = 0
-                if self._motor_on:
-                    self._auto_stop()
-                    self._notif_manager.show(
-                        f"Temperature Normal {self._temp} C - Motor Band Zali!",
-                        notif_type='success',
-                        duration=5
-                    )
-
-    def _auto_start(self):
-        self._manual_mode = False  # Auto mode
-        self._motor_on = True
-        self._motor_start_time = datetime.now()
-        self._update_motor_ui()
-        db.save_event(
-            status="ON", temperature=self._temp, humidity=self._humidity,
-            duration="-", reason=f"Auto ON - Temperature {self._temp} C Hot"
-        )
-        self._refresh_count()
-
-    def _auto_stop(self):
-        duration_str = "-"
-        if self._motor_start_time:
-            diff = datetime.now() - self._motor_start_time
-            minutes = int(diff.total_seconds() // 60)
-            seconds = int(diff.total_seconds() % 60)
-            duration_str = f"{minutes}m {seconds}s"
-        self._motor_on = False
-        self._update_motor_ui()
-        self._motor_start_time = None
-        db.save_event(
-            status="OFF", temperature=self._temp, humidity=self._humidity,
-            duration=duration_str, reason=f"Auto OFF - Temperature {self._temp} C Normal"
-        )
-        self._refresh_count()
 
     def _toggle_motor(self, instance):
-        self._motor_on = not self._motor_on
-        if self._motor_on:
-            # ✅ Manual ON - mode set kara, temperature touch nahi
-            self._manual_mode = True
-            self._motor_start_time = datetime.now()
-            self._update_motor_ui()
-            db.save_event(
-                status="ON", temperature=self._temp, humidity=self._humidity,
-                duration="-", reason="Manual Start"
-            )
-            self._notif_manager.show(
-                "Motor Manual Chalu Zali!", notif_type='success', duration=3
-            )
-        else:
-            # ✅ Manual OFF - mode reset kara
-            self._manual_mode = False
-            self._last_alert_temp = 0  # Alert reset
-            duration_str = "-"
-            if self._motor_start_time:
-                diff = datetime.now() - self._motor_start_time
-                minutes = int(diff.total_seconds() // 60)
-                seconds = int(diff.total_seconds() % 60)
-                duration_str = f"{minutes}m {seconds}s"
-            self._update_motor_ui()
-            db.save_event(
-                status="OFF", temperature=self._temp, humidity=self._humidity,
-                duration=duration_str, reason="Manual Stop"
-            )
-            self._notif_manager.show(
-                f"Motor Manual Band Zali! | Duration: {duration_str}",
-                notif_type='info', duration=3
-            )
-            self._motor_start_time = None
-        self._refresh_count()
+        self.controller.manual_toggle()
 
     def _refresh_count(self):
-        self.db_count_label.text = f"Total Records: {db.get_count()}"
+        # Worker queue FIFO ahe, mhanun aadhi flush zalele events count madhe yetat
+        db_worker.submit(db.get_count, callback=self._show_count)
+
+    def _show_count(self, count):
+        self.db_count_label.text = f"Total Records: {count}"
 
     def _update_motor_ui(self):
-        if self._motor_on:
+        if self.controller.motor_on:
             self.motor_status_label.text = "MOTOR ON"
             self.motor_status_label.text_color = get_color_from_hex("#69F0AE")
             self.motor_reason.text = "Fogging in progress..."
@@ -904,7 +1257,7 @@ class DashboardScreen(MDScreen):
             self.motor_btn.md_bg_color = get_color_from_hex("#1565C0")
 
     def _go_history(self, instance):
-        self.manager.get_screen('history').load_history()
+        # HistoryScreen.on_enter fakt navin rows aanto
         self.manager.current = 'history'
 
     def _logout(self, instance):
@@ -918,14 +1271,38 @@ class DashboardScreen(MDScreen):
 #  HISTORY SCREEN
 # ==========================================
 class HistoryScreen(MDScreen):
+    PAGE_SIZE = 50
+    # Yapeksha jast navin rows asle tar incremental peksha reload swast
+    MAX_NEW_ROWS = 500
+    # Filter group -> (button text, value); None = sagle
+    FILTERS = {
+        'status': (("All", None), ("ON", "ON"), ("OFF", "OFF")),
+        'kind': (("All", None), ("Auto", 'auto'), ("Predict", 'predictive'),
+                 ("Manual", 'manual'), ("Program", 'program')),
+        'days': (("All", None), ("24h", 1), ("7d", 7), ("30d", 30)),
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.md_bg_color = get_color_from_hex("#0A1628")
+        self._oldest_id = None
+        self._newest_id = None      # None = ajun load nahi
+        self._generation = None
+        self._count = 0
+        self._filters = {group: None for group in self.FILTERS}
+        self._filters['zone'] = None
+        self._filter_btns = {}
+        self._zone_menu = None
+        self._search = {}
+        self._has_more = True
+        self._loading = False
+        self._load_token = 0
+        self._export_job = None
+        self._export_pending = False
+        self._export_dialog = None
         self._build_ui()
 
     def _build_ui(self):
-        from kivymd.uix.scrollview import MDScrollView
-
         self.root_layout = MDBoxLayout(
             orientation='vertical',
             padding=[dp(16), dp(12), dp(16), dp(12)],
@@ -942,6 +1319,11 @@ class HistoryScreen(MDScreen):
             text="History", font_style="H6", bold=True,
             theme_text_color="Custom", text_color=get_color_from_hex("#E8F4FF"),
         ))
+        topbar.add_widget(MDRaisedButton(
+            text="Export", size_hint=(None, None), size=(dp(80), dp(38)),
+            md_bg_color=get_color_from_hex("#1B5E20"), elevation=4,
+            on_release=self._ask_export,
+        ))
         topbar.add_widget(MDRaisedButton(
             text="Clear All", size_hint=(None, None), size=(dp(90), dp(38)),
             md_bg_color=get_color_from_hex("#B71C1C"), elevation=4,
@@ -949,100 +1331,615 @@ class HistoryScreen(MDScreen):
         ))
 
         self.count_label = MDLabel(
-            text=f"Total Records: {db.get_count()}",
+            text="Total Records: -",
             halign='center', font_style="Caption",
             theme_text_color="Custom", text_color=get_color_from_hex("#4A90D9"),
             size_hint_y=None, height=dp(24),
         )
 
-        self.scroll = MDScrollView()
-        self.scroll_layout = MDBoxLayout(
-            orientation='vertical', spacing=dp(10),
-            size_hint_y=None, padding=[0, dp(4), 0, dp(4)],
+        # Export progress - export chalu nastana lapvun theva
+        self.export_label = MDLabel(
+            text="", halign='center', font_style="Caption",
+            theme_text_color="Custom", text_color=get_color_from_hex("#69F0AE"),
+            size_hint_y=None, height=dp(0), opacity=0,
         )
-        self.scroll_layout.bind(minimum_height=self.scroll_layout.setter('height'))
-        self.scroll.add_widget(self.scroll_layout)
+
+        # Empty message - rows nastil tevha dakhva
+        self.empty_label = MDLabel(
+            text="No history yet!\nStart using the motor to see records here.",
+            halign='center', font_style="Body1",
+            theme_text_color="Custom", text_color=get_color_from_hex("#3D6A9E"),
+            size_hint_y=None, height=dp(0), opacity=0,
+        )
+
+        self.history_list = HistoryList()
+        self.history_list.bind(scroll_y=self._on_scroll)
+
+        # Search + filters - typing thambla ki 0.4s nantar ekach query
+        self._search_trigger = Clock.create_trigger(lambda dt: self.load_history(), 0.4)
+        search_row = MDBoxLayout(size_hint_y=None, height=dp(50), spacing=dp(8))
+        self.search_field = self._filter_field("Search reason", 1)
+        search_row.add_widget(self.search_field)
+        # Zones dynamic ahet (100+ asu shaktat) - buttons chya row peksha menu
+        self.zone_btn = MDRaisedButton(
+            text="All zones", size_hint=(None, None), size=(dp(110), dp(38)),
+            pos_hint={'center_y': 0.5},
+            md_bg_color=get_color_from_hex("#37474F"), elevation=4,
+            on_release=self._open_zone_menu,
+        )
+        search_row.add_widget(self.zone_btn)
+        search_row.add_widget(MDRaisedButton(
+            text="Filters", size_hint=(None, None), size=(dp(80), dp(38)),
+            pos_hint={'center_y': 0.5},
+            md_bg_color=get_color_from_hex("#37474F"), elevation=4,
+            on_release=self._toggle_filters,
+        ))
+
+        self.filter_panel = MDBoxLayout(
+            orientation='vertical', spacing=dp(6),
+            size_hint_y=None, height=dp(0), opacity=0, disabled=True,
+        )
+        for group, options in self.FILTERS.items():
+            row = MDBoxLayout(size_hint_y=None, height=dp(34), spacing=dp(6))
+            for label, value in options:
+                btn = MDRaisedButton(
+                    text=label, size_hint=(1, None), height=dp(32),
+                    md_bg_color=get_color_from_hex("#37474F"),
+                    on_release=lambda x, g=group, v=value: self._select_filter(g, v),
+                )
+                self._filter_btns[group, value] = btn
+                row.add_widget(btn)
+            self.filter_panel.add_widget(row)
+        temp_row = MDBoxLayout(size_hint_y=None, height=dp(50), spacing=dp(8))
+        self.min_temp_field = self._filter_field("Min temp C", 0.5, input_filter='float')
+        self.max_temp_field = self._filter_field("Max temp C", 0.5, input_filter='float')
+        temp_row.add_widget(self.min_temp_field)
+        temp_row.add_widget(self.max_temp_field)
+        self.filter_panel.add_widget(temp_row)
+        self._paint_filters()
 
         self.root_layout.add_widget(topbar)
+        self.root_layout.add_widget(search_row)
+        self.root_layout.add_widget(self.filter_panel)
         self.root_layout.add_widget(self.count_label)
-        self.root_layout.add_widget(self.scroll)
+        self.root_layout.add_widget(self.export_label)
+        self.root_layout.add_widget(self.empty_label)
+        self.root_layout.add_widget(self.history_list)
         self.add_widget(self.root_layout)
+
+    def _filter_field(self, hint, width, **kwargs):
+        field = MDTextField(
+            hint_text=hint, size_hint=(width, None), height=dp(50), mode="rectangle",
+            line_color_normal=get_color_from_hex("#1E3A5F"),
+            line_color_focus=get_color_from_hex("#1E88E5"),
+            hint_text_color_normal=get_color_from_hex("#4A6FA5"),
+            text_color_normal=get_color_from_hex("#E8F4FF"),
+            fill_color_normal=get_color_from_hex("#0D1F3C"),
+            **kwargs,
+        )
+        field.bind(text=lambda *a: self._search_trigger())
+        return field
+
+    def _toggle_filters(self, instance):
+        show = self.filter_panel.opacity == 0
+        self.filter_panel.height = dp(6 * 3 + 34 * 3 + 50) if show else dp(0)
+        self.filter_panel.opacity = 1 if show else 0
+        self.filter_panel.disabled = not show
+
+    def _select_filter(self, group, value):
+        self._filters[group] = value
+        self._paint_filters()
         self.load_history()
 
+    def _open_zone_menu(self, instance):
+        from kivymd.uix.menu import MDDropdownMenu
+
+        choices = [(None, "All zones")] + [(zone.zone_id, zone.name) for zone in scheduler]
+        self._zone_menu = MDDropdownMenu(
+            caller=self.zone_btn, max_height=dp(320),
+            items=[
+                {'viewclass': 'OneLineListItem', 'text': name,
+                 'on_release': lambda zone_id=zone_id: self._select_zone(zone_id)}
+                for zone_id, name in choices
+            ],
+        )
+        self._zone_menu.open()
+
+    def _select_zone(self, zone_id):
+        if self._zone_menu is not None:
+            self._zone_menu.dismiss()
+            self._zone_menu = None
+        self.zone_btn.text = "All zones" if zone_id is None else self._zone_name(zone_id)
+        self.zone_btn.md_bg_color = get_color_from_hex("#37474F" if zone_id is None else "#1565C0")
+        self._select_filter('zone', zone_id)
+
+    def _zone_name(self, zone_id):
+        zone = scheduler.get(zone_id)
+        return zone.name if zone is not None else f"Zone {zone_id}"
+
+    def _paint_filters(self):
+        for (group, value), btn in self._filter_btns.items():
+            selected = self._filters[group] == value
+            btn.md_bg_color = get_color_from_hex("#1565C0" if selected else "#37474F")
+
+    def _search_args(self):
+        """Chalu filters -> DatabaseManager.search_events kwargs (kahi nasel tar {})"""
+        args = {}
+        text = self.search_field.text.strip()
+        if text:
+            args['text'] = text
+        if self._filters['status']:
+            args['status'] = self._filters['status']
+        if self._filters['kind']:
+            args['kind'] = self._filters['kind']
+        if self._filters['days']:
+            args['since_ts'] = int(datetime.now().timestamp()) - self._filters['days'] * 86400
+        if self._filters['zone'] is not None:
+            args['zone_id'] = self._filters['zone']
+        for key, field in (('min_temp', self.min_temp_field), ('max_temp', self.max_temp_field)):
+            try:
+                args[key] = float(field.text)
+            except ValueError:
+                pass
+        return args
+
     def load_history(self):
-        self.scroll_layout.clear_widgets()
-        rows = db.get_all_events()
-        self.count_label.text = f"Total Records: {len(rows)}"
+        """Fakt pahila page load kara, baki scroll kelyavar"""
+        # Buffer madhle pending events aadhi lihun gheu, mag query
+        event_buffer.flush()
+        # Filters ekda capture - sagle pages sathi tech since_ts
+        self._search = self._search_args()
+        # Token badalla ki juni pending pages ignore hotat
+        self._load_token += 1
+        self._oldest_id = None
+        self._newest_id = 0
+        self._generation = db.history_generation
+        self._has_more = True
+        self._loading = False
+        self.history_list.data = []
+        self.history_list.scroll_y = 1
+        if not self._search:
+            db_worker.submit(db.get_count, callback=self._show_count)
+        self._load_next_page()
+
+    def refresh(self):
+        """Shevatchya view nantar aalele events varti joda - O(navin rows).
+
+        Delete / retention purge nantar (history_generation badalla) purn reload.
+        """
+        if (self._newest_id is None or self._generation != db.history_generation
+                or self._search):
+            # Filtered view - pahila page parat (indexed query, O(page))
+            self.load_history()
+            return
+        if self._loading and self._oldest_id is None:
+            # Pahila page ajun yetoy - toch navin rows aanel
+            return
+        event_buffer.flush()
+        token = self._load_token
+        db_worker.submit(
+            db.get_events_since, self._newest_id, self.MAX_NEW_ROWS,
+            callback=lambda rows: self._on_new_rows(rows, token),
+        )
 
+    def _on_new_rows(self, rows, token):
+        if token != self._load_token:
+            return
+        if len(rows) >= self.MAX_NEW_ROWS or self._generation != db.history_generation:
+            self.load_history()
+            return
         if not rows:
-            self.scroll_layout.add_widget(MDLabel(
-                text="No history yet!\nStart using the motor to see records here.",
-                halign='center', font_style="Body1",
-                theme_text_color="Custom", text_color=get_color_from_hex("#3D6A9E"),
-                size_hint_y=None, height=dp(100),
-            ))
             return
+        self._newest_id = rows[0][0]
+        self.history_list.data[:0] = [self._row_to_data(row) for row in rows]
+        self._show_count(self._count + len(rows))
+        self._set_empty(False)
+
+    def _show_count(self, count):
+        self._count = count
+        self.count_label.text = f"Total Records: {count}"
+
+    def _load_next_page(self):
+        if self._loading or not self._has_more:
+            return
+        self._loading = True
+        token = self._load_token
+        if self._search:
+            db_worker.submit(
+                db.search_events, self._oldest_id, self.PAGE_SIZE,
+                callback=lambda rows: self._on_page(rows, token), **self._search,
+            )
+            return
+        db_worker.submit(
+            db.get_events_page, self._oldest_id, self.PAGE_SIZE,
+            callback=lambda rows: self._on_page(rows, token),
+        )
+
+    def _on_page(self, rows, token):
+        if token != self._load_token:
+            return
+        self._loading = False
+        self._append_rows(rows)
+        if self._search:
+            shown = len(self.history_list.data)
+            self.count_label.text = f"Matches: {shown}{'+' if self._has_more else ''}"
+        self._set_empty(not self.history_list.data)
+
+    def _append_rows(self, rows):
+        if len(rows) < self.PAGE_SIZE:
+            self._has_more = False
+        if rows:
+            if self._oldest_id is None:
+                self._newest_id = rows[0][0]
+            self._oldest_id = rows[-1][0]
+            self.history_list.data.extend([self._row_to_data(row) for row in rows])
+
+    def _on_scroll(self, rv, scroll_y):
+        # Bottom pasun ek screen-height peksha kami rahila ki next page aana
+        content = rv.children[0] if rv.children else None
+        if content is None or content.height <= rv.height:
+            return
+        remaining = scroll_y * (content.height - rv.height)
+        if remaining < rv.height:
+            self._load_next_page()
+
+    def _row_to_data(self, row):
+        """DB row -> HistoryCard properties (widget nahi, fakt dict)"""
+        row_id, zone_id, status, temp, humidity, duration_s, reason, created_ts = row
+        is_on = status in ('ON', 'RUN')
+        return {
+            # RUN = motor aadhich chalu astana program run (navin cycle nahi)
+            'status_text': "Program Run" if status == 'RUN' else f"Motor {status}",
+            'status_color': get_color_from_hex("#69F0AE" if is_on else "#FF7043"),
+            # Zone delete zala asel tar fakt id
+            'zone_text': self._zone_name(zone_id),
+            'date_text': format_date(created_ts),
+            'time_text': f"Time: {format_time(created_ts)}",
+            'duration_text': f"Duration: {format_duration(duration_s)}",
+            'reason_text': f"Reason: {reason}",
+            'climate_text': f"Temp: {temp} C   Humidity: {humidity} %",
+        }
+
+    def _set_empty(self, empty):
+        self.empty_label.text = (
+            "No matching records." if self._search else
+            "No history yet!\nStart using the motor to see records here."
+        )
+        self.empty_label.opacity = 1 if empty else 0
+        self.empty_label.height = dp(100) if empty else dp(0)
+
+    def _ask_export(self, instance):
+        if self._export_job is not None:
+            # Export chalu ahe - dusra button press = cancel
+            self._export_job.cancel()
+            return
+        self._export_dialog = MDDialog(
+            title="Export History",
+            text="All records will be written as a gzip file in the app folder.",
+            buttons=[
+                MDFlatButton(text="CANCEL", on_release=lambda x: self._export_dialog.dismiss()),
+                MDFlatButton(text="JSONL", on_release=lambda x: self._start_export('jsonl')),
+                MDRaisedButton(text="CSV", on_release=lambda x: self._start_export('csv')),
+            ],
+        )
+        self._export_dialog.open()
+
+    def _start_export(self, fmt):
+        self._export_dialog.dismiss()
+        if self._export_pending:
+            return
+        self._export_pending = True
+        self._show_export(f"Exporting {fmt.upper()}...")
+        # Pending events pan export madhe yave - flush worker var jato (UI thambat
+        # nahi); worker FIFO ahe mhanun ha marker job flush nantarach purn hoto
+        event_buffer.flush()
+        db_worker.submit(lambda: None, callback=lambda _: self._begin_export(fmt))
+
+    def _begin_export(self, fmt):
+        self._export_pending = False
+        folder = os.path.join(MDApp.get_running_app().user_data_dir, 'exports')
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, export_filename(fmt, compress=True))
+        self._export_job = ExportJob(
+            db, path, fmt=fmt, compress=True,
+            progress=self._on_export_progress,
+            on_done=self._on_export_done,
+            on_error=self._on_export_error,
+            dispatch=lambda fn: Clock.schedule_once(lambda dt: fn()),
+        ).start()
+
+    def _on_export_progress(self, done, total):
+        pct = int(done * 100 / total) if total else 100
+        self._show_export(f"Exporting... {done}/{total} rows ({pct}%)  - tap Export to cancel")
+
+    def _on_export_done(self, path, rows):
+        self._export_job = None
+        self._show_export(f"Exported {rows} rows to {os.path.basename(path)}")
+        Clock.schedule_once(lambda dt: self._show_export(""), 6)
+
+    def _on_export_error(self, exc):
+        self._export_job = None
+        self._show_export(
+            "Export cancelled" if isinstance(exc, InterruptedError) else f"Export failed: {exc}",
+            error=True,
+        )
+        Clock.schedule_once(lambda dt: self._show_export(""), 6)
+
+    def _show_export(self, text, error=False):
+        self.export_label.text = text
+        self.export_label.text_color = get_color_from_hex("#FF5252" if error else "#69F0AE")
+        self.export_label.opacity = 1 if text else 0
+        self.export_label.height = dp(20) if text else dp(0)
+
+    def _clear_history(self, instance):
+        db_worker.submit(db.delete_all, callback=lambda _: self.load_history())
+
+    def on_enter(self):
+        self.refresh()
+
 
-        for row in rows:
-            row_id, status, temp, humidity, duration, reason, date, time_str = row
-            self._add_card(status, temp, humidity, duration, reason, date, time_str)
 
-    def _add_card(self, status, temp, humidity, duration, reason, date, time_str):
-        is_on = status == 'ON'
-        status_color = "#69F0AE" if is_on else "#FF7043"
 
-        card = DashCard(size_hint_y=None, height=dp(130), elevation=0)
-        cl = MDBoxLayout(
+# ==========================================
+#  STATS SCREEN
+# ==========================================
+class StatsScreen(MDScreen):
+    # period -> (button text, bucket label format, kiti buckets)
+    PERIODS = {
+        'hour': ("Hourly", "%d %b  %I:00 %p", 48),
+        'day':  ("Daily", "%a, %d %b %Y", 60),
+        'week': ("Weekly", "Week of %d %b %Y", 52),
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.md_bg_color = get_color_from_hex("#0A1628")
+        self._period = 'day'
+        self._period_btns = {}
+        self._reset_dialog = None
+        self._build_ui()
+
+    def _build_ui(self):
+        self.root_layout = MDBoxLayout(
             orientation='vertical',
-            padding=[dp(16), dp(10), dp(16), dp(10)],
-            spacing=dp(6),
+            padding=[dp(16), dp(12), dp(16), dp(12)],
+            spacing=dp(12),
         )
 
-        row1 = MDBoxLayout(size_hint_y=None, height=dp(26))
-        row1.add_widget(MDLabel(
-            text=f"Motor {status}", font_style="Subtitle1", bold=True,
-            theme_text_color="Custom", text_color=get_color_from_hex(status_color),
-        ))
-        row1.add_widget(MDLabel(
-            text=date, font_style="Caption", halign='right',
-            theme_text_color="Custom", text_color=get_color_from_hex("#4A90D9"),
+        topbar = MDBoxLayout(size_hint_y=None, height=dp(56), spacing=dp(8))
+        topbar.add_widget(MDRaisedButton(
+            text="Back", size_hint=(None, None), size=(dp(80), dp(38)),
+            md_bg_color=get_color_from_hex("#1565C0"), elevation=4,
+            on_release=lambda x: setattr(self.manager, 'current', 'dashboard'),
         ))
-
-        row2 = MDBoxLayout(size_hint_y=None, height=dp(22))
-        row2.add_widget(MDLabel(
-            text=f"Time: {time_str}", font_style="Caption",
-            theme_text_color="Custom", text_color=get_color_from_hex("#B0BEC5"),
+        topbar.add_widget(MDLabel(
+            text="Fogging Stats", font_style="H6", bold=True,
+            theme_text_color="Custom", text_color=get_color_from_hex("#E8F4FF"),
         ))
-        row2.add_widget(MDLabel(
-            text=f"Duration: {duration}", font_style="Caption", halign='right',
-            theme_text_color="Custom", text_color=get_color_from_hex("#B0BEC5"),
+        topbar.add_widget(MDRaisedButton(
+            text="Reset Stats", size_hint=(None, None), size=(dp(110), dp(38)),
+            md_bg_color=get_color_from_hex("#B71C1C"), elevation=4,
+            on_release=self._ask_reset,
         ))
 
-        cl.add_widget(row1)
-        cl.add_widget(row2)
-        cl.add_widget(MDLabel(
-            text=f"Reason: {reason}", font_style="Caption",
+        period_row = MDBoxLayout(size_hint_y=None, height=dp(40), spacing=dp(8))
+        for period, (label, _, _) in self.PERIODS.items():
+            btn = MDRaisedButton(
+                text=label, size_hint=(1, None), height=dp(38),
+                md_bg_color=get_color_from_hex("#37474F"),
+                on_release=lambda x, p=period: self._select_period(p),
+            )
+            self._period_btns[period] = btn
+            period_row.add_widget(btn)
+
+        self.summary_label = MDLabel(
+            text="", halign='center', font_style="Caption",
             theme_text_color="Custom", text_color=get_color_from_hex("#4A90D9"),
-            size_hint_y=None, height=dp(22),
+            size_hint_y=None, height=dp(24),
+        )
+
+        self.stats_list = StatsList()
+
+        self.root_layout.add_widget(topbar)
+        self.root_layout.add_widget(period_row)
+        self.root_layout.add_widget(self.summary_label)
+        self.root_layout.add_widget(self.stats_list)
+        self.add_widget(self.root_layout)
+        self._select_period(self._period)
+
+    def _select_period(self, period):
+        self._period = period
+        for p, btn in self._period_btns.items():
+            btn.md_bg_color = get_color_from_hex("#1565C0" if p == period else "#37474F")
+        self.load_stats()
+
+    def _ask_reset(self, instance):
+        # History 'Clear All' stats la haat lavat nahi - he vegla, confirm sobat
+        self._reset_dialog = MDDialog(
+            title="Reset Stats",
+            text="All hourly, daily and weekly summaries will be deleted. History records are kept.",
+            buttons=[
+                MDFlatButton(text="CANCEL", on_release=lambda x: self._reset_dialog.dismiss()),
+                MDRaisedButton(text="RESET", md_bg_color=get_color_from_hex("#B71C1C"),
+                               on_release=self._reset_stats),
+            ],
+        )
+        self._reset_dialog.open()
+
+    def _reset_stats(self, instance):
+        self._reset_dialog.dismiss()
+        db_worker.submit(db.delete_rollups, callback=lambda _: self.load_stats())
+
+    def load_stats(self):
+        # Pending events aadhi lihun gheu mhanje rollups up-to-date
+        event_buffer.flush()
+        period = self._period
+        db_worker.submit(
+            db.get_rollups, period, limit=self.PERIODS[period][2],
+            callback=lambda rows: self._show_stats(period, rows),
+        )
+
+    def _show_stats(self, period, rows):
+        if period != self._period:
+            return
+        fmt = self.PERIODS[period][1]
+        total_on = sum(r[3] for r in rows)
+        total_cycles = sum(r[2] for r in rows)
+        self.summary_label.text = (
+            f"{len(rows)} buckets  |  {total_cycles} cycles  |  {total_on:.0f} min motor ON"
+            if rows else "No data yet"
+        )
+        data = []
+        for bucket_ts, events, cycles, on_minutes, auto_on, auto_temp, avg_temp, avg_hum in rows:
+            data.append({
+                'bucket_text': datetime.fromtimestamp(bucket_ts).strftime(fmt),
+                'cycles_text': f"{cycles} cycles  |  {events} events",
+                'on_text': f"Motor ON: {on_minutes:.1f} min",
+                'temp_text': (
+                    f"Auto-ON avg: {auto_temp:.1f} C ({auto_on}x)" if auto_on
+                    else f"Avg temp: {avg_temp:.1f} C" if avg_temp is not None
+                    else "-"
+                ),
+            })
+        self.stats_list.data = data
+
+    def on_enter(self):
+        self.load_stats()
+
+
+# ==========================================
+#  ZONES SCREEN
+# ==========================================
+class ZonesScreen(MDScreen):
+    """Sagle zones ekach RecycleView madhe - 100+ zones asle tari fakt visible
+    rows che widgets banatat ani refresh la fakt badalleli rows update hotat."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.md_bg_color = get_color_from_hex("#0A1628")
+        self._index = {}       # zone_id -> data index
+        self._refresh_ev = None
+        self._build_ui()
+
+    def _build_ui(self):
+        self.root_layout = MDBoxLayout(
+            orientation='vertical',
+            padding=[dp(16), dp(12), dp(16), dp(12)],
+            spacing=dp(12),
+        )
+
+        topbar = MDBoxLayout(size_hint_y=None, height=dp(56), spacing=dp(8))
+        topbar.add_widget(MDRaisedButton(
+            text="Back", size_hint=(None, None), size=(dp(80), dp(38)),
+            md_bg_color=get_color_from_hex("#1565C0"), elevation=4,
+            on_release=lambda x: setattr(self.manager, 'current', 'dashboard'),
         ))
-        cl.add_widget(MDLabel(
-            text=f"Temp: {temp} C   Humidity: {humidity} %",
-            font_style="Caption",
-            theme_text_color="Custom", text_color=get_color_from_hex("#FF7043"),
-            size_hint_y=None, height=dp(20),
+        topbar.add_widget(MDLabel(
+            text="Zones", font_style="H6", bold=True,
+            theme_text_color="Custom", text_color=get_color_from_hex("#E8F4FF"),
+        ))
+        topbar.add_widget(MDRaisedButton(
+            text="Add Zone", size_hint=(None, None), size=(dp(110), dp(38)),
+            md_bg_color=get_color_from_hex("#2E7D32"), elevation=4,
+            on_release=self._add_zone,
         ))
 
-        card.add_widget(cl)
-        self.scroll_layout.add_widget(card)
+        self.summary_label = MDLabel(
+            text="", halign='center', font_style="Caption",
+            theme_text_color="Custom", text_color=get_color_from_hex("#4A90D9"),
+            size_hint_y=None, height=dp(24),
+        )
+        self.zone_list = ZoneList()
 
-    def _clear_history(self, instance):
-        db.delete_all()
-        self.load_history()
+        self.root_layout.add_widget(topbar)
+        self.root_layout.add_widget(self.summary_label)
+        self.root_layout.add_widget(self.zone_list)
+        self.add_widget(self.root_layout)
 
-    def on_enter(self):
-        self.load_history()
+    def _zone_data(self, zone):
+        ctl = zone.controller
+        cfg = ctl.config
+        if ctl.motor_on:
+            status = (
+                "MANUAL ON" if ctl.manual_mode
+                else "PRE-COOL" if ctl.precool and not ctl.hot
+                else "MOTOR ON"
+            )
+            color = "#69F0AE"
+        elif ctl.hot:
+            status, color = "HOT", "#FF7043"
+        else:
+            status, color = "OFF", "#546E7A"
+        return {
+            'zone_id': zone.zone_id,
+            'name_text': zone.name,
+            'climate_text': (
+                f"{ctl.temperature} C  |  {ctl.humidity} %"
+                if ctl.temperature is not None else "No reading yet"
+            ),
+            'status_text': status,
+            'status_color': get_color_from_hex(color),
+            'threshold_text': f"ON {cfg.on_temp:g} C / OFF {cfg.off_temp:g} C",
+        }
 
+    def _update_summary(self):
+        zones = list(scheduler)
+        on = sum(1 for z in zones if z.controller.motor_on)
+        hot = sum(1 for z in zones if z.controller.hot)
+        self.summary_label.text = f"{len(zones)} zones  |  {on} motors ON  |  {hot} hot"
+
+    def load_zones(self):
+        """Purn list parat banva (screen open / zone add)"""
+        scheduler.drain_changed()
+        data = [self._zone_data(zone) for zone in scheduler]
+        self._index = {d['zone_id']: i for i, d in enumerate(data)}
+        self.zone_list.data = data
+        self._update_summary()
+
+    def _refresh_changed(self, dt):
+        """Shevatchya refresh pasun badallele zones ch update kara"""
+        changed = scheduler.drain_changed()
+        if not changed:
+            return
+        data = self.zone_list.data
+        for zone_id in changed:
+            zone = scheduler.get(zone_id)
+            index = self._index.get(zone_id)
+            if zone is None or index is None:
+                # Navin / kadhlela zone - index juna zala
+                self.load_zones()
+                return
+            data[index] = self._zone_data(zone)
+        self._update_summary()
+
+    def open_zone(self, zone_id):
+        self.manager.get_screen('dashboard').select_zone(zone_id)
+        self.manager.current = 'dashboard'
+
+    def _add_zone(self, instance):
+        name = f"Zone {len(scheduler) + 1}"
+        db_worker.submit(
+            lambda: db.get_zone(db.add_zone(name)), callback=self._on_zone_added,
+        )
 
+    def _on_zone_added(self, row):
+        zone = Zone.from_row(row, writer=event_buffer.add, default_sensor=DEFAULT_SENSOR)
+        zone.source.start()
+        telemetry.track(zone)
+        scheduler.add(zone)
+        # 'Sagle zones' block windows navin zone la pan lagu
+        programs.add_zone(zone)
+        self.load_zones()
+
+    def on_enter(self):
+        self.load_zones()
+        # Screen disat asel tevhach - scheduler tick nantar badalleli rows
+        self._refresh_ev = Clock.schedule_interval(self._refresh_changed, SENSOR_INTERVAL)
+
+    def on_leave(self):
+        if self._refresh_ev is not None:
+            self._refresh_ev.cancel()
+            self._refresh_ev = None
 
 
 # ==========================================
@@ -1170,7 +2067,6 @@ class UsersScreen(MDScreen):
         self.root_layout.add_widget(self.count_label)
         self.root_layout.add_widget(self.scroll)
         self.add_widget(self.root_layout)
-        self._load_users()
 
     def _select_role(self, role):
         self._selected_role = role
@@ -1201,7 +2097,12 @@ class UsersScreen(MDScreen):
             self.add_msg.text_color = get_color_from_hex("#FF5252")
             return
 
-        success = db.add_user(name, email, password, self._selected_role)
+        db_worker.submit(
+            db.add_user, name, email, password, self._selected_role,
+            callback=lambda success: self._on_user_added(success, name),
+        )
+
+    def _on_user_added(self, success, name):
         if success:
             self.add_msg.text = f"{name} added successfully!"
             self.add_msg.text_color = get_color_from_hex("#69F0AE")
@@ -1214,8 +2115,10 @@ class UsersScreen(MDScreen):
             self.add_msg.text_color = get_color_from_hex("#FF5252")
 
     def _load_users(self):
+        db_worker.submit(db.get_all_users, callback=self._show_users)
+
+    def _show_users(self, users):
         self.scroll_layout.clear_widgets()
-        users = db.get_all_users()
         self.count_label.text = f"Users List: ({len(users)} users)"
 
         for user_id, name, email, role in users:
@@ -1268,7 +2171,7 @@ class UsersScreen(MDScreen):
             self.scroll_layout.add_widget(card)
 
     def _delete_user(self, username):
-        db.delete_user(username)
+        db_worker.submit(db.delete_user, username)
         self._load_users()
 
     def on_enter(self):
@@ -1276,6 +2179,31 @@ class UsersScreen(MDScreen):
 
 # ==========================================
 #  MAIN APP
+# ==========================================
+class LazyScreenManager(MDScreenManager):
+    """Screens pahilya navigation la banatat (`current = ...` / get_screen()).
+
+    Cold start la fakt login screen - dashboard / history / users che widgets
+    ani tyanche DB queries garaj padlyavarach.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._factories = {}
+
+    def register(self, name, factory):
+        self._factories[name] = factory
+
+    def get_screen(self, name):
+        factory = self._factories.pop(name, None)
+        if factory is not None:
+            self.add_widget(factory(name=name))
+        return super().get_screen(name)
+
+    def has_screen(self, name):
+        return name in self._factories or super().has_screen(name)
+
+
 # ==========================================
 class AutoFoggerApp(MDApp):
     def build(self):
@@ -1283,13 +2211,89 @@ class AutoFoggerApp(MDApp):
         self.theme_cls.primary_hue = "700"
         self.theme_cls.theme_style = "Dark"
         self.title = "Auto Fogger"
-        sm = MDScreenManager()
+        self._profile = {} if os.environ.get('FOGGER_STARTUP_PROFILE') else None
+        self._mark('imports')
+        db_worker.start()
+        # Worker FIFO ahe: schema -> zones -> programs, ani login / screens che
+        # sagle queries tyanantar
+        db_worker.submit(db.ensure_schema, callback=lambda _: self._mark('db ready'))
+        db_worker.submit(db.get_zones, True, callback=self._on_zones_loaded)
+        db_worker.submit(db.get_programs, True, callback=programs.load)
+        # Ekach timer sagle zones poll karto - pratyek tick pudhcha interval tharavto
+        self._background = False
+        self._sensor_ev = Clock.schedule_once(self._sensor_tick, 0)
+        # Startup nantar thoda vel thambun, mag dar 6 tasani
+        Clock.schedule_once(lambda dt: retention.run(), 30)
+        Clock.schedule_interval(lambda dt: retention.run(), RETENTION_INTERVAL)
+        sm = LazyScreenManager()
         sm.add_widget(LoginScreen(name='login'))
-        sm.add_widget(DashboardScreen(name='dashboard'))
-        sm.add_widget(HistoryScreen(name='history'))
-        sm.add_widget(UsersScreen(name='users'))
+        for name, screen in (('dashboard', DashboardScreen), ('history', HistoryScreen),
+                             ('stats', StatsScreen), ('zones', ZonesScreen),
+                             ('users', UsersScreen)):
+            sm.register(name, screen)
+        self._mark('build')
+        if self._profile is not None:
+            Window.bind(on_flip=self._on_first_frame)
         return sm
 
+    def _on_zones_loaded(self, rows):
+        for row in rows:
+            zone = Zone.from_row(row, writer=event_buffer.add, default_sensor=DEFAULT_SENSOR)
+            telemetry.track(zone)
+            scheduler.add(zone)
+        scheduler.start()
+        self._mark('zones')
+        # Zones aadhi tick zala asel tar lagech pahila reading
+        self._sensor_ev.cancel()
+        self._sensor_ev = Clock.schedule_once(self._sensor_tick, 0)
+
+    # ---------- startup profile ----------
+    def _mark(self, name):
+        if self._profile is not None:
+            self._profile[name] = time.perf_counter() - STARTUP_T0
+
+    def _on_first_frame(self, *args):
+        Window.unbind(on_flip=self._on_first_frame)
+        self._mark('first frame')
+        # DB / zones ajun tayar nastil tar te pan yenar - thodya velane report
+        Clock.schedule_once(self._report_startup, 2)
+
+    def _report_startup(self, dt):
+        marks = sorted(self._profile.items(), key=lambda item: item[1])
+        print("[startup] " + ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in marks))
+
+    def _sensor_tick(self, dt):
+        programs.poll()
+        scheduler.tick()
+        interval = scheduler.next_interval(self._background, SENSOR_INTERVAL)
+        until_program = programs.seconds_until_next()
+        if until_program is not None:
+            interval = min(interval, max(until_program, 0.1))
+        self._sensor_ev = Clock.schedule_once(self._sensor_tick, interval)
+
+    def on_pause(self):
+        # Android var app background la gela ki process kadhi pan kill hou shakto
+        event_buffer.flush()
+        telemetry.flush()
+        self._background = True
+        self.root.get_screen('login').logo.stop()
+        return True
+
+    def on_resume(self):
+        # Parat aalyavar lagech fresh reading, mag adaptive rate
+        self._background = False
+        self._sensor_ev.cancel()
+        self._sensor_ev = Clock.schedule_once(self._sensor_tick, 0)
+        if self.root.current == 'login':
+            self.root.get_screen('login').logo.start()
+
+    def on_stop(self):
+        scheduler.stop()
+        event_buffer.close()
+        telemetry.close()
+        db_worker.stop()
+        db.close()
+
 
 if __name__ == "__main__":
     AutoFoggerApp().run()
@@ -0,0 +1,66 @@
+"""Connection setup cost: fresh sqlite3.connect() per call vs pooled connection.
+
+Ek "toggle" = save_event + get_count, exactly jasa dashboard motor transition la karto.
+
+    python benchmarks/bench_db_connection.py [ops]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_db import DatabaseManager
+
+
+def legacy_toggle(db_path):
+    """Juna path: pratyek call sathi connect + commit + close"""
+    now = datetime.now()
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        INSERT INTO history
+        (status, temperature, humidity, duration, reason, date, time, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', ("ON", 41.2, 60.0, "-", "bench",
+          now.strftime("%d %b %Y"), now.strftime("%I:%M %p"),
+          now.strftime("%Y-%m-%d %H:%M:%S")))
+    conn.commit()
+    conn.close()
+    conn = sqlite3.connect(db_path)
+    conn.execute('SELECT COUNT(*) FROM history').fetchone()
+    conn.close()
+
+
+def run(label, fn, ops):
+    start = time.perf_counter()
+    for _ in range(ops):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {ops / elapsed:>10.0f} toggles/sec  ({elapsed * 1000 / ops:.3f} ms/toggle)")
+    return ops / elapsed
+
+
+def main():
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        # Legacy DB: default rollback journal, synchronous=FULL
+        legacy_path = os.path.join(tmp, 'legacy.db')
+        DatabaseManager(legacy_path, pragmas={'journal_mode': 'DELETE', 'synchronous': 'FULL'}).close()
+        before = run("per-call connect (before)", lambda: legacy_toggle(legacy_path), ops)
+
+        db = DatabaseManager(os.path.join(tmp, 'pooled.db'))
+
+        def pooled_toggle():
+            db.save_event("ON", 41.2, 60.0, None, "bench")
+            db.get_count()
+
+        after = run("pooled connection (after)", pooled_toggle, ops)
+        db.close()
+    print(f"speedup: {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
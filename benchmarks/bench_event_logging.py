@@ -0,0 +1,62 @@
+"""Event logging throughput: commit-per-insert save_event vs EventWriteBuffer.
+
+Sensor sample logging simulate karto - pratyek sample ek history row.
+
+    python benchmarks/bench_event_logging.py [events]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_db import DatabaseManager, DBWorker, EventWriteBuffer
+
+
+def run(label, fn, events):
+    start = time.perf_counter()
+    fn(events)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {events / elapsed:>10.0f} inserts/sec")
+    return events / elapsed
+
+
+def bench(tmp, events, pragmas):
+    db = DatabaseManager(os.path.join(tmp, 'direct.db'), pragmas=pragmas)
+
+    def direct(n):
+        for i in range(n):
+            db.save_event("ON", 40.0 + i % 5, 60.0, None, "sample")
+
+    before = run("save_event (commit per insert)", direct, events)
+    db.close()
+
+    db = DatabaseManager(os.path.join(tmp, 'buffered.db'), pragmas=pragmas)
+    worker = DBWorker(db).start()
+    buffer = EventWriteBuffer(db, worker, max_rows=50, max_delay_ms=1000)
+
+    def buffered(n):
+        for i in range(n):
+            buffer.add("ON", 40.0 + i % 5, 60.0, None, "sample")
+        buffer.flush(wait=True)
+
+    after = run("EventWriteBuffer (50 rows / commit)", buffered, events)
+    assert db.get_count() == events
+    buffer.close()
+    worker.stop()
+    db.close()
+    print(f"speedup: {after / before:.1f}x")
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    # NORMAL = app default; FULL = pratyek commit la fsync (slow flash sarkha)
+    for sync in ('NORMAL', 'FULL'):
+        print(f"-- synchronous={sync}")
+        with tempfile.TemporaryDirectory() as tmp:
+            bench(tmp, events, {'synchronous': sync})
+
+
+if __name__ == "__main__":
+    main()
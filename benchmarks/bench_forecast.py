@@ -0,0 +1,171 @@
+"""Predictive pre-cooling replay: forecast accuracy ani reactive vs predictive control.
+
+Trace offline replay hoto (virtual clock, DB nahi):
+
+    python benchmarks/bench_forecast.py                       # synthetic traces
+    python benchmarks/bench_forecast.py history.csv           # export / trace CSV
+    python benchmarks/bench_forecast.py --db auto_fogger.db --zone 1 --days 7
+
+CSV madhe `temperature` column lagto; `created_ts` / `ts` nasel tar samples
+--interval seconds antarane dharle jatat. --db telemetry blocks vachto.
+"""
+import argparse
+import bisect
+import csv
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_control import ControlConfig, FoggerController, HoltForecaster
+
+DAY = 24 * 60 * 60
+
+
+# ---------- traces ----------
+def synthetic(kind, seed=1, tick=5):
+    rng = random.Random(seed)
+    ts, temps = [], []
+    for i in range(DAY // tick):
+        t = i * tick
+        if kind == 'diurnal':
+            base = 35.5 - 5.5 * math.cos(2 * math.pi * (t - 3 * 3600) / DAY)
+        else:
+            # Ek tas 34 C varun 2 C/min ne 42 C, mag halu khali
+            start = 12 * 3600
+            base = 34.0
+            if start <= t < start + 3600:
+                base = min(42.0, 34.0 + (t - start) / 30)
+            elif start + 3600 <= t < start + 7200:
+                base = 42.0 - (t - start - 3600) / 450
+        ts.append(t)
+        temps.append(base + rng.gauss(0, 0.2))
+    return ts, temps
+
+
+def from_csv(path, interval):
+    ts, temps = [], []
+    with open(path, newline='', encoding='utf-8') as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            try:
+                temp = float(row['temperature'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            stamp = row.get('created_ts') or row.get('ts')
+            ts.append(float(stamp) if stamp else i * interval)
+            temps.append(temp)
+    return ts, temps
+
+
+def from_telemetry(path, zone_id, days):
+    from fogger_db import DatabaseManager
+    from fogger_telemetry import read_telemetry
+
+    db = DatabaseManager(path)
+    until = int(time.time()) + 1
+    ts, temps, _ = read_telemetry(db, zone_id, until - int(days * DAY), until)
+    db.close()
+    return ts, temps
+
+
+# ---------- evaluation ----------
+def forecast_error(ts, temps, horizon, alpha, beta):
+    """Holt vs persistence (ata jevdha, tevdhach rahil) - MAE horizon nantar"""
+    holt = HoltForecaster(alpha, beta)
+    err_holt = err_naive = 0.0
+    n = 0
+    for i, (t, temp) in enumerate(zip(ts, temps)):
+        holt.update(temp, t)
+        j = bisect.bisect_left(ts, t + horizon, i)
+        if j >= len(ts) or not holt.ready:
+            continue
+        actual = temps[j]
+        err_holt += abs(holt.forecast(ts[j] - t) - actual)
+        err_naive += abs(temp - actual)
+        n += 1
+    return (err_holt / n, err_naive / n) if n else (None, None)
+
+
+def replay(ts, temps, config):
+    now = [0.0]
+    controller = FoggerController(config=config, clock=lambda: now[0])
+    starts = []
+    controller.subscribe(lambda event, data: event == 'motor' and data['on']
+                         and starts.append((now[0], data['reason'])))
+    on_seconds = 0.0
+    for i, (t, temp) in enumerate(zip(ts, temps)):
+        if i and controller.motor_on:
+            on_seconds += t - ts[i - 1]
+        now[0] = t
+        controller.on_reading(temp, 60.0)
+    return starts, on_seconds
+
+
+def crossings(ts, temps, config):
+    """Reactive (no forecast) controller hot kevha zala - lead time sathi reference"""
+    now = [0.0]
+    controller = FoggerController(config=ControlConfig(
+        on_temp=config.on_temp, off_temp=config.off_temp,
+        min_on_s=0, min_off_s=0, smoothing=config.smoothing,
+    ), clock=lambda: now[0])
+    hot_at = []
+    controller.subscribe(lambda event, data: event == 'alert' and hot_at.append(now[0]))
+    for t, temp in zip(ts, temps):
+        now[0] = t
+        controller.on_reading(temp, 60.0)
+    return hot_at
+
+
+def evaluate(name, ts, temps, horizon, alpha, beta):
+    print(f"== {name}: {len(ts)} samples, {(ts[-1] - ts[0]) / 3600:.1f} h")
+    mae_holt, mae_naive = forecast_error(ts, temps, horizon, alpha, beta)
+    if mae_holt is not None:
+        print(f"forecast MAE @ {horizon:g}s   holt {mae_holt:.2f} C   persistence {mae_naive:.2f} C")
+    reactive = ControlConfig()
+    predictive = ControlConfig(forecast_s=horizon, forecast_alpha=alpha, forecast_beta=beta)
+    hot_at = crossings(ts, temps, reactive)
+    print(f"{'mode':<12} {'cycles':>7} {'ON time':>9} {'avg lead':>9} {'false pre':>10}")
+    for label, config in (("reactive", reactive), ("predictive", predictive)):
+        starts, on_seconds = replay(ts, temps, config)
+        leads, false = [], 0
+        for start, reason in starts:
+            # Ya start nantar (horizon + min_on) madhe kharach hot zala ka?
+            later = [h for h in hot_at if start - horizon <= h <= start + horizon + config.min_on_s]
+            if later:
+                leads.append(later[0] - start)
+            elif reason.startswith("Predictive"):
+                false += 1
+        lead = f"{sum(leads) / len(leads):+.0f} s" if leads else "-"
+        print(f"{label:<12} {len(starts):>7} {on_seconds / 3600:>7.1f} h {lead:>9} {false:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('trace', nargs='?', help="CSV trace (default: synthetic)")
+    parser.add_argument('--db', help="telemetry madhun trace")
+    parser.add_argument('--zone', type=int, default=1)
+    parser.add_argument('--days', type=float, default=7)
+    parser.add_argument('--interval', type=float, default=5, help="CSV madhe ts nasel tar")
+    parser.add_argument('--horizon', type=float, default=120)
+    parser.add_argument('--alpha', type=float, default=0.3)
+    parser.add_argument('--beta', type=float, default=0.05)
+    args = parser.parse_args()
+
+    if args.db:
+        traces = [(f"telemetry zone {args.zone}", from_telemetry(args.db, args.zone, args.days))]
+    elif args.trace:
+        traces = [(args.trace, from_csv(args.trace, args.interval))]
+    else:
+        traces = [(kind, synthetic(kind)) for kind in ('diurnal', 'heat spike')]
+    for name, (ts, temps) in traces:
+        if len(ts) < 2:
+            print(f"== {name}: not enough samples")
+            continue
+        evaluate(name, ts, temps, args.horizon, args.alpha, args.beta)
+
+
+if __name__ == "__main__":
+    main()
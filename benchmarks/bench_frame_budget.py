@@ -0,0 +1,113 @@
+"""Frame budget check: heavy SQLite queries on DBWorker vs on the UI thread.
+
+Ek fake 30 FPS main loop chalto (AnimatedLogo ya rate ne redraw karto) ani
+tyach veli history table var motha get_all_events + save_event burst chalto.
+Worker mode madhe worst frame budget madhe rahila pahije, nahitar exit code 1.
+
+    python benchmarks/bench_frame_budget.py [rows]
+"""
+import os
+import queue
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_db import DatabaseManager, DBWorker
+
+FPS = 30
+FRAME = 1.0 / FPS
+# Jast-jast ek frame drop chalel (GIL handoff + sleep jitter), don nahi
+BUDGET = FRAME * 2
+
+
+def seed(db, rows):
+    start = int(time.time()) - rows * 60
+    db.save_events([
+        ("ON" if i % 2 else "OFF", 40.5, 60.0, None if i % 2 else 60, "seed",
+         start + i * 60, None, 1)
+        for i in range(rows)
+    ])
+
+
+def heavy_jobs(db):
+    """Dashboard + History screen cha worst-case DB kaam"""
+    return [
+        (db.get_all_events, ()),
+        (db.get_count, ()),
+        (db.save_event, ("ON", 41.0, 60.0, None, "bench")),
+        (db.get_all_events, ()),
+    ]
+
+
+def main_loop(frames, on_frame):
+    """Clock sarkha loop: next frame paryant sleep, frame time record kara"""
+    worst = 0.0
+    over = 0
+    last = time.perf_counter()
+    for i in range(frames):
+        on_frame(i)
+        next_tick = last + FRAME
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        now = time.perf_counter()
+        frame_time = now - last
+        worst = max(worst, frame_time)
+        if frame_time > BUDGET:
+            over += 1
+        last = now
+    return worst, over
+
+
+def run_inline(db, frames):
+    jobs = heavy_jobs(db)
+
+    def on_frame(i):
+        if i % 10 == 0:
+            fn, args = jobs[(i // 10) % len(jobs)]
+            fn(*args)
+
+    return main_loop(frames, on_frame)
+
+
+def run_worker(db, frames):
+    # Clock.schedule_once sarkha: callbacks main loop madhe drain hotat
+    pending = queue.Queue()
+    worker = DBWorker(db, dispatch=pending.put).start()
+    jobs = heavy_jobs(db)
+
+    def on_frame(i):
+        if i % 10 == 0:
+            fn, args = jobs[(i // 10) % len(jobs)]
+            worker.submit(fn, *args, callback=lambda result: None)
+        while not pending.empty():
+            pending.get_nowait()()
+
+    result = main_loop(frames, on_frame)
+    worker.stop()
+    return result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    frames = FPS * 4
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'))
+        seed(db, rows)
+        worst_inline, over_inline = run_inline(db, frames)
+        worst_worker, over_worker = run_worker(db, frames)
+        db.close()
+
+    print(f"{rows} history rows, {frames} frames @ {FPS} FPS, budget {BUDGET * 1000:.1f} ms")
+    print(f"UI thread queries : worst frame {worst_inline * 1000:7.1f} ms, {over_inline} frames over budget")
+    print(f"DBWorker queries  : worst frame {worst_worker * 1000:7.1f} ms, {over_worker} frames over budget")
+    if worst_worker > BUDGET:
+        print("FAIL: main loop missed its frame budget with DBWorker")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""History filters / search latency on a large history table.
+
+Mixed Auto / Predictive / Manual / Program events seed karto ani History
+screen che typical filters (pahila page, 50 rows) mojto. Budget 50 ms per
+query - jast zala tar exit code 1.
+
+    python benchmarks/bench_history_search.py [rows]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_db import DatabaseManager
+
+BUDGET_MS = 50.0
+DAY = 24 * 60 * 60
+
+
+def seed(db, rows, now):
+    rng = random.Random(0)
+    start = now - rows * 60
+    batch = []
+    for i in range(rows):
+        temp = round(rng.uniform(30, 45), 1)
+        pick = rng.random()
+        if pick < 0.6:
+            status, reason = ("ON", f"Auto ON - Temperature {temp} C Hot") if i % 2 else \
+                ("OFF", f"Auto OFF - Temperature {temp} C Normal")
+        elif pick < 0.75:
+            status, reason = "ON", f"Predictive ON - Temperature {temp} C, forecast 40.2 C in 120s"
+        elif pick < 0.9:
+            status, reason = ("ON", "Manual Start") if i % 2 else ("OFF", "Manual Stop")
+        else:
+            status, reason = ("ON", "Program ON - Midday (120s)") if i % 2 else \
+                ("OFF", "Program OFF - Midday")
+        batch.append((status, temp, 60.0, None if status == "ON" else 60, reason,
+                      start + i * 60, None, 1))
+        if len(batch) == 50000:
+            db.save_events(batch)
+            batch = []
+    db.save_events(batch)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    now = int(time.time())
+    week = now - 7 * DAY
+    cases = [
+        ("latest page", {}),
+        ("manual stop, last week", {'kind': 'manual', 'status': 'OFF', 'since_ts': week}),
+        ("auto ON >= 42 C", {'kind': 'auto', 'status': 'ON', 'min_temp': 42}),
+        ("program, last week", {'kind': 'program', 'since_ts': week}),
+        ("text 'forecast'", {'text': 'forecast'}),
+        ("text 'midday' + last week", {'text': 'midday', 'since_ts': week}),
+        ("text 'no such thing'", {'text': 'nosuchword'}),
+        ("temp 44.5-45 C", {'min_temp': 44.5, 'max_temp': 45}),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'search.db'))
+        t0 = time.perf_counter()
+        seed(db, rows, now)
+        print(f"-- {rows} rows seeded in {time.perf_counter() - t0:.1f} s "
+              f"(FTS5 {'on' if db._has_fts() else 'off - LIKE fallback'})")
+        db._conn().execute("ANALYZE")
+        failed = False
+        for name, filters in cases:
+            t0 = time.perf_counter()
+            first = db.search_events(limit=50, **filters)
+            first_ms = (time.perf_counter() - t0) * 1000
+            # Scroll kelyavar pudhcha page (keyset)
+            t0 = time.perf_counter()
+            if first:
+                db.search_events(before_id=first[-1][0], limit=50, **filters)
+            next_ms = (time.perf_counter() - t0) * 1000
+            slow = max(first_ms, next_ms) > BUDGET_MS
+            failed |= slow
+            print(f"{name:<28} {len(first):>3} rows  first {first_ms:7.2f} ms  "
+                  f"next {next_ms:7.2f} ms{'  SLOW' if slow else ''}")
+        db.close()
+    print("FAIL" if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Motor thrash: juna single-threshold logic vs hysteresis + dwell + smoothing.
+
+Ek simulated divas (5 s tick) - diurnal curve jo dupari 40 C javal rengalto,
+var sensor noise. Motor transitions ani history writes count karto.
+
+    python benchmarks/bench_hysteresis.py [noise_sigma] [seed]
+"""
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_control import ControlConfig, FoggerController
+
+TICK = 5
+DAY = 24 * 60 * 60
+
+
+def noisy_day(sigma, seed):
+    """Diurnal trace: 30 C raatri, ~40.5 C dupari, gaussian noise"""
+    rng = random.Random(seed)
+    for i in range(DAY // TICK):
+        t = i * TICK
+        base = 35.25 - 5.25 * math.cos(2 * math.pi * (t - 3 * 3600) / DAY)
+        yield t, base + rng.gauss(0, sigma)
+
+
+def simulate(config, sigma, seed):
+    now = [0.0]
+    writes = []
+    controller = FoggerController(
+        writer=lambda **event: writes.append(event), config=config, clock=lambda: now[0],
+    )
+    transitions = []
+    controller.subscribe(lambda event, data: event == 'motor' and transitions.append(data))
+    on_seconds = 0
+    for t, temp in noisy_day(sigma, seed):
+        now[0] = t
+        controller.on_reading(temp, 60.0)
+        if controller.motor_on:
+            on_seconds += TICK
+    return len(transitions), len(writes), on_seconds
+
+
+def main():
+    sigma = float(sys.argv[1]) if len(sys.argv) > 1 else 0.8
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    configs = [
+        ("legacy (40 C on/off, no dwell)", ControlConfig.legacy()),
+        ("hysteresis 40/38.5 only", ControlConfig(min_on_s=0, min_off_s=0, smoothing=None)),
+        ("hysteresis + dwell 60/30 s", ControlConfig(smoothing=None)),
+        ("hysteresis + dwell + EMA (default)", ControlConfig()),
+    ]
+    print(f"1 simulated day, {DAY // TICK} samples, noise sigma {sigma} C")
+    print(f"{'config':<36} {'transitions':>11} {'DB writes':>10} {'motor ON':>10}")
+    for label, config in configs:
+        transitions, writes, on_seconds = simulate(config, sigma, seed)
+        print(f"{label:<36} {transitions:>11} {writes:>10} {on_seconds / 3600:>8.1f} h")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""AnimatedLogo frame cost: immediate mode (canvas.clear + navin instructions)
+vs retained mode (instructions ekdach, frame la fakt dot pos / glow alpha).
+
+Kivy install asel tar khare Canvas / Color / Ellipse / Line vaparle jatat;
+nasel tar halke stand-in objects - tevha fakt Python side cha kharch mojla jato.
+
+    python benchmarks/bench_logo.py [frames]
+"""
+import math
+import sys
+import time
+
+try:
+    from kivy.graphics import Canvas, Color, Ellipse, Line
+    KIVY = True
+except ImportError:
+    KIVY = False
+
+    class _Instruction:
+        def __init__(self, *args, **kwargs):
+            self.__dict__.update(kwargs)
+            self.rgba = args
+
+    class Canvas:
+        def __init__(self):
+            self.children = []
+
+        def clear(self):
+            self.children = []
+
+        def add(self, instruction):
+            self.children.append(instruction)
+
+    Color = Ellipse = Line = _Instruction
+
+FPS = 30
+R = 45.0
+STEPS = 200
+ORBIT = [(math.cos(2 * math.pi * i / STEPS), math.sin(2 * math.pi * i / STEPS))
+         for i in range(STEPS)]
+
+
+def immediate_frame(canvas, cx, cy, angle, pulse):
+    """Juna AnimatedLogo._draw - pratyek frame la 21 navin instructions"""
+    canvas.clear()
+    r = R
+    for instruction in (
+        Color(0.12, 0.55, 0.95, 0.08 + pulse * 0.07),
+        Ellipse(pos=(cx - r - 14, cy - r - 14), size=(r * 2 + 28, r * 2 + 28)),
+        Color(0.12, 0.55, 0.95, 0.13 + pulse * 0.05),
+        Ellipse(pos=(cx - r - 7, cy - r - 7), size=(r * 2 + 14, r * 2 + 14)),
+        Color(0.05, 0.10, 0.22, 1),
+        Ellipse(pos=(cx - r, cy - r), size=(r * 2, r * 2)),
+        Color(0.12, 0.55, 0.95, 1),
+        Line(circle=(cx, cy, r), width=2.5),
+        Color(0.12, 0.55, 0.95, 0.25),
+        Line(circle=(cx, cy, r - 7), width=1),
+        Color(0.2, 0.65, 1.0, 1),
+        Ellipse(pos=(cx - 10, cy - 6), size=(20, 22)),
+        Color(0.4, 0.78, 1.0, 0.9),
+        Ellipse(pos=(cx - 20, cy + 12), size=(9, 9)),
+        Ellipse(pos=(cx + 11, cy + 13), size=(8, 8)),
+        Color(0.5, 0.85, 1.0, 0.8),
+        Ellipse(pos=(cx - 6, cy + 20), size=(11, 11)),
+        Color(0.5, 0.9, 1.0, 1),
+        Ellipse(pos=(cx + r * math.cos(math.radians(angle)) - 5,
+                     cy + r * math.sin(math.radians(angle)) - 5), size=(10, 10)),
+        Color(0.12, 0.55, 0.95, 0.6),
+        Ellipse(pos=(cx + r * math.cos(math.radians(angle + 180)) - 3,
+                     cy + r * math.sin(math.radians(angle + 180)) - 3), size=(6, 6)),
+    ):
+        canvas.add(instruction)
+
+
+class Retained:
+    """Navin AnimatedLogo - fakt badalnare attributes"""
+
+    def __init__(self, canvas):
+        self.glow_outer = Color(0.12, 0.55, 0.95, 0.08)
+        self.glow_inner = Color(0.12, 0.55, 0.95, 0.13)
+        self.dot = Ellipse(size=(10, 10))
+        self.dot2 = Ellipse(size=(6, 6))
+        for instruction in (self.glow_outer, self.glow_inner, self.dot, self.dot2):
+            canvas.add(instruction)
+
+    def frame(self, cx, cy, step, pulse):
+        self.glow_outer.a = 0.08 + pulse * 0.07
+        self.glow_inner.a = 0.13 + pulse * 0.05
+        cos_a, sin_a = ORBIT[step]
+        self.dot.pos = (cx + R * cos_a - 5, cy + R * sin_a - 5)
+        self.dot2.pos = (cx - R * cos_a - 3, cy - R * sin_a - 3)
+
+
+def bench(frames, draw):
+    worst = 0.0
+    start = time.perf_counter()
+    for i in range(frames):
+        t0 = time.perf_counter()
+        draw(i)
+        worst = max(worst, time.perf_counter() - t0)
+    return (time.perf_counter() - start) / frames * 1000, worst * 1000
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    print(f"-- {frames} frames, {'kivy instructions' if KIVY else 'stand-in instructions (no kivy)'}")
+    cx = cy = 50.0
+
+    def pulse(i):
+        return abs((i * 0.04) % 2.0 - 1.0)
+
+    canvas = Canvas()
+    old_mean, old_worst = bench(
+        frames, lambda i: immediate_frame(canvas, cx, cy, (i * 1.8) % 360, pulse(i)))
+    logo = Retained(Canvas())
+    new_mean, new_worst = bench(frames, lambda i: logo.frame(cx, cy, i % STEPS, pulse(i)))
+
+    print(f"immediate  mean {old_mean:7.4f} ms   worst {old_worst:7.4f} ms   21 new instructions/frame")
+    print(f"retained   mean {new_mean:7.4f} ms   worst {new_worst:7.4f} ms   0 new instructions/frame")
+    print(f"speedup    {old_mean / new_mean:.1f}x")
+    # 30 FPS la sekandala kiti CPU vaachla
+    print(f"saved      {(old_mean - new_mean) * FPS:.2f} ms CPU per second of animation")
+    return 0 if new_mean < old_mean else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""ProgramScheduler: late-fire regression checks + poll cost with many programs.
+
+App pause / device sleep nantar triggers ushira chaltat - block window cha
+state ulta houn basu naye ani fog run history madhe yava. Kontahi check fail
+zala tar exit code 1.
+
+    python benchmarks/bench_programs.py [programs]
+"""
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_control import ControlConfig, FoggerController, Zone, ZoneScheduler
+from fogger_programs import ProgramScheduler, parse_window
+from fogger_sim import VirtualClock
+
+# 2024-06-03 (Monday) 19:00 local
+START = datetime(2024, 6, 3, 19, 0).timestamp()
+
+
+def program_row(program_id, kind, window, every_min=None, duration_s=None, zone_id=None):
+    return (program_id, zone_id, f"P{program_id}", kind, *parse_window(window),
+            every_min, duration_s, 127, 1)
+
+
+def make(rows, clock):
+    log = []
+    controller = FoggerController(
+        writer=lambda **row: log.append((row['status'], row['reason'])),
+        config=ControlConfig(), clock=clock,
+    )
+    zones = ZoneScheduler([Zone(1, "Main", controller, None)])
+    programs = ProgramScheduler(zones, clock=clock)
+    programs.load(rows)
+    return controller, programs, log
+
+
+def at(hour, minute=0, days=0):
+    base = datetime.fromtimestamp(START).replace(hour=0, minute=0)
+    return (base + timedelta(days=days, hours=hour, minutes=minute)).timestamp()
+
+
+def check_late_block():
+    """Night block 20:00-06:00; load 19:00, pudhcha poll thet 07:00 la"""
+    clock = VirtualClock(START)
+    controller, programs, _ = make([program_row(1, 'block', '20:00-06:00')], clock)
+    failures = []
+    for when, expected in ((at(7, days=1), False), (at(12, days=1), False),
+                           (at(21, days=1), True), (at(5, days=2), True),
+                           (at(6, 30, days=2), False)):
+        clock.now = when
+        programs.poll()
+        if controller.blocked != expected:
+            failures.append(f"{datetime.fromtimestamp(when):%a %H:%M} blocked={controller.blocked}")
+    return failures
+
+
+def check_run_logged_while_on():
+    """Motor auto ne chalu astana fog run - tari history row"""
+    clock = VirtualClock(at(10, 59))
+    controller, programs, log = make(
+        [program_row(1, 'fog', '11:00-12:00', every_min=30, duration_s=60)], clock)
+    controller.on_reading(42.0, 60.0)   # hot -> Auto ON
+    clock.now = at(11, 0)
+    programs.poll()
+    runs = [reason for status, reason in log if reason.startswith("Program ON")]
+    return [] if runs else ["program run not logged while motor already on"]
+
+
+def check_zone_added_mid_run():
+    """Zone 1 cha fog run chalu astana zone 2 add - run thambu naye, block lagu vha"""
+    clock = VirtualClock(at(10, 59))
+    controller, programs, _ = make(
+        [program_row(1, 'fog', '11:00-12:00', every_min=30, duration_s=120),
+         program_row(2, 'block', '10:00-13:00', zone_id=2)], clock)
+    failures = []
+    clock.now = at(11, 0)
+    programs.poll()
+    clock.now = at(11, 0) + 30
+    zone = Zone(2, "Second", FoggerController(config=ControlConfig(), clock=clock, zone_id=2), None)
+    programs.zones.add(zone)
+    programs.add_zone(zone)
+    if not controller.motor_on:
+        failures.append("zone 1 program run stopped when zone 2 was added")
+    if not zone.controller.blocked:
+        failures.append("active block window not applied to the new zone")
+    clock.now = at(11, 2)
+    programs.poll()
+    if controller.motor_on:
+        failures.append("zone 1 program run not stopped at its end")
+    return failures
+
+
+def check_overlapping_runs():
+    """Run every_min peksha motha (juni row) ani don programs che sarkhe nav"""
+    failures = []
+    clock = VirtualClock(at(10, 59))
+    controller, programs, log = make(
+        [program_row(1, 'fog', '11:00-12:00', every_min=1, duration_s=90)], clock)
+    for minute in (0, 1, 1.6):
+        clock.now = at(11, 0) + minute * 60
+        programs.poll()
+    # +1 cha start pahila run chalu astana - to skip, nahitar +1.5 la madhech kaptla jato
+    runs = [reason for _, reason in log if reason.startswith("Program ON")]
+    if len(runs) != 1 or controller.motor_on:
+        failures.append(f"overlapping run: {len(runs)} runs logged, motor_on={controller.motor_on}")
+    clock = VirtualClock(at(10, 59))
+    rows = [program_row(1, 'fog', '11:00-12:00', duration_s=60),
+            program_row(2, 'fog', '11:00-12:00', every_min=30, duration_s=300)]
+    rows = [row[:2] + ("Same",) + row[3:] for row in rows]
+    controller, programs, _ = make(rows, clock)
+    clock.now = at(11, 0)
+    programs.poll()
+    clock.now = at(11, 1)
+    programs.poll()
+    if not controller.motor_on:
+        failures.append("same-name program stopped another program's run")
+    return failures
+
+
+def bench_poll(count):
+    clock = VirtualClock(START)
+    rows = [program_row(i, 'fog', f"{i % 24:02d}:00-{(i % 24 + 1) % 24:02d}:00",
+                        every_min=5, duration_s=30) for i in range(1, count + 1)]
+    _, programs, _ = make(rows, clock)
+    polls = 0
+    t0 = time.perf_counter()
+    end = START + 24 * 3600
+    while clock.now < end:
+        programs.poll()
+        polls += 1
+        clock.advance(5)
+    return (time.perf_counter() - t0) / polls * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    failures = (check_late_block() + check_run_logged_while_on()
+                + check_zone_added_mid_run() + check_overlapping_runs())
+    for failure in failures:
+        print(f"FAIL  {failure}")
+    print(f"late-fire checks  {'OK' if not failures else 'FAILED'}")
+    print(f"poll cost         {bench_poll(count):.1f} us per tick ({count} programs, 1 day @ 5 s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
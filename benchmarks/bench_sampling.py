@@ -0,0 +1,89 @@
+"""Sensor polling: fixed 5 s interval vs AdaptiveSampler.
+
+Don simulated divas virtual clock var - 'diurnal' (dupari halu 40 C cross
+karto) ani 'heat spike' (stable 34 C, dupari 3 C/min ne 42 C). Kiti polls
+lagle (CPU / battery) ani threshold cross nantar motor kiti seconds ushira ON
+zali (noise shivay run) he mojto.
+
+    python benchmarks/bench_sampling.py [noise_sigma] [seed]
+"""
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_control import AdaptiveSampler, ControlConfig, FoggerController, Zone
+
+DAY = 24 * 60 * 60
+NOON = 12 * 3600
+
+
+def diurnal(t):
+    """30 C raatri, ~41 C dupari"""
+    return 35.5 - 5.5 * math.cos(2 * math.pi * (t - 3 * 3600) / DAY)
+
+
+def heat_spike(t):
+    """34 C, dupari 3 C/min ne 42 C paryant, 1 tas, mag parat"""
+    if NOON <= t < NOON + 3600:
+        return min(42.0, 34.0 + (t - NOON) * 0.05)
+    return 34.0
+
+
+TRACES = [("diurnal", diurnal), ("heat spike", heat_spike)]
+
+
+def fixed(seconds):
+    return lambda zone: seconds
+
+
+def adaptive(background=False):
+    sampler = AdaptiveSampler(fast_s=1.0, normal_s=5.0, slow_s=15.0, background_s=60.0)
+
+    def next_interval(zone):
+        sampler._clock = zone.controller._clock
+        return sampler.interval([zone], background)
+    return next_interval
+
+
+def simulate(trace, make_interval, sigma, seed):
+    rng = random.Random(seed)
+    now = [0.0]
+    config = ControlConfig()
+    controller = FoggerController(config=config, clock=lambda: now[0])
+    zone = Zone(1, 'bench', controller, None)
+    first_on = []
+    controller.subscribe(lambda event, data: event == 'motor' and data['on']
+                         and not first_on and first_on.append(now[0]))
+    next_interval = make_interval()
+    polls = 0
+    while now[0] < DAY:
+        controller.on_reading(trace(now[0]) + rng.gauss(0, sigma), 60.0)
+        polls += 1
+        now[0] += next_interval(zone)
+    crossing = next(t for t in range(DAY) if trace(t) >= config.on_temp)
+    return polls, (first_on[0] - crossing if first_on else None)
+
+
+def main():
+    sigma = float(sys.argv[1]) if len(sys.argv) > 1 else 0.2
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    modes = [
+        ("fixed 5 s (old)", lambda: fixed(5.0)),
+        ("adaptive (foreground)", lambda: adaptive(False)),
+        ("adaptive (background)", lambda: adaptive(True)),
+    ]
+    print(f"1 simulated day per trace, noise sigma {sigma} C")
+    print(f"{'trace':<12} {'mode':<24} {'polls':>7} {'reaction':>10}")
+    for name, trace in TRACES:
+        for label, make in modes:
+            polls, _ = simulate(trace, make, sigma, seed)
+            _, latency = simulate(trace, make, 0.0, seed)
+            reaction = f"{latency:.0f} s" if latency is not None else "never"
+            print(f"{name:<12} {label:<24} {polls:>7} {reaction:>10}")
+
+
+if __name__ == "__main__":
+    main()
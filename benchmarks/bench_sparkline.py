@@ -0,0 +1,65 @@
+"""Sparkline redraw cost per sensor tick: RingBuffer.append + sparkline_points.
+
+Kivy install asel tar Line.points assignment pan mojla jato. Budget 1 ms
+(30 FPS frame = 33 ms) - jast zala tar exit code 1.
+
+    python benchmarks/bench_sparkline.py [ticks]
+"""
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_telemetry import RingBuffer, sparkline_points
+
+BUDGET_MS = 1.0
+
+
+def make_line():
+    """Kivy nasel tar None - fakt points computation mojto"""
+    try:
+        from kivy.graphics import Line
+    except ImportError:
+        return None
+    return Line(points=[], width=1.2)
+
+
+def bench(capacity, ticks, line):
+    ring = RingBuffer(capacity)
+    points = []
+    # Aadhi buffer bharla - steady state (overwrite) mojaycha
+    for i in range(capacity):
+        ring.append(34.0 + math.sin(i / 10))
+    worst = 0.0
+    start = time.perf_counter()
+    for i in range(ticks):
+        t0 = time.perf_counter()
+        ring.append(34.0 + math.sin(i / 10))
+        sparkline_points(ring, 0.0, 0.0, 180.0, 30.0, points)
+        if line is not None:
+            line.points = points
+        worst = max(worst, time.perf_counter() - t0)
+    mean = (time.perf_counter() - start) / ticks
+    return mean * 1000, worst * 1000
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    line = make_line()
+    print(f"-- {ticks} ticks, Line.points {'included' if line is not None else 'skipped (no kivy)'}")
+    failed = False
+    # 10 min / 1 h @ 5 s, 1 h @ 1 s
+    for capacity in (120, 720, 3600):
+        mean_ms, worst_ms = bench(capacity, ticks, line)
+        print(f"capacity {capacity:>5}: mean {mean_ms:7.3f} ms   worst {worst_ms:7.3f} ms")
+        if capacity == 120 and mean_ms > BUDGET_MS:
+            failed = True
+    # Dashboard la 120 points (SPARKLINE_MINUTES=10, SENSOR_INTERVAL=5)
+    print("FAIL" if failed else "OK")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Telemetry store: insert throughput, storage size ani range-query latency.
+
+Ek zone, 1 sample/second, `days` divasancha data. Tulana sathi naive
+row-per-sample table (ek sample = ek SQLite row).
+
+    python benchmarks/bench_telemetry.py [days]
+"""
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fogger_db import DatabaseManager
+from fogger_telemetry import TelemetryBuffer, read_telemetry
+
+DAY = 24 * 60 * 60
+START = 1_700_000_000
+
+
+def samples(count, seed=1):
+    rng = random.Random(seed)
+    for i in range(count):
+        # Divas-ratri cha cycle + sensor noise
+        yield (START + i,
+               34.0 + 6.0 * math.sin(i * 2 * math.pi / DAY) + rng.gauss(0, 0.2),
+               62.0 - 8.0 * math.sin(i * 2 * math.pi / DAY) + rng.gauss(0, 0.5))
+
+
+def file_size(path):
+    return sum(os.path.getsize(path + ext) for ext in ('', '-wal') if os.path.exists(path + ext))
+
+
+def bench_blocks(tmp, count):
+    path = os.path.join(tmp, 'blocks.db')
+    db = DatabaseManager(path)
+    buffer = TelemetryBuffer(db, block_size=600, max_age_s=600)
+    start = time.perf_counter()
+    for ts, temperature, humidity in samples(count):
+        buffer.add(1, temperature, humidity, ts)
+    buffer.flush()
+    elapsed = time.perf_counter() - start
+    db.reclaim_space()
+    print(f"{'telemetry_block (600 / block)':<32} {count / elapsed:>10.0f} samples/sec"
+          f"  {file_size(path) / count:>6.2f} bytes/sample")
+    return db
+
+
+def bench_rows(tmp, count):
+    path = os.path.join(tmp, 'rows.db')
+    db = DatabaseManager(path)
+    conn = db._conn()
+    conn.execute('''
+        CREATE TABLE telemetry_row (
+            zone_id INTEGER NOT NULL, ts INTEGER NOT NULL,
+            temperature REAL, humidity REAL, PRIMARY KEY (zone_id, ts)
+        ) WITHOUT ROWID
+    ''')
+    start = time.perf_counter()
+    batch = []
+    for row in samples(count):
+        batch.append((1, *row))
+        if len(batch) == 600:
+            with conn:
+                conn.executemany('INSERT INTO telemetry_row VALUES (?, ?, ?, ?)', batch)
+            batch = []
+    with conn:
+        conn.executemany('INSERT INTO telemetry_row VALUES (?, ?, ?, ?)', batch)
+    elapsed = time.perf_counter() - start
+    db.reclaim_space()
+    print(f"{'row per sample (600 / commit)':<32} {count / elapsed:>10.0f} samples/sec"
+          f"  {file_size(path) / count:>6.2f} bytes/sample")
+    return db
+
+
+def time_query(fn, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    days = float(sys.argv[1]) if len(sys.argv) > 1 else 7
+    count = int(days * DAY)
+    print(f"-- {count} samples ({days:g} days @ 1 Hz, one zone)")
+    with tempfile.TemporaryDirectory() as tmp:
+        blocks = bench_blocks(tmp, count)
+        rows = bench_rows(tmp, count)
+        end = START + count
+        print("-- range query (newest data)")
+        for label, span in (("last hour", 3600), ("last day", DAY)):
+            ms_blocks, (ts, _, _) = time_query(
+                lambda: read_telemetry(blocks, 1, end - span, end))
+            ms_rows, result = time_query(lambda: rows._conn().execute(
+                'SELECT ts, temperature, humidity FROM telemetry_row '
+                'WHERE zone_id = 1 AND ts >= ? AND ts < ?', (end - span, end)).fetchall())
+            assert len(ts) == len(result) == span
+            print(f"{label:<10} blocks {ms_blocks:>8.2f} ms   rows {ms_rows:>8.2f} ms"
+                  f"   ({span} samples)")
+        # Ek varsh @ 1 Hz sathi andaj
+        per_sample = file_size(os.path.join(tmp, 'blocks.db')) / count
+        print(f"projected 1 year / zone: {per_sample * 365 * DAY / 2**20:.0f} MB (blocks)")
+        blocks.close()
+        rows.close()
+
+
+if __name__ == "__main__":
+    main()
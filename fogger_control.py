@@ -0,0 +1,626 @@
+import argparse
+import logging
+import signal
+import threading
+import time
+from collections import deque
+
+log = logging.getLogger(__name__)
+
+
+# ==========================================
+#  CONTROL CONFIG + SMOOTHING
+# ==========================================
+class ControlConfig:
+    """Auto mode che thresholds.
+
+    on_temp la motor ON, off_temp (<= on_temp) khali gelyavar OFF - madhla
+    band (hysteresis) noisy readings var motor thrash hou det nahi.
+    min_on_s / min_off_s: ekda badal zalyavar kiman kiti vel tasach rahaycha.
+    smoothing: None | 'ema' | 'sma' - decision smoothed temperature var hoto.
+    forecast_s: >0 asel tar pudhchya itkya seconds madhe on_temp cross hoil asa
+    forecast aala ki aadhich fogging suru (predictive pre-cooling); 0 = band.
+    """
+
+    def __init__(self, on_temp=40.0, off_temp=38.5, min_on_s=60, min_off_s=30,
+                 smoothing='ema', ema_alpha=0.3, sma_window=5,
+                 forecast_s=0, forecast_alpha=0.3, forecast_beta=0.05, forecast_min_rate=0.005):
+        if off_temp > on_temp:
+            raise ValueError("off_temp must be <= on_temp")
+        self.on_temp = on_temp
+        self.off_temp = off_temp
+        self.min_on_s = min_on_s
+        self.min_off_s = min_off_s
+        self.smoothing = smoothing
+        self.ema_alpha = ema_alpha
+        self.sma_window = sma_window
+        self.forecast_s = forecast_s
+        self.forecast_alpha = forecast_alpha
+        self.forecast_beta = forecast_beta
+        # Trend kiman itka (C/s) asel tarach pre-cool - halu vadh / noise var nahi
+        self.forecast_min_rate = forecast_min_rate
+
+    @classmethod
+    def legacy(cls, threshold=40.0):
+        """Juna behaviour: ekach threshold, dwell nahi, smoothing nahi"""
+        return cls(on_temp=threshold, off_temp=threshold, min_on_s=0, min_off_s=0, smoothing=None)
+
+    def make_forecaster(self):
+        if not self.forecast_s:
+            return None
+        return HoltForecaster(self.forecast_alpha, self.forecast_beta)
+
+    def make_filter(self):
+        if self.smoothing == 'ema':
+            return EmaFilter(self.ema_alpha)
+        if self.smoothing == 'sma':
+            return MovingAverage(self.sma_window)
+        if self.smoothing is None:
+            return None
+        raise ValueError(f"Unknown smoothing: {self.smoothing}")
+
+
+class EmaFilter:
+    """Exponential moving average - O(1), state ek float"""
+
+    def __init__(self, alpha):
+        self.alpha = alpha
+        self.value = None
+
+    def __call__(self, x):
+        if self.value is None:
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+class HoltForecaster:
+    """Holt linear trend (double exponential smoothing) - O(1) per sample.
+
+    Samples irregular interval ne yetat (adaptive sampling), mhanun trend
+    C/second madhe ani level prediction madhla dt pramane.
+    """
+
+    def __init__(self, alpha=0.3, beta=0.05, warmup=5):
+        self.alpha = alpha
+        self.beta = beta
+        self.warmup = warmup
+        self.level = None
+        self.trend = 0.0   # C / second
+        self.ts = None
+        self.samples = 0
+
+    def update(self, x, ts):
+        if self.level is None:
+            self.level, self.ts, self.samples = x, ts, 1
+            return
+        dt = ts - self.ts
+        if dt <= 0:
+            return
+        predicted = self.level + self.trend * dt
+        level = predicted + self.alpha * (x - predicted)
+        self.trend += self.beta * ((level - self.level) / dt - self.trend)
+        self.level, self.ts = level, ts
+        self.samples += 1
+
+    @property
+    def ready(self):
+        return self.samples >= self.warmup
+
+    def forecast(self, horizon_s):
+        """`horizon_s` seconds nantarcha andaj (warmup adhi None)"""
+        if not self.ready:
+            return None
+        return self.level + self.trend * horizon_s
+
+
+class MovingAverage:
+    """Shevatchya `window` samples cha simple average (running sum)"""
+
+    def __init__(self, window):
+        self._samples = deque(maxlen=window)
+        self._sum = 0.0
+
+    def __call__(self, x):
+        if len(self._samples) == self._samples.maxlen:
+            self._sum -= self._samples[0]
+        self._samples.append(x)
+        self._sum += x
+        return self._sum / len(self._samples)
+
+
+# ==========================================
+#  FOGGER CONTROLLER (UI-free)
+# ==========================================
+class FoggerController:
+    """Auto ON/OFF + manual control logic - Kivy / window shivay chalto.
+
+    `writer(status, temperature, humidity, duration_s, reason, zone_id)` history
+    event lihto (EventWriteBuffer.add kiva DatabaseManager.save_event).
+    State badalla ki subscribers na `fn(event, data)` call hoto:
+
+        'reading' - {'temperature', 'humidity'}
+        'motor'   - {'on', 'source' ('auto'/'manual'/'program'), 'reason', 'duration_s', 'temperature'}
+        'alert'   - {'level': 'hot', 'temperature', 'motor', 'wait_s', 'block'}  (threshold cross zala)
+
+    'alert' madhe `motor` sangto motor che kay zala: 'started' (ata auto ON),
+    'running' (aadhich chalu), 'deferred' (min_off_s dwell - `wait_s` nantar)
+    kiva 'blocked' (`block` program chalu, motor band rahil).
+    """
+
+    def __init__(self, writer=None, config=None, clock=time.time, zone_id=1):
+        self.writer = writer
+        self.zone_id = zone_id
+        self.config = config or ControlConfig()
+        self._clock = clock
+        self._filter = self.config.make_filter()
+        self._forecaster = self.config.make_forecaster()
+        self.temperature = None
+        self.humidity = None
+        self.control_temp = None  # Smoothed value - auto decision hyavar
+        self.motor_on = False
+        self.manual_mode = False  # Manual ON asel tar True
+        self.hot = False          # on_temp varti gelyavar True, off_temp khali False
+        self.forecast = None      # forecast_s nantarcha andaj
+        self.precool = False      # Forecast on_temp cross karnar - hot hoaycha aadhi ON
+        self.program = None       # Chalu 'fog' program che nav
+        self.program_id = None    # ...ani id (stop yachya varun match hoto, nav nahi)
+        self._blocks = {}         # Active 'block' programs: id -> nav
+        self.motor_start_ts = None
+        self.motor_stop_ts = None
+        self._listeners = []
+
+    # ---------- subscribers ----------
+    def subscribe(self, fn):
+        self._listeners.append(fn)
+        return fn
+
+    def unsubscribe(self, fn):
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    def _emit(self, event, **data):
+        for fn in list(self._listeners):
+            fn(event, data)
+
+    def state(self):
+        return {
+            'temperature': self.temperature,
+            'humidity': self.humidity,
+            'motor_on': self.motor_on,
+            'manual_mode': self.manual_mode,
+            'hot': self.hot,
+            'control_temp': self.control_temp,
+            'forecast': self.forecast,
+            'precool': self.precool,
+            'program': self.program,
+            'blocked': self.blocked,
+            'motor_start_ts': self.motor_start_ts,
+        }
+
+    @property
+    def blocked(self):
+        """Block program chalu - auto / program fogging nahi (manual chalto)"""
+        return bool(self._blocks)
+
+    # ---------- inputs ----------
+    def poll(self, source):
+        """SensorSource madhun latest reading gheun process kara"""
+        reading = source.read()
+        if reading is not None:
+            self.on_reading(reading.temperature, reading.humidity)
+        return reading
+
+    def on_reading(self, temperature, humidity):
+        self.temperature = round(float(temperature), 1)
+        self.humidity = round(float(humidity), 1)
+        self.control_temp = self._filter(self.temperature) if self._filter else self.temperature
+        now = self._clock()
+        if self._forecaster is not None:
+            self._forecaster.update(self.temperature, now)
+            self.forecast = self._forecaster.forecast(self.config.forecast_s)
+        self._emit('reading', temperature=self.temperature, humidity=self.humidity)
+
+        # Manual ON asel tar temperature kahi karnar nahi
+        if self.manual_mode:
+            return
+
+        cfg = self.config
+        # Hysteresis: on_temp la hot, off_temp khali gelyavarach normal
+        alert = False
+        if not self.hot and self.control_temp >= cfg.on_temp:
+            self.hot = True
+            alert = True
+        elif self.hot and self.control_temp < cfg.off_temp:
+            self.hot = False
+        # Predictive: forecast la pan tech hysteresis band
+        if self.forecast is None:
+            self.precool = False
+        elif (not self.precool and self.forecast >= cfg.on_temp
+              and self._forecaster.trend >= cfg.forecast_min_rate):
+            self.precool = True
+        elif self.precool and self.forecast < cfg.off_temp:
+            self.precool = False
+
+        # Block madhe temperature demand nahi; chalu fog program motor chalu thevto
+        auto_demand = (self.hot or self.precool) and not self.blocked
+        demand = auto_demand or self.program is not None
+        was_on = self.motor_on
+        if auto_demand and not self.motor_on:
+            # Auto: Motor AUTO ON (min_off_s dwell purn zalyavar)
+            if self.motor_stop_ts is None or now - self.motor_stop_ts >= cfg.min_off_s:
+                if self.hot:
+                    self._start('auto', f"Auto ON - Temperature {self.temperature} C Hot")
+                else:
+                    self._start('auto', (
+                        f"Predictive ON - Temperature {self.temperature} C, "
+                        f"forecast {self.forecast:.1f} C in {cfg.forecast_s:g}s"
+                    ))
+        elif not demand and self.motor_on:
+            # Auto: Motor AUTO OFF (min_on_s dwell purn zalyavar)
+            if now - self.motor_start_ts >= cfg.min_on_s:
+                self._stop('auto', f"Auto OFF - Temperature {self.temperature} C Normal")
+
+        if alert:
+            # Motor cha nirnay zalyavar alert - UI "Motor Chalu Zali" khotach sangu naye
+            wait_s = None
+            if self.blocked:
+                outcome = 'blocked'
+            elif was_on:
+                outcome = 'running'
+            elif self.motor_on:
+                outcome = 'started'
+            else:
+                outcome = 'deferred'
+                wait_s = max(0, int(cfg.min_off_s - (now - self.motor_stop_ts)))
+            self._emit('alert', level='hot', temperature=self.temperature, motor=outcome,
+                       wait_s=wait_s, block=next(iter(self._blocks.values()), None))
+
+    def manual_toggle(self):
+        """Admin button - motor ulta kara; return navin motor_on"""
+        if not self.motor_on:
+            self.manual_mode = True
+            self._start('manual', "Manual Start")
+        else:
+            self.manual_mode = False
+            self.hot = False  # Alert reset
+            self.precool = False
+            self.program = self.program_id = None
+            self._stop('manual', "Manual Stop")
+        return self.motor_on
+
+    # ---------- programs ----------
+    def program_start(self, program_id, name, duration_s):
+        """Fog program run suru; block / manual madhe ignore (return False)"""
+        if self.manual_mode or self.blocked:
+            return False
+        self.program = name
+        self.program_id = program_id
+        if not self.motor_on:
+            self._start('program', f"Program ON - {name} ({duration_s}s)")
+        else:
+            # Motor aadhich chalu (auto / pre-cool) - run history madhe nond, pan
+            # 'ON' nahi mhanun rollups madhe navin cycle mojli jat nahi
+            self._log("RUN", None, f"Program ON - {name} ({duration_s}s, motor already on)")
+        return True
+
+    def program_stop(self, program_id, name):
+        """Program run sampla - temperature la garaj nasel tar motor band"""
+        if self.program_id != program_id:
+            # Dusrya (kadachit tyach navachya) program ne run ghetla ahe
+            return
+        self.program = self.program_id = None
+        if self.motor_on and not self.manual_mode and not (
+                (self.hot or self.precool) and not self.blocked):
+            self._stop('program', f"Program OFF - {name}")
+
+    def set_block(self, program_id, name, active):
+        """Block window suru / samapt; suru hotana chalu auto / program motor band"""
+        if not active:
+            self._blocks.pop(program_id, None)
+            return
+        self._blocks[program_id] = name
+        self.program = self.program_id = None
+        if self.motor_on and not self.manual_mode:
+            self._stop('program', f"Blocked - {name}")
+
+    # ---------- motor ----------
+    def run_seconds(self):
+        """Motor kiti vel chalu ahe (seconds), band asel tar None"""
+        if self.motor_start_ts is None:
+            return None
+        return int(self._clock() - self.motor_start_ts)
+
+    def _start(self, source, reason):
+        self.motor_on = True
+        self.motor_start_ts = self._clock()
+        self._log("ON", None, reason)
+        self._emit('motor', on=True, source=source, reason=reason,
+                   duration_s=None, temperature=self.temperature)
+
+    def _stop(self, source, reason):
+        duration_s = self.run_seconds()
+        self.motor_on = False
+        self.motor_start_ts = None
+        self.motor_stop_ts = self._clock()
+        self._log("OFF", duration_s, reason)
+        self._emit('motor', on=False, source=source, reason=reason,
+                   duration_s=duration_s, temperature=self.temperature)
+
+    def _log(self, status, duration_s, reason):
+        if self.writer is not None:
+            self.writer(
+                status=status, temperature=self.temperature, humidity=self.humidity,
+                duration_s=duration_s, reason=reason, zone_id=self.zone_id,
+            )
+
+
+# ==========================================
+#  ADAPTIVE SAMPLING
+# ==========================================
+class AdaptiveSampler:
+    """Pudhcha sensor poll kevha - threshold javal / temperature vegane badalat
+    asel tar lavkar, stable asel tar halu, app background la asel tar aankhi halu.
+
+    Zone-wise decision: `near_band` C paryant threshold javal kiva
+    `fast_rate` C/s peksha vegvan badal (rate_window var) -> fast_s; 2 x near_band paryant ->
+    normal_s; baki slow_s. Background madhe kiman background_s, pan koni zone
+    threshold javal / motor ON asel tar normal_s.
+    """
+
+    def __init__(self, fast_s=1.0, normal_s=5.0, slow_s=15.0, background_s=60.0,
+                 near_band=1.0, fast_rate=0.02, rate_window=60.0, clock=time.monotonic):
+        self.fast_s = fast_s
+        self.normal_s = normal_s
+        self.slow_s = slow_s
+        self.background_s = background_s
+        self.near_band = near_band
+        self.fast_rate = fast_rate
+        # Rate kiman itkya seconds var - 1 s madhla sensor noise "fast change" disu naye
+        self.rate_window = rate_window
+        self._clock = clock
+        self._anchor = {}  # zone_id -> (control_temp, ts) rate window chi suruvat
+        self._rate = {}    # zone_id -> shevatcha C/s
+
+    def zone_rate(self, zone_id, temp, now):
+        """Shevatchya purn rate_window madhla badal (C/s)"""
+        anchor = self._anchor.get(zone_id)
+        if anchor is None:
+            self._anchor[zone_id] = (temp, now)
+            return 0.0
+        elapsed = now - anchor[1]
+        if elapsed >= self.rate_window:
+            self._rate[zone_id] = abs(temp - anchor[0]) / elapsed
+            self._anchor[zone_id] = (temp, now)
+        return self._rate.get(zone_id, 0.0)
+
+    def zone_interval(self, zone_id, controller):
+        """Ya zone la hava asalela interval (seconds)"""
+        temp = controller.control_temp
+        if temp is None:
+            return self.fast_s
+        rate = self.zone_rate(zone_id, temp, self._clock())
+        if controller.manual_mode:
+            return self.normal_s
+        cfg = controller.config
+        # Hot asel tar off_temp kade, nahitar on_temp kade kiti antar
+        margin = temp - cfg.off_temp if controller.hot else cfg.on_temp - temp
+        if margin <= self.near_band or rate >= self.fast_rate:
+            return self.fast_s
+        if controller.motor_on or margin <= 2 * self.near_band:
+            return self.normal_s
+        return self.slow_s
+
+    def interval(self, zones, background=False):
+        """Sagle zones madhla sarvat lahan interval - ekach timer sathi"""
+        wanted = min(
+            (self.zone_interval(zone.zone_id, zone.controller) for zone in zones),
+            default=self.slow_s,
+        )
+        if background:
+            return self.normal_s if wanted < self.slow_s else max(wanted, self.background_s)
+        return wanted
+
+    def forget(self, zone_id):
+        self._anchor.pop(zone_id, None)
+        self._rate.pop(zone_id, None)
+
+
+# ==========================================
+#  ZONES + SCHEDULER
+# ==========================================
+class Zone:
+    """Ek fogger: swatacha sensor, controller ani thresholds"""
+
+    def __init__(self, zone_id, name, controller, source):
+        self.zone_id = zone_id
+        self.name = name
+        self.controller = controller
+        self.source = source
+
+    @classmethod
+    def from_row(cls, row, writer=None, default_sensor='sim', clock=time.time):
+        """DatabaseManager.get_zones() row -> Zone (sensor start kela nahi)"""
+        from fogger_sensors import sensor_from_spec
+
+        zone_id, name, on_temp, off_temp, min_on_s, min_off_s, smoothing, forecast_s, sensor, _ = row
+        config = ControlConfig(on_temp=on_temp, off_temp=off_temp,
+                               min_on_s=min_on_s, min_off_s=min_off_s,
+                               smoothing=smoothing or None, forecast_s=forecast_s or 0)
+        controller = FoggerController(writer=writer, config=config, clock=clock, zone_id=zone_id)
+        return cls(zone_id, name, controller, sensor_from_spec(sensor or default_sensor))
+
+
+class ZoneScheduler:
+    """Sagle zones eka timer madhun poll karto (zone-wise timers nahit).
+
+    UI la pratyek reading var redraw karayla nako - `drain_changed()` shevatchya
+    call pasun jyancha state badlala te zone ids deto, mhanun 100+ zones
+    asle tari fakt badalleli rows update hotat.
+    """
+
+    def __init__(self, zones=(), sampler=None):
+        self.zones = {}
+        self.sampler = sampler
+        self._changed = set()
+        for zone in zones:
+            self.add(zone)
+
+    def __len__(self):
+        return len(self.zones)
+
+    def __iter__(self):
+        return iter(self.zones.values())
+
+    def get(self, zone_id):
+        return self.zones.get(zone_id)
+
+    def add(self, zone):
+        self.zones[zone.zone_id] = zone
+        zone.controller.subscribe(
+            lambda event, data, zone_id=zone.zone_id: self._changed.add(zone_id)
+        )
+        self._changed.add(zone.zone_id)
+        return zone
+
+    def remove(self, zone_id):
+        zone = self.zones.pop(zone_id, None)
+        if zone is not None:
+            zone.source.stop()
+            self._changed.discard(zone_id)
+            if self.sampler is not None:
+                self.sampler.forget(zone_id)
+        return zone
+
+    def start(self):
+        for zone in self.zones.values():
+            zone.source.start()
+        return self
+
+    def stop(self):
+        for zone in self.zones.values():
+            zone.source.stop()
+
+    def tick(self, *args):
+        """Ek pass: pratyek zone cha sensor vacha ani controller chalva"""
+        for zone in list(self.zones.values()):
+            try:
+                zone.controller.poll(zone.source)
+            except Exception:
+                log.exception("zone %s tick failed", zone.zone_id)
+
+    def next_interval(self, background=False, default=5.0):
+        """Pudhcha tick kiti seconds nantar (sampler nasel tar `default`)"""
+        if self.sampler is None:
+            return default
+        return self.sampler.interval(self.zones.values(), background)
+
+    def drain_changed(self):
+        changed, self._changed = self._changed, set()
+        return changed
+
+
+# ==========================================
+#  HEADLESS SERVICE
+# ==========================================
+def run_headless(tick, interval=1.0, stop_event=None):
+    """Display shivay control loop - gateway / daemon sathi.
+
+    `interval` seconds kiva callable (pratyek tick nantar pudhcha interval deto).
+    """
+    stop_event = stop_event or threading.Event()
+    next_tick = time.monotonic()
+    while not stop_event.is_set():
+        try:
+            tick()
+        except Exception:
+            log.exception("control tick failed")
+        next_tick += interval() if callable(interval) else interval
+        stop_event.wait(max(0.0, next_tick - time.monotonic()))
+
+
+def main(argv=None):
+    from fogger_db import DatabaseManager, DBWorker, EventWriteBuffer
+    from fogger_programs import ProgramScheduler
+
+    parser = argparse.ArgumentParser(description="Auto Fogger headless controller")
+    parser.add_argument('--db', default=None, help="SQLite file (default: auto_fogger.db)")
+    parser.add_argument('--sensor', default='sim',
+                        help="sensor nasnarya zones sathi: sim | trace:<csv> | serial:<port>[@baud]")
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between samples")
+    parser.add_argument('--adaptive', action='store_true',
+                        help="threshold javal fast, stable asel tar slow sampling (--interval = fast)")
+    parser.add_argument('--zone', type=int, action='append', default=None,
+                        help="fakt ha zone chalva (parat deta yeto); default sagle enabled zones")
+    # Dilya tar zones table madhlya thresholds var override
+    parser.add_argument('--on-temp', type=float, default=None, help="auto ON temperature (C)")
+    parser.add_argument('--off-temp', type=float, default=None, help="auto OFF temperature (C)")
+    parser.add_argument('--min-on', type=float, default=None, help="minimum ON time (s)")
+    parser.add_argument('--min-off', type=float, default=None, help="minimum OFF time (s)")
+    parser.add_argument('--smoothing', choices=('ema', 'sma', 'none'), default=None)
+    parser.add_argument('--forecast', type=float, default=None,
+                        help="predictive pre-cooling horizon (s), 0 = band")
+    args = parser.parse_args(argv)
+    overrides = {
+        'on_temp': args.on_temp, 'off_temp': args.off_temp,
+        'min_on_s': args.min_on, 'min_off_s': args.min_off,
+        # '' = smoothing band (Zone.from_row '' la None samajto)
+        'smoothing': '' if args.smoothing == 'none' else args.smoothing,
+        'forecast_s': args.forecast,
+    }
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    db = DatabaseManager(args.db)
+    # Timed flushes ekach worker thread var - pratyek Timer thread la navin connection nahi
+    worker = DBWorker(db)
+    worker.start()
+    buffer = EventWriteBuffer(db, worker)
+    sampler = AdaptiveSampler(fast_s=args.interval) if args.adaptive else None
+    scheduler = ZoneScheduler(sampler=sampler)
+    for row in db.get_zones(enabled_only=True):
+        if args.zone and row[0] not in args.zone:
+            continue
+        zone_id, name, *settings, sensor, enabled = row
+        settings = [
+            value if overrides[field] is None else overrides[field]
+            for field, value in zip(
+                ('on_temp', 'off_temp', 'min_on_s', 'min_off_s', 'smoothing', 'forecast_s'), settings)
+        ]
+        row = (zone_id, name, *settings, sensor, enabled)
+        zone = scheduler.add(Zone.from_row(row, writer=buffer.add, default_sensor=args.sensor))
+        zone.controller.subscribe(
+            lambda event, data, name=zone.name: log.info(
+                "%s: motor %s (%s)", name, "ON" if data['on'] else "OFF", data['reason'])
+            if event == 'motor' else None
+        )
+    scheduler.start()
+    programs = ProgramScheduler(scheduler)
+    programs.load(db.get_programs(enabled_only=True))
+
+    def tick():
+        programs.poll()
+        scheduler.tick()
+
+    def next_interval():
+        # Sampler interval kiva pudhcha program trigger - je aadhi
+        interval = scheduler.next_interval(default=args.interval)
+        until_program = programs.seconds_until_next()
+        return interval if until_program is None else min(interval, max(until_program, 0.1))
+
+    stop_event = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *a: stop_event.set())
+    log.info("controller running: %d zone(s), %d program(s), interval=%ss%s", len(scheduler),
+             len(programs.programs), args.interval, " (adaptive)" if sampler else "")
+    try:
+        run_headless(tick, next_interval, stop_event)
+    finally:
+        scheduler.stop()
+        buffer.close()
+        worker.stop()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
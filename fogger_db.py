@@ -0,0 +1,1244 @@
+import atexit
+import logging
+import os
+import queue
+import re
+import shutil
+import sqlite3
+import threading
+from datetime import datetime
+
+log = logging.getLogger(__name__)
+
+
+DB_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'auto_fogger.db'
+)
+
+# PRAGMAs applied to every connection the pool opens.
+# WAL + synchronous=NORMAL means one fsync per checkpoint instead of per commit.
+DEFAULT_PRAGMAS = {
+    # Navin DB file sathi; juni file fakt `python fogger_db.py compact` ne convert hote
+    'auto_vacuum': 'INCREMENTAL',
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 32 * 1024 * 1024,
+    'cache_size': -4000,        # negative = KiB, so ~4 MB page cache
+    'temp_store': 'MEMORY',
+}
+
+
+# History read queries he columns ya kramane return kartat
+EVENT_COLUMNS = "id, zone_id, status, temperature, humidity, duration_s, reason, created_ts"
+
+# Juna single-fogger setup ha zone 1
+DEFAULT_ZONE_ID = 1
+
+# get_zones() / get_zone() rows he columns ya kramane
+ZONE_COLUMNS = (
+    "id, name, on_temp, off_temp, min_on_s, min_off_s, smoothing, forecast_s, sensor, enabled"
+)
+
+# get_programs() rows
+PROGRAM_COLUMNS = (
+    "id, zone_id, name, kind, start_min, end_min, every_min, duration_s, days, enabled"
+)
+
+
+def event_row(status, temperature, humidity, duration_s, reason, when=None,
+              zone_id=DEFAULT_ZONE_ID):
+    """history table sathi ek INSERT row (timestamp event veli capture hoto).
+
+    duration_s integer seconds (kiva None); date/time display formatting UI karto.
+    """
+    when = when or datetime.now()
+    return (
+        status, temperature, humidity, duration_s, reason,
+        int(when.timestamp()),
+        when.strftime("%Y-%m-%d %H:%M:%S"),
+        zone_id,
+    )
+
+
+# ==========================================
+#  SCHEMA MIGRATIONS
+# ==========================================
+def _migration_1_base(conn):
+    """Original schema (juni auto_fogger.db madhe already asel)"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            status TEXT NOT NULL,
+            temperature REAL,
+            humidity REAL,
+            duration TEXT,
+            reason TEXT,
+            date TEXT,
+            time TEXT,
+            created_at TEXT
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL,
+            role TEXT NOT NULL
+        )
+    ''')
+    # Default admin insert kara
+    if conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0:
+        conn.execute("INSERT INTO users (name, email, password, role) VALUES (?, ?, ?, ?)",
+                     ("Admin", "admin@fogger.com", "admin123", "admin"))
+
+
+def _migration_2_typed_timestamps(conn):
+    """Epoch timestamp + integer duration columns, time/status indexes"""
+    conn.execute("ALTER TABLE history ADD COLUMN created_ts INTEGER")
+    conn.execute("ALTER TABLE history ADD COLUMN duration_s INTEGER")
+    # created_at local time madhe ahe -> 'utc' modifier ne epoch
+    conn.execute('''
+        UPDATE history
+        SET created_ts = CAST(strftime('%s', created_at, 'utc') AS INTEGER)
+        WHERE created_at IS NOT NULL
+    ''')
+    # "3m 12s" -> 192
+    conn.execute('''
+        UPDATE history
+        SET duration_s = CAST(substr(duration, 1, instr(duration, 'm') - 1) AS INTEGER) * 60
+                       + CAST(rtrim(substr(duration, instr(duration, 'm') + 2), 's') AS INTEGER)
+        WHERE duration GLOB '*m *s'
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_history_created ON history (created_ts)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_history_status_created ON history (status, created_ts)")
+
+
+def _migration_3_row_counter(conn):
+    """history row count ek row madhe - triggers ne maintain, COUNT(*) scan nahi"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS history_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            row_count INTEGER NOT NULL
+        )
+    ''')
+    conn.execute('''
+        INSERT OR REPLACE INTO history_stats (id, row_count)
+        SELECT 1, COUNT(*) FROM history
+    ''')
+    # Triggers mule app baher che writes (sqlite3 shell, sync tools) pan count madhe yetat
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_history_count_ins AFTER INSERT ON history
+        BEGIN
+            UPDATE history_stats SET row_count = row_count + 1 WHERE id = 1;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_history_count_del AFTER DELETE ON history
+        BEGIN
+            UPDATE history_stats SET row_count = row_count - 1 WHERE id = 1;
+        END
+    ''')
+
+
+# Local-time bucket start (epoch) - IST sarkhya :30 offsets sathi pan barobar
+ROLLUP_PERIODS = ('hour', 'day', 'week')
+
+
+def _bucket_sql(period, col):
+    local = f"datetime({col}, 'unixepoch', 'localtime')"
+    if period == 'hour':
+        return f"CAST(strftime('%s', strftime('%Y-%m-%d %H:00:00', {local}), 'utc') AS INTEGER)"
+    if period == 'day':
+        return f"CAST(strftime('%s', {local}, 'start of day', 'utc') AS INTEGER)"
+    # Week Monday pasun suru
+    return f"CAST(strftime('%s', {local}, 'start of day', '-6 days', 'weekday 1', 'utc') AS INTEGER)"
+
+
+# Ek history row rollup madhe kasa jato (alias h)
+_ROLLUP_MEASURES = '''
+    COUNT(*),
+    SUM(h.status = 'ON'),
+    SUM(CASE WHEN h.status = 'OFF' THEN COALESCE(h.duration_s, 0) ELSE 0 END),
+    SUM(h.status = 'ON' AND h.reason LIKE 'Auto ON%'),
+    SUM(CASE WHEN h.status = 'ON' AND h.reason LIKE 'Auto ON%' THEN h.temperature ELSE 0 END),
+    SUM(COALESCE(h.temperature, 0)),
+    COUNT(h.temperature),
+    SUM(COALESCE(h.humidity, 0)),
+    COUNT(h.humidity)
+'''
+
+_ROLLUP_COLUMNS = '''
+    period, bucket_ts, events, cycles, on_seconds, auto_on, auto_on_temp_sum,
+    temp_sum, temp_n, humidity_sum, humidity_n
+'''
+
+
+def _migration_4_rollups(conn):
+    """Hourly/daily/weekly summary table - history insert trigger incrementally update karto"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS history_rollup (
+            period TEXT NOT NULL,
+            bucket_ts INTEGER NOT NULL,
+            events INTEGER NOT NULL DEFAULT 0,
+            cycles INTEGER NOT NULL DEFAULT 0,
+            on_seconds INTEGER NOT NULL DEFAULT 0,
+            auto_on INTEGER NOT NULL DEFAULT 0,
+            auto_on_temp_sum REAL NOT NULL DEFAULT 0,
+            temp_sum REAL NOT NULL DEFAULT 0,
+            temp_n INTEGER NOT NULL DEFAULT 0,
+            humidity_sum REAL NOT NULL DEFAULT 0,
+            humidity_n INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (period, bucket_ts)
+        ) WITHOUT ROWID
+    ''')
+    # Existing rows cha backfill
+    for period in ROLLUP_PERIODS:
+        conn.execute(f'''
+            INSERT OR REPLACE INTO history_rollup ({_ROLLUP_COLUMNS})
+            SELECT '{period}', {_bucket_sql(period, 'h.created_ts')} AS bucket, {_ROLLUP_MEASURES}
+            FROM history h WHERE h.created_ts IS NOT NULL
+            GROUP BY bucket
+        ''')
+    # Fakt INSERT var - retention ne raw rows delete kele tari rollups rahtat
+    buckets = " UNION ALL ".join(
+        f"SELECT '{period}' AS period, {_bucket_sql(period, 'NEW.created_ts')} AS bucket_ts"
+        for period in ROLLUP_PERIODS
+    )
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_history_rollup AFTER INSERT ON history
+        WHEN NEW.created_ts IS NOT NULL
+        BEGIN
+            INSERT INTO history_rollup ({_ROLLUP_COLUMNS})
+            SELECT b.period, b.bucket_ts, {_ROLLUP_MEASURES}
+            FROM ({buckets}) b, (SELECT NEW.status AS status, NEW.duration_s AS duration_s,
+                                        NEW.reason AS reason, NEW.temperature AS temperature,
+                                        NEW.humidity AS humidity) h
+            WHERE 1
+            GROUP BY b.period
+            ON CONFLICT (period, bucket_ts) DO UPDATE SET
+                events = events + excluded.events,
+                cycles = cycles + excluded.cycles,
+                on_seconds = on_seconds + excluded.on_seconds,
+                auto_on = auto_on + excluded.auto_on,
+                auto_on_temp_sum = auto_on_temp_sum + excluded.auto_on_temp_sum,
+                temp_sum = temp_sum + excluded.temp_sum,
+                temp_n = temp_n + excluded.temp_n,
+                humidity_sum = humidity_sum + excluded.humidity_sum,
+                humidity_n = humidity_n + excluded.humidity_n;
+        END
+    ''')
+
+
+def _migration_5_zones(conn):
+    """Zones table (per-zone thresholds + sensor), history.zone_id, per-zone rollups"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS zones (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            on_temp REAL NOT NULL DEFAULT 40.0,
+            off_temp REAL NOT NULL DEFAULT 38.5,
+            min_on_s INTEGER NOT NULL DEFAULT 60,
+            min_off_s INTEGER NOT NULL DEFAULT 30,
+            smoothing TEXT DEFAULT 'ema',
+            sensor TEXT,
+            enabled INTEGER NOT NULL DEFAULT 1,
+            CHECK (off_temp <= on_temp)
+        )
+    ''')
+    conn.execute("INSERT OR IGNORE INTO zones (id, name) VALUES (?, 'Main')", (DEFAULT_ZONE_ID,))
+    # Juni sagli history zone 1 chi
+    conn.execute(f"ALTER TABLE history ADD COLUMN zone_id INTEGER NOT NULL DEFAULT {DEFAULT_ZONE_ID}")
+    # Per-zone keyset pagination (zone_id = ?, id < ? ORDER BY id DESC)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_history_zone ON history (zone_id, id)")
+
+    # Rollup primary key madhe zone_id - juna data (raw purge zalela asla tari) zone 1 la
+    conn.execute("DROP TRIGGER IF EXISTS trg_history_rollup")
+    conn.execute("ALTER TABLE history_rollup RENAME TO history_rollup_v4")
+    conn.execute('''
+        CREATE TABLE history_rollup (
+            zone_id INTEGER NOT NULL,
+            period TEXT NOT NULL,
+            bucket_ts INTEGER NOT NULL,
+            events INTEGER NOT NULL DEFAULT 0,
+            cycles INTEGER NOT NULL DEFAULT 0,
+            on_seconds INTEGER NOT NULL DEFAULT 0,
+            auto_on INTEGER NOT NULL DEFAULT 0,
+            auto_on_temp_sum REAL NOT NULL DEFAULT 0,
+            temp_sum REAL NOT NULL DEFAULT 0,
+            temp_n INTEGER NOT NULL DEFAULT 0,
+            humidity_sum REAL NOT NULL DEFAULT 0,
+            humidity_n INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (zone_id, period, bucket_ts)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute(f'''
+        INSERT INTO history_rollup (zone_id, {_ROLLUP_COLUMNS})
+        SELECT {DEFAULT_ZONE_ID}, {_ROLLUP_COLUMNS} FROM history_rollup_v4
+    ''')
+    conn.execute("DROP TABLE history_rollup_v4")
+    # All-zones summary (StatsScreen default) sathi
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_rollup_period_bucket ON history_rollup (period, bucket_ts)")
+    buckets = " UNION ALL ".join(
+        f"SELECT '{period}' AS period, {_bucket_sql(period, 'NEW.created_ts')} AS bucket_ts"
+        for period in ROLLUP_PERIODS
+    )
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_history_rollup AFTER INSERT ON history
+        WHEN NEW.created_ts IS NOT NULL
+        BEGIN
+            INSERT INTO history_rollup (zone_id, {_ROLLUP_COLUMNS})
+            SELECT NEW.zone_id, b.period, b.bucket_ts, {_ROLLUP_MEASURES}
+            FROM ({buckets}) b, (SELECT NEW.status AS status, NEW.duration_s AS duration_s,
+                                        NEW.reason AS reason, NEW.temperature AS temperature,
+                                        NEW.humidity AS humidity) h
+            WHERE 1
+            GROUP BY b.period
+            ON CONFLICT (zone_id, period, bucket_ts) DO UPDATE SET
+                events = events + excluded.events,
+                cycles = cycles + excluded.cycles,
+                on_seconds = on_seconds + excluded.on_seconds,
+                auto_on = auto_on + excluded.auto_on,
+                auto_on_temp_sum = auto_on_temp_sum + excluded.auto_on_temp_sum,
+                temp_sum = temp_sum + excluded.temp_sum,
+                temp_n = temp_n + excluded.temp_n,
+                humidity_sum = humidity_sum + excluded.humidity_sum,
+                humidity_n = humidity_n + excluded.humidity_n;
+        END
+    ''')
+
+
+def _migration_6_telemetry(conn):
+    """Pratyek sensor sample - zone-wise compressed blocks (fogger_telemetry encode karto)"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS telemetry_block (
+            id INTEGER PRIMARY KEY,
+            zone_id INTEGER NOT NULL,
+            start_ts INTEGER NOT NULL,
+            end_ts INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            data BLOB NOT NULL
+        )
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_telemetry_zone_start
+        ON telemetry_block (zone_id, start_ts, end_ts)
+    ''')
+    # Retention sathi (sagle zones ekach cutoff)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_telemetry_end ON telemetry_block (end_ts)")
+
+
+def _migration_7_forecast(conn):
+    """Per-zone predictive pre-cooling horizon (seconds, 0 = fakt reactive)"""
+    conn.execute("ALTER TABLE zones ADD COLUMN forecast_s INTEGER NOT NULL DEFAULT 120")
+
+
+def _migration_8_programs(conn):
+    """Time-of-day programs: 'fog' (window madhe dar every_min la duration_s)
+    ani 'block' (window madhe auto fogging band). zone_id NULL = sagle zones,
+    days = weekday bitmask (Monday = bit 0)."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS programs (
+            id INTEGER PRIMARY KEY,
+            zone_id INTEGER,
+            name TEXT NOT NULL,
+            kind TEXT NOT NULL CHECK (kind IN ('fog', 'block')),
+            start_min INTEGER NOT NULL CHECK (start_min BETWEEN 0 AND 1439),
+            end_min INTEGER NOT NULL CHECK (end_min BETWEEN 0 AND 1440),
+            every_min INTEGER CHECK (every_min IS NULL OR every_min > 0),
+            duration_s INTEGER CHECK (duration_s IS NULL OR duration_s > 0),
+            days INTEGER NOT NULL DEFAULT 127,
+            enabled INTEGER NOT NULL DEFAULT 1,
+            CHECK (kind = 'block' OR duration_s IS NOT NULL)
+        )
+    ''')
+
+
+# Reason prefix -> history.kind (History filters sathi)
+EVENT_KINDS = ('auto', 'predictive', 'manual', 'program', 'other')
+
+
+def _migration_9_history_search(conn):
+    """History filters: reason cha prakar (kind) ani reason var FTS5 search.
+
+    kind VIRTUAL generated column ahe - writers badlat nahit ani juni rows pan
+    lagech classify hotat. FTS5 build madhe nasel tar search LIKE var chalto.
+    """
+    conn.execute('''
+        ALTER TABLE history ADD COLUMN kind TEXT GENERATED ALWAYS AS (
+            CASE
+                WHEN reason LIKE 'Auto %' THEN 'auto'
+                WHEN reason LIKE 'Predictive %' THEN 'predictive'
+                WHEN reason LIKE 'Manual %' THEN 'manual'
+                WHEN reason LIKE 'Program %' OR reason LIKE 'Blocked %' THEN 'program'
+                ELSE 'other'
+            END
+        ) VIRTUAL
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_history_kind ON history (kind, created_ts)")
+    try:
+        conn.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+                reason, content='history', content_rowid='id'
+            )
+        ''')
+    except sqlite3.OperationalError:
+        log.warning("SQLite built without FTS5 - history search uses LIKE")
+        return
+    conn.execute("INSERT INTO history_fts (history_fts) VALUES ('rebuild')")
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_history_fts_ins AFTER INSERT ON history
+        BEGIN
+            INSERT INTO history_fts (rowid, reason) VALUES (NEW.id, NEW.reason);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_history_fts_del AFTER DELETE ON history
+        BEGIN
+            INSERT INTO history_fts (history_fts, rowid, reason)
+            VALUES ('delete', OLD.id, OLD.reason);
+        END
+    ''')
+
+
+# user_version = ya list madhli shevatchi applied migration
+MIGRATIONS = [
+    _migration_1_base,
+    _migration_2_typed_timestamps,
+    _migration_3_row_counter,
+    _migration_4_rollups,
+    _migration_5_zones,
+    _migration_6_telemetry,
+    _migration_7_forecast,
+    _migration_8_programs,
+    _migration_9_history_search,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def migrate(conn):
+    """PRAGMA user_version pasun pudhchya sagle migrations apply kara.
+
+    Pratyek migration swatachya transaction madhe chalte, mhanun madhech fail
+    zala tari DB aadhichya version var rahto.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for target, migration in enumerate(MIGRATIONS, start=1):
+        if version >= target:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {target}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        log.info("history DB migrated to schema v%d", target)
+    return max(version, SCHEMA_VERSION)
+
+
+def _like_escape(text):
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+# ==========================================
+#  CONNECTION MANAGER
+# ==========================================
+class ConnectionManager:
+    """Keeps one long-lived SQLite connection per thread"""
+
+    def __init__(self, db_path, pragmas=None):
+        self.db_path = db_path
+        self.pragmas = dict(DEFAULT_PRAGMAS)
+        if pragmas:
+            self.pragmas.update(pragmas)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conns = []
+        self._shared = None
+        self._closed = False
+
+    @property
+    def is_memory(self):
+        return self.db_path == ':memory:'
+
+    def get(self):
+        """Current thread chi connection return kara (first time open kara)"""
+        if self._closed:
+            raise sqlite3.ProgrammingError("ConnectionManager is closed")
+        # ':memory:' DB per-connection asto, mhanun sagle threads ek connection share kartat
+        if self.is_memory:
+            with self._lock:
+                if self._shared is None:
+                    self._shared = self._open()
+                    self._conns.append(self._shared)
+                return self._shared
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    def _open(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for name, value in self.pragmas.items():
+            if value is None:
+                continue
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    def release(self):
+        """Current thread chi connection close kara (short-lived threads sathi)"""
+        if self.is_memory:
+            return
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._lock:
+            if conn in self._conns:
+                self._conns.remove(conn)
+        conn.close()
+
+    def close_all(self):
+        with self._lock:
+            self._closed = True
+            conns, self._conns = self._conns, []
+            self._shared = None
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+# ==========================================
+#  DATABASE MANAGER
+# ==========================================
+class DatabaseManager:
+    def __init__(self, db_path=None, pragmas=None, defer_migrate=False):
+        self.db_path = db_path or DB_PATH
+        self.pool = ConnectionManager(self.db_path, pragmas)
+        self.schema_version = None
+        self._fts = None
+        # History rows delete zale ki vadhto - UI la incremental view taku kalta
+        self.history_generation = 0
+        # defer_migrate=True: file open / DDL startup la nahi - pahila DBWorker
+        # job ensure_schema() asla pahije
+        if not defer_migrate:
+            self.ensure_schema()
+
+    def ensure_schema(self):
+        """Baki migrations ekdach chalva; schema version return kara"""
+        if self.schema_version is None:
+            self.schema_version = migrate(self._conn())
+        return self.schema_version
+
+    def _conn(self):
+        return self.pool.get()
+
+    def close(self):
+        """App stop hotana sagle connections close kara"""
+        self.pool.close_all()
+
+    def check_login(self, email, password):
+        """Email + password ne login check kara"""
+        row = self._conn().execute(
+            "SELECT name, role FROM users WHERE email=? AND password=?",
+            (email, password)
+        ).fetchone()
+        return row if row else None
+
+    def get_all_users(self):
+        return self._conn().execute(
+            "SELECT id, name, email, role FROM users ORDER BY id"
+        ).fetchall()
+
+    def add_user(self, name, email, password, role):
+        try:
+            conn = self._conn()
+            with conn:
+                conn.execute("INSERT INTO users (name, email, password, role) VALUES (?, ?, ?, ?)",
+                             (name, email, password, role))
+            return True
+        except sqlite3.Error:
+            return False
+
+    def delete_user(self, email):
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM users WHERE email=? AND email != 'admin@fogger.com'",
+                         (email,))
+
+    def save_event(self, status, temperature, humidity, duration_s, reason,
+                   zone_id=DEFAULT_ZONE_ID):
+        self.save_events([event_row(status, temperature, humidity, duration_s, reason,
+                                    zone_id=zone_id)])
+
+    def save_events(self, rows):
+        """event_row() tuples ek transaction madhe insert kara (group commit)"""
+        conn = self._conn()
+        with conn:
+            conn.executemany('''
+                INSERT INTO history
+                (status, temperature, humidity, duration_s, reason, created_ts, created_at, zone_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+        return len(rows)
+
+    def get_all_events(self):
+        return self._conn().execute(f'''
+            SELECT {EVENT_COLUMNS}
+            FROM history ORDER BY id DESC LIMIT 50000
+        ''').fetchall()
+
+    def get_events_page(self, before_id=None, limit=50, zone_id=None):
+        """Keyset pagination - id < before_id, newest first (OFFSET scan nahi)"""
+        where, params = [], []
+        if before_id is not None:
+            where.append('id < ?')
+            params.append(before_id)
+        if zone_id is not None:
+            where.append('zone_id = ?')
+            params.append(zone_id)
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ''
+        return self._conn().execute(f'''
+            SELECT {EVENT_COLUMNS}
+            FROM history {where_sql} ORDER BY id DESC LIMIT ?
+        ''', (*params, limit)).fetchall()
+
+    def get_events_since(self, after_id, limit=500, zone_id=None):
+        """Change feed: id > after_id, newest first.
+
+        `limit` rows parat aale tar madhe ajun asu shaktat - caller ne purn
+        reload karava. history_generation badalla asel tar after_id nirarthak.
+        """
+        where, params = ['id > ?'], [after_id]
+        if zone_id is not None:
+            where.append('zone_id = ?')
+            params.append(zone_id)
+        return self._conn().execute(f'''
+            SELECT {EVENT_COLUMNS}
+            FROM history WHERE {' AND '.join(where)} ORDER BY id DESC LIMIT ?
+        ''', (*params, limit)).fetchall()
+
+    def search_events(self, before_id=None, limit=50, text=None, since_ts=None, until_ts=None,
+                      status=None, kind=None, min_temp=None, max_temp=None, zone_id=None):
+        """Filtered history - get_events_page sarkhech rows ani keyset pagination.
+
+        Sagle filters SQL madhe (kind / created_ts / status indexes). `text`
+        FTS5 MATCH ne (pratyek shabda prefix), FTS nasel tar reason LIKE.
+        """
+        where, params = [], []
+
+        def cond(clause, *values):
+            where.append(clause)
+            params.extend(values)
+
+        terms = re.findall(r'\w+', text or '')
+        fts = bool(terms) and self._has_fts()
+        # FTS asel tar history_fts.rowid var order / keyset - FTS5 index
+        # newest-first deto ani LIMIT la thambto (sagle matches sort nahi)
+        key = 'history_fts.rowid' if fts else 'h.id'
+        if before_id is not None:
+            cond(f'{key} < ?', before_id)
+        if since_ts is not None:
+            cond('h.created_ts >= ?', since_ts)
+        if until_ts is not None:
+            cond('h.created_ts < ?', until_ts)
+        if status is not None:
+            cond('h.status = ?', status)
+        if kind is not None:
+            cond('h.kind = ?', kind)
+        if min_temp is not None:
+            cond('h.temperature >= ?', min_temp)
+        if max_temp is not None:
+            cond('h.temperature <= ?', max_temp)
+        if zone_id is not None:
+            cond('h.zone_id = ?', zone_id)
+        if fts:
+            # Quoted terms - user input FTS syntax mhanun parse hot nahi
+            cond('history_fts MATCH ?', ' '.join(f'"{term}"*' for term in terms))
+        else:
+            for term in terms:
+                cond("h.reason LIKE ? ESCAPE '\\'", f"%{_like_escape(term)}%")
+        columns = ', '.join(f'h.{c}' for c in EVENT_COLUMNS.split(', '))
+        source = ('history_fts JOIN history h ON h.id = history_fts.rowid'
+                  if fts else 'history h')
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ''
+        return self._conn().execute(f'''
+            SELECT {columns} FROM {source} {where_sql} ORDER BY {key} DESC LIMIT ?
+        ''', (*params, limit)).fetchall()
+
+    def _has_fts(self):
+        if self._fts is None:
+            self._fts = self._conn().execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'history_fts'"
+            ).fetchone() is not None
+        return self._fts
+
+    def count_events(self, since_ts=None, until_ts=None):
+        """Range madhle rows (export progress sathi) - range nasel tar O(1) counter"""
+        if since_ts is None and until_ts is None:
+            return self.get_count()
+        return self._conn().execute(
+            'SELECT COUNT(*) FROM history WHERE created_ts >= ? AND created_ts < ?',
+            (since_ts if since_ts is not None else -2**62,
+             until_ts if until_ts is not None else 2**62)
+        ).fetchone()[0]
+
+    def iter_events(self, since_ts=None, until_ts=None, chunk_size=1000):
+        """Oldest pasun rows stream kara - fetchmany chunks, purn list memory madhe nahi"""
+        if since_ts is None and until_ts is None:
+            cursor = self._conn().execute(f'SELECT {EVENT_COLUMNS} FROM history ORDER BY id')
+        else:
+            # (created_ts, id) order idx_history_created varun yeto, temp sort nahi
+            cursor = self._conn().execute(f'''
+                SELECT {EVENT_COLUMNS} FROM history
+                WHERE created_ts >= ? AND created_ts < ?
+                ORDER BY created_ts, id
+            ''', (since_ts if since_ts is not None else -2**62,
+                  until_ts if until_ts is not None else 2**62))
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+
+    def delete_all(self):
+        """Fakt raw history - rollups (Stats) rahtat, te delete_rollups() ne"""
+        conn = self._conn()
+        with conn:
+            conn.execute('DELETE FROM history')
+        self.history_generation += 1
+
+    def delete_rollups(self):
+        """Sagle hour/day/week summaries (Stats screen 'Reset Stats')"""
+        conn = self._conn()
+        with conn:
+            conn.execute('DELETE FROM history_rollup')
+
+    def get_count(self):
+        """O(1) - history_stats triggers ne up-to-date asto"""
+        return self._conn().execute(
+            'SELECT row_count FROM history_stats WHERE id = 1'
+        ).fetchone()[0]
+
+    def get_rollups(self, period='day', since_ts=None, until_ts=None, limit=500, zone_id=None):
+        """Summary rows, newest bucket first.
+
+        Row: (bucket_ts, events, cycles, on_minutes, auto_on, avg_auto_on_temp,
+        avg_temp, avg_humidity) - averages None jar data nasel.
+        zone_id None = sagle zones ekatra.
+        """
+        if period not in ROLLUP_PERIODS:
+            raise ValueError(f"Unknown rollup period: {period}")
+        zone_sql = '' if zone_id is None else 'AND zone_id = ?'
+        return self._conn().execute(f'''
+            SELECT bucket_ts, SUM(events), SUM(cycles), SUM(on_seconds) / 60.0, SUM(auto_on),
+                   CASE WHEN SUM(auto_on) > 0 THEN SUM(auto_on_temp_sum) / SUM(auto_on) END,
+                   CASE WHEN SUM(temp_n) > 0 THEN SUM(temp_sum) / SUM(temp_n) END,
+                   CASE WHEN SUM(humidity_n) > 0 THEN SUM(humidity_sum) / SUM(humidity_n) END
+            FROM history_rollup
+            WHERE period = ? AND bucket_ts >= ? AND bucket_ts < ? {zone_sql}
+            GROUP BY bucket_ts
+            ORDER BY bucket_ts DESC LIMIT ?
+        ''', (
+            period,
+            since_ts if since_ts is not None else -2**62,
+            until_ts if until_ts is not None else 2**62,
+            *(() if zone_id is None else (zone_id,)),
+            limit,
+        )).fetchall()
+
+    # ---------- zones ----------
+    def get_zones(self, enabled_only=False):
+        """Row: ZONE_COLUMNS"""
+        where = 'WHERE enabled = 1' if enabled_only else ''
+        return self._conn().execute(f'''
+            SELECT {ZONE_COLUMNS}
+            FROM zones {where} ORDER BY id
+        ''').fetchall()
+
+    def get_zone(self, zone_id):
+        return self._conn().execute(f'''
+            SELECT {ZONE_COLUMNS}
+            FROM zones WHERE id = ?
+        ''', (zone_id,)).fetchone()
+
+    def add_zone(self, name, on_temp=40.0, off_temp=38.5, min_on_s=60, min_off_s=30,
+                 smoothing='ema', forecast_s=120, sensor=None):
+        """Navin zone; return navin id"""
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute('''
+                INSERT INTO zones
+                (name, on_temp, off_temp, min_on_s, min_off_s, smoothing, forecast_s, sensor)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (name, on_temp, off_temp, min_on_s, min_off_s, smoothing, forecast_s, sensor))
+        return cursor.lastrowid
+
+    def update_zone(self, zone_id, **fields):
+        """Thresholds / name / sensor / enabled badla"""
+        allowed = ('name', 'on_temp', 'off_temp', 'min_on_s', 'min_off_s',
+                   'smoothing', 'forecast_s', 'sensor', 'enabled')
+        unknown = set(fields) - set(allowed)
+        if unknown:
+            raise ValueError(f"Unknown zone fields: {sorted(unknown)}")
+        if not fields:
+            return
+        assignments = ', '.join(f'{name} = ?' for name in fields)
+        conn = self._conn()
+        with conn:
+            conn.execute(f'UPDATE zones SET {assignments} WHERE id = ?',
+                         (*fields.values(), zone_id))
+
+    def delete_zone(self, zone_id):
+        """Zone disable kara - tyachi history tashich rahte (zone 1 kadhich nahi)"""
+        if zone_id == DEFAULT_ZONE_ID:
+            return
+        self.update_zone(zone_id, enabled=0)
+
+    # ---------- programs ----------
+    def get_programs(self, enabled_only=False):
+        """Row: PROGRAM_COLUMNS"""
+        where = 'WHERE enabled = 1' if enabled_only else ''
+        return self._conn().execute(f'''
+            SELECT {PROGRAM_COLUMNS} FROM programs {where} ORDER BY id
+        ''').fetchall()
+
+    def add_program(self, name, kind, start_min, end_min, every_min=None, duration_s=None,
+                    zone_id=None, days=127):
+        """Navin program; return navin id.
+
+        'fog' run pudhcha run suru honyaadhi sampla pahije (overlap -> ValueError).
+        """
+        if kind == 'fog' and every_min and duration_s and duration_s >= every_min * 60:
+            raise ValueError(
+                f"duration_s ({duration_s}) must be shorter than every_min ({every_min} min)"
+            )
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute('''
+                INSERT INTO programs
+                (zone_id, name, kind, start_min, end_min, every_min, duration_s, days)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (zone_id, name, kind, start_min, end_min, every_min, duration_s, days))
+        return cursor.lastrowid
+
+    def set_program_enabled(self, program_id, enabled):
+        conn = self._conn()
+        with conn:
+            conn.execute('UPDATE programs SET enabled = ? WHERE id = ?',
+                         (1 if enabled else 0, program_id))
+
+    def delete_program(self, program_id):
+        conn = self._conn()
+        with conn:
+            conn.execute('DELETE FROM programs WHERE id = ?', (program_id,))
+
+    # ---------- telemetry ----------
+    def save_telemetry_blocks(self, blocks):
+        """(zone_id, start_ts, end_ts, count, data) blocks ek transaction madhe"""
+        conn = self._conn()
+        with conn:
+            conn.executemany('''
+                INSERT INTO telemetry_block (zone_id, start_ts, end_ts, count, data)
+                VALUES (?, ?, ?, ?, ?)
+            ''', blocks)
+        return len(blocks)
+
+    def get_telemetry_blocks(self, zone_id, since_ts, until_ts, max_span=None):
+        """[since_ts, until_ts) la overlap karnare blocks, oldest first.
+
+        Row: (start_ts, end_ts, count, data). max_span = ek block kiti seconds
+        paryant pasru shakto - dila tar index range start_ts var ghatta basto.
+        """
+        lower = since_ts - max_span if max_span is not None else -2**62
+        return self._conn().execute('''
+            SELECT start_ts, end_ts, count, data FROM telemetry_block
+            WHERE zone_id = ? AND start_ts >= ? AND start_ts < ? AND end_ts >= ?
+            ORDER BY start_ts
+        ''', (zone_id, lower, until_ts, since_ts)).fetchall()
+
+    def purge_telemetry_before(self, cutoff_ts, limit=500):
+        """Purn cutoff aadhi sampalele blocks, jast-jast `limit` ek transaction madhe"""
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute('''
+                DELETE FROM telemetry_block WHERE id IN (
+                    SELECT id FROM telemetry_block WHERE end_ts < ?
+                    ORDER BY end_ts LIMIT ?
+                )
+            ''', (cutoff_ts, limit))
+        return cursor.rowcount
+
+    def purge_events_before(self, cutoff_ts, limit=500):
+        """created_ts < cutoff aslele jast-jast `limit` raw rows delete kara (ek chhota transaction)"""
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute('''
+                DELETE FROM history WHERE id IN (
+                    SELECT id FROM history WHERE created_ts < ?
+                    ORDER BY created_ts LIMIT ?
+                )
+            ''', (cutoff_ts, limit))
+        if cursor.rowcount:
+            self.history_generation += 1
+        return cursor.rowcount
+
+    def purge_rollups_before(self, period, cutoff_ts):
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute(
+                'DELETE FROM history_rollup WHERE period = ? AND bucket_ts < ?',
+                (period, cutoff_ts)
+            )
+        return cursor.rowcount
+
+    def reclaim_space(self, max_pages=256):
+        """Free pages file madhun parat OS la dya; return kelele pages.
+
+        Juni (auto_vacuum nasleli) file la kahi karat nahi - free pages SQLite
+        navin rows sathi vaparto. Full VACUUM worker queue adavto mhanun fakt
+        compact() ne, swatahun nahi.
+        """
+        conn = self._conn()
+        pages = 0
+        if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2:
+            free = conn.execute('PRAGMA freelist_count').fetchone()[0]
+            pages = min(free, max_pages)
+            if pages:
+                conn.execute(f'PRAGMA incremental_vacuum({pages})').fetchall()
+        # WAL file pan chhoti kara
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchall()
+        return pages
+
+    def compact(self):
+        """Ekda chalvaychi maintenance: full VACUUM + auto_vacuum=INCREMENTAL.
+
+        Motha file asel tar anek seconds laagtat ani DB itki free disk lagte -
+        app chalu nastana chalva (python fogger_db.py compact). Return
+        (bytes before, bytes after); jaga kami asel tar sqlite3.OperationalError.
+        """
+        conn = self._conn()
+        memory = self.pool.is_memory
+        before = 0 if memory else os.path.getsize(self.db_path)
+        if not memory:
+            free = shutil.disk_usage(os.path.dirname(os.path.abspath(self.db_path))).free
+            if free < before * 1.1:
+                raise sqlite3.OperationalError(
+                    f"compact needs ~{before // 2**20} MB free disk, only {free // 2**20} MB available"
+                )
+        conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        conn.execute('VACUUM')
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchall()
+        after = 0 if memory else os.path.getsize(self.db_path)
+        return before, after
+
+    def recount(self):
+        """Counter parat COUNT(*) pasun set kara (repair sathi, full scan)"""
+        conn = self._conn()
+        with conn:
+            conn.execute('''
+                UPDATE history_stats SET row_count = (SELECT COUNT(*) FROM history)
+                WHERE id = 1
+            ''')
+        return self.get_count()
+
+
+# ==========================================
+#  BACKGROUND DB WORKER
+# ==========================================
+class DBFuture:
+    """Worker thread var chalnarya DB call cha result"""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._result = None
+        self._error = None
+
+    def done(self):
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """Result sathi wait kara (UI thread var vapru naka)"""
+        if not self._done.wait(timeout):
+            raise TimeoutError("DB call did not finish in time")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def _set(self, result=None, error=None):
+        self._result = result
+        self._error = error
+        self._done.set()
+
+
+class DBWorker:
+    """Ek dedicated thread - sagle SQLite calls queue madhun kramane chaltat.
+
+    `dispatch` callback la UI thread var pathavto (app madhe Clock.schedule_once).
+    Default dispatch worker thread varach callback chalavto.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db, dispatch=None, name='fogger-db'):
+        self.db = db
+        self._dispatch = dispatch or (lambda fn: fn())
+        self._queue = queue.Queue()
+        self._name = name
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return self
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        return self
+
+    def submit(self, fn, *args, callback=None, errback=None, **kwargs):
+        """fn(*args, **kwargs) worker var chalva; result callback(result) la milto"""
+        future = DBFuture()
+        self._queue.put((fn, args, kwargs, callback, errback, future))
+        return future
+
+    def stop(self, timeout=5.0):
+        """Queue madhle pending kaam sampvun thread band kara"""
+        if not self.running:
+            return
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            fn, args, kwargs, callback, errback, future = item
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                future._set(error=exc)
+                if errback is not None:
+                    self._dispatch(lambda e=exc: errback(e))
+                else:
+                    log.exception("DB call %s failed", getattr(fn, '__name__', fn))
+                continue
+            future._set(result=result)
+            if callback is not None:
+                self._dispatch(lambda r=result: callback(r))
+
+
+# ==========================================
+#  WRITE-BEHIND EVENT BUFFER
+# ==========================================
+class EventWriteBuffer:
+    """Events memory madhe jama karto ani ek executemany + ek commit ne flush karto.
+
+    Flush hoto jevha `max_rows` rows jama hotat kiva pahila pending row
+    `max_delay_ms` juna hoto. Process exit la atexit pending rows lihto.
+    """
+
+    def __init__(self, db, worker=None, max_rows=50, max_delay_ms=1000, on_flush=None):
+        self.db = db
+        self.worker = worker
+        self.max_rows = max_rows
+        self.max_delay_ms = max_delay_ms
+        self.on_flush = on_flush
+        self._rows = []
+        self._lock = threading.Lock()
+        self._timer = None
+        self._last_future = None
+        atexit.register(self.close)
+
+    @property
+    def pending(self):
+        return len(self._rows)
+
+    def add(self, status, temperature, humidity, duration_s, reason, zone_id=DEFAULT_ZONE_ID):
+        row = event_row(status, temperature, humidity, duration_s, reason, zone_id=zone_id)
+        with self._lock:
+            self._rows.append(row)
+            count = len(self._rows)
+            if count == 1 and count < self.max_rows:
+                self._timer = threading.Timer(self.max_delay_ms / 1000.0, self._timer_flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if count >= self.max_rows:
+            self.flush()
+
+    def flush(self, wait=False):
+        """Pending rows lihun kadha; wait=True asel tar commit houn jaiparyant thamba"""
+        with self._lock:
+            rows, self._rows = self._rows, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not rows:
+            # Aadhi submit zalele batches commit houn jaudet
+            if wait and self._last_future is not None:
+                self._last_future.result()
+            return 0
+        if self.worker is not None and self.worker.running:
+            future = self.worker.submit(self.db.save_events, rows, callback=self.on_flush)
+            self._last_future = future
+            if wait:
+                future.result()
+            return len(rows)
+        # Worker nahi (kiva band zala) - ithech synchronous lihu
+        self.db.save_events(rows)
+        if self.on_flush is not None:
+            self.on_flush(len(rows))
+        return len(rows)
+
+    def _timer_flush(self):
+        self.flush()
+        # Worker nastana sync write ya short-lived Timer thread var zala - tyachi
+        # connection (WAL + mmap) sodun dya, nahitar pratyek flush la ek leak
+        self.db.pool.release()
+
+    def close(self):
+        """App stop / process exit - pending rows commit kara"""
+        try:
+            self.flush(wait=True)
+        except sqlite3.ProgrammingError:
+            # DB already closed - atexit la kahi karu shakat nahi
+            pass
+        atexit.unregister(self.close)
+
+
+# ==========================================
+#  RETENTION
+# ==========================================
+class RetentionPolicy:
+    """Kiti divas konta data thevaycha.
+
+    Raw history rows `raw_days` nantar jatat - tyanche hourly/daily/weekly
+    rollups insert veli tayar zalele astat, mhanun trends rahtat.
+    Sensor telemetry blocks `telemetry_days` nantar.
+    None = kadhi delete karu naka.
+    """
+
+    def __init__(self, raw_days=90, hourly_days=180, daily_days=730, weekly_days=None,
+                 telemetry_days=365, chunk_rows=500, vacuum_pages=256):
+        self.raw_days = raw_days
+        self.telemetry_days = telemetry_days
+        self.rollup_days = {'hour': hourly_days, 'day': daily_days, 'week': weekly_days}
+        self.chunk_rows = chunk_rows
+        self.vacuum_pages = vacuum_pages
+
+
+class RetentionEngine:
+    """Expired rows chhotya chunks madhe DBWorker var delete karto.
+
+    Pratyek chunk vegla worker job ahe, mhanun madhe UI che DB calls chalu shaktat.
+    """
+
+    DAY = 24 * 60 * 60
+
+    def __init__(self, db, worker, policy=None, clock=None):
+        self.db = db
+        self.worker = worker
+        self.policy = policy or RetentionPolicy()
+        self._clock = clock or (lambda: datetime.now().timestamp())
+        self.running = False
+        self.deleted = 0
+        self._on_done = None
+
+    def run(self, on_done=None):
+        """Ek retention pass suru kara; purn zala ki on_done(deleted_rows)"""
+        if self.running:
+            return False
+        self.running = True
+        self.deleted = 0
+        self._on_done = on_done
+        now = self._clock()
+        if self.policy.raw_days is None:
+            self._purge_telemetry(now)
+            return True
+        cutoff = int(now - self.policy.raw_days * self.DAY)
+        self._next_chunk(cutoff, now)
+        return True
+
+    def _next_chunk(self, cutoff, now):
+        self.worker.submit(
+            self.db.purge_events_before, cutoff, self.policy.chunk_rows,
+            callback=lambda n: self._chunk_done(n, cutoff, now),
+            errback=self._failed,
+        )
+
+    def _chunk_done(self, deleted, cutoff, now):
+        self.deleted += deleted
+        if deleted >= self.policy.chunk_rows:
+            self._next_chunk(cutoff, now)
+        else:
+            self._purge_telemetry(now)
+
+    def _purge_telemetry(self, now):
+        if self.policy.telemetry_days is None:
+            self._purge_rollups(now)
+            return
+        cutoff = int(now - self.policy.telemetry_days * self.DAY)
+        self.worker.submit(
+            self.db.purge_telemetry_before, cutoff, self.policy.chunk_rows,
+            callback=lambda n: (
+                self._purge_telemetry(now) if n >= self.policy.chunk_rows
+                else self._purge_rollups(now)
+            ),
+            errback=self._failed,
+        )
+
+    def _purge_rollups(self, now):
+        for period, days in self.policy.rollup_days.items():
+            if days is not None:
+                self.worker.submit(self.db.purge_rollups_before, period, int(now - days * self.DAY))
+        self.worker.submit(
+            self.db.reclaim_space, self.policy.vacuum_pages,
+            callback=lambda pages: self._finish(),
+            errback=self._failed,
+        )
+
+    def _finish(self):
+        self.running = False
+        if self._on_done is not None:
+            self._on_done(self.deleted)
+
+    def _failed(self, exc):
+        log.error("retention pass failed: %s", exc)
+        self.running = False
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Auto Fogger database maintenance")
+    parser.add_argument('--db', default=None, help="SQLite file (default: auto_fogger.db)")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('compact', help="full VACUUM + incremental auto_vacuum (app band astana)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    db = DatabaseManager(args.db)
+    try:
+        before, after = db.compact()
+        print(f"compacted {db.db_path}: {before / 2**20:.1f} MB -> {after / 2**20:.1f} MB")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
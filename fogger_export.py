@@ -0,0 +1,123 @@
+import csv
+import gzip
+import json
+import os
+import threading
+from datetime import datetime
+
+from fogger_db import EVENT_COLUMNS
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+EXPORT_FIELDS = [c.strip() for c in EVENT_COLUMNS.split(',')] + ['created_at']
+
+
+def _open_output(path, compress):
+    if compress:
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    return open(path, 'w', encoding='utf-8', newline='')
+
+
+def _with_iso(row):
+    created_ts = row[-1]
+    iso = datetime.fromtimestamp(created_ts).isoformat(sep=' ') if created_ts is not None else None
+    return list(row) + [iso]
+
+
+def export_history(db, path, fmt='csv', compress=False, since_ts=None, until_ts=None,
+                   chunk_size=1000, progress=None, cancel=None):
+    """History rows `path` madhe stream kara (CSV kiva JSON Lines, optional gzip).
+
+    Memory madhe ek chunk peksha jast rows kadhich nastat. progress(done, total)
+    pratyek chunk nantar; cancel() True dilyas export thambto ani file kadhli jate.
+    Return: lihilele rows.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    total = db.count_events(since_ts, until_ts)
+    done = 0
+    # Temp file madhe lihun shevti rename - adhi-ardhi export file rahat nahi
+    tmp_path = path + '.part'
+    try:
+        with _open_output(tmp_path, compress) as out:
+            if fmt == 'csv':
+                writer = csv.writer(out)
+                writer.writerow(EXPORT_FIELDS)
+            for rows in db.iter_events(since_ts, until_ts, chunk_size):
+                if cancel is not None and cancel():
+                    raise InterruptedError("export cancelled")
+                if fmt == 'csv':
+                    writer.writerows(_with_iso(row) for row in rows)
+                else:
+                    out.writelines(
+                        json.dumps(dict(zip(EXPORT_FIELDS, _with_iso(row)))) + '\n'
+                        for row in rows
+                    )
+                done += len(rows)
+                if progress is not None:
+                    progress(done, max(total, done))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return done
+
+
+def export_filename(fmt='csv', compress=True, when=None):
+    when = when or datetime.now()
+    name = f"fogger_history_{when.strftime('%Y%m%d_%H%M%S')}.{fmt}"
+    return name + '.gz' if compress else name
+
+
+class ExportJob:
+    """Export swatachya thread var - DBWorker queue block hot nahi (WAL madhe reads parallel chaltat).
+
+    progress/on_done/on_error `dispatch` madhun yetat (app madhe Clock.schedule_once).
+    """
+
+    def __init__(self, db, path, fmt='csv', compress=True, since_ts=None, until_ts=None,
+                 progress=None, on_done=None, on_error=None, dispatch=None):
+        self.db = db
+        self.path = path
+        self.fmt = fmt
+        self.compress = compress
+        self.since_ts = since_ts
+        self.until_ts = until_ts
+        self._progress = progress
+        self._on_done = on_done
+        self._on_error = on_error
+        self._dispatch = dispatch or (lambda fn: fn())
+        self._cancelled = False
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='fogger-export', daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancelled = True
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _report(self, done, total):
+        if self._progress is not None:
+            self._dispatch(lambda: self._progress(done, total))
+
+    def _run(self):
+        try:
+            rows = export_history(
+                self.db, self.path, self.fmt, self.compress, self.since_ts, self.until_ts,
+                progress=self._report, cancel=lambda: self._cancelled,
+            )
+        except Exception as exc:
+            if self._on_error is not None:
+                self._dispatch(lambda e=exc: self._on_error(e))
+            return
+        finally:
+            # Ya thread chi connection parat vaparli janar nahi
+            self.db.pool.release()
+        if self._on_done is not None:
+            self._dispatch(lambda: self._on_done(self.path, rows))
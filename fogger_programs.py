@@ -0,0 +1,344 @@
+"""Time-of-day fogging programs - 'fog' runs ani 'block' windows.
+
+    python fogger_programs.py list
+    python fogger_programs.py add "Midday" fog 11:00-16:00 --every 30 --duration 120
+    python fogger_programs.py add "Night" block 20:00-06:00
+    python fogger_programs.py next
+"""
+import argparse
+import heapq
+import itertools
+import logging
+import time
+from datetime import datetime, time as dtime, timedelta
+
+log = logging.getLogger(__name__)
+
+DAY_NAMES = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+ALL_DAYS = 0x7F
+
+
+# ==========================================
+#  PARSING
+# ==========================================
+def parse_hhmm(text, end=False):
+    """'11:30' -> 690 minutes ('24:00' = 1440 fakt `end` sathi chalto)"""
+    hours, _, minutes = text.strip().partition(':')
+    try:
+        value = int(hours) * 60 + int(minutes or 0)
+    except ValueError:
+        raise ValueError(f"Invalid time: {text!r} (use HH:MM)") from None
+    if not 0 <= value <= (1440 if end else 1439):
+        raise ValueError(f"Invalid {'end' if end else 'start'} time: {text!r}")
+    return value
+
+
+def parse_window(text):
+    """'20:00-06:00' -> (start_min, end_min)"""
+    start, sep, end = text.partition('-')
+    if not sep:
+        raise ValueError(f"Invalid window: {text!r} (use HH:MM-HH:MM)")
+    return parse_hhmm(start), parse_hhmm(end, end=True)
+
+
+def format_hhmm(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def parse_days(text):
+    """'all' | 'weekdays' | 'weekends' | 'mon-fri' | 'mon,wed,sat' -> bitmask (Monday = bit 0)"""
+    text = (text or 'all').strip().lower()
+    if text == 'all':
+        return ALL_DAYS
+    if text == 'weekdays':
+        return 0x1F
+    if text == 'weekends':
+        return 0x60
+    mask = 0
+    for part in text.split(','):
+        first, _, last = part.strip().partition('-')
+        start = DAY_NAMES.index(first[:3])
+        end = DAY_NAMES.index(last[:3]) if last else start
+        for day in range(start, end + 1):
+            mask |= 1 << day
+    return mask
+
+
+def format_days(mask):
+    if mask == ALL_DAYS:
+        return "all"
+    return ",".join(name for day, name in enumerate(DAY_NAMES) if mask & (1 << day))
+
+
+# ==========================================
+#  PROGRAM
+# ==========================================
+class Program:
+    """Ek programs row. Window start_min..end_min (local time) - end <= start
+    asel tar madhyaratri pasun pudhchya divashi sampto."""
+
+    def __init__(self, program_id, zone_id, name, kind, start_min, end_min,
+                 every_min=None, duration_s=None, days=ALL_DAYS):
+        self.program_id = program_id
+        self.zone_id = zone_id
+        self.name = name
+        self.kind = kind
+        self.start_min = start_min
+        self.end_min = end_min
+        self.every_min = every_min
+        self.duration_s = duration_s
+        self.days = days
+
+    @classmethod
+    def from_row(cls, row):
+        """DatabaseManager.get_programs() row -> Program"""
+        program_id, zone_id, name, kind, start_min, end_min, every_min, duration_s, days, _ = row
+        return cls(program_id, zone_id, name, kind, start_min, end_min,
+                   every_min, duration_s, days)
+
+    def windows(self, after_ts, days_ahead=8):
+        """(start_ts, end_ts) windows kramane - aadlya divasachi (wrap) pan"""
+        length = (self.end_min - self.start_min) % 1440 or 1440
+        first_day = datetime.fromtimestamp(after_ts).date() - timedelta(days=1)
+        for offset in range(days_ahead + 1):
+            day = first_day + timedelta(days=offset)
+            if not self.days & (1 << day.weekday()):
+                continue
+            # datetime arithmetic mule DST asla tari local wall-clock time
+            start = datetime.combine(day, dtime()) + timedelta(minutes=self.start_min)
+            yield start.timestamp(), (start + timedelta(minutes=length)).timestamp()
+
+    def next_run(self, after_ts):
+        """'fog' program cha `after_ts` nantarcha pudhcha run (None = kadhich nahi)"""
+        for start, end in self.windows(after_ts):
+            if not self.every_min:
+                if start > after_ts:
+                    return start
+                continue
+            period = self.every_min * 60
+            if after_ts < start:
+                fire = start
+            else:
+                fire = start + ((after_ts - start) // period + 1) * period
+            if fire < end:
+                return fire
+        return None
+
+    def block_state(self, now):
+        """'block' program: (ata active ka, pudhcha transition ts kiva None)"""
+        for start, end in self.windows(now):
+            if start <= now < end:
+                return True, end
+            if start > now:
+                return False, start
+        return False, None
+
+    def describe(self):
+        window = f"{format_hhmm(self.start_min)}-{format_hhmm(self.end_min)}"
+        days = "" if self.days == ALL_DAYS else f" [{format_days(self.days)}]"
+        if self.kind == 'block':
+            return f"block {window}{days}"
+        every = f" every {self.every_min} min" if self.every_min else ""
+        return f"fog {self.duration_s}s{every} in {window}{days}"
+
+
+# ==========================================
+#  NEXT-FIRE SCHEDULER
+# ==========================================
+class ProgramScheduler:
+    """Programs cha pudhcha trigger heap madhe - poll() fakt due triggers pop karto.
+
+    Pratyek tick la sagle rules check hot nahit: O(due * log n). Triggers
+    ZoneScheduler madhlya controllers var lagu hotat (zone_id None = sagle zones).
+    """
+
+    def __init__(self, zones, clock=time.time):
+        self.zones = zones
+        self._clock = clock
+        self.programs = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._running = {}   # program_id -> set(zone_id) jithe fog run chalu ahe
+
+    def load(self, rows):
+        """DB rows varun purn heap parat banva (program add / edit / delete nantar)"""
+        self._release_all()
+        self.programs = {}
+        self._heap = []
+        now = self._clock()
+        for row in rows:
+            if not row[-1]:
+                continue
+            program = Program.from_row(row)
+            self.programs[program.program_id] = program
+            self._schedule(program, now)
+        heapq.heapify(self._heap)
+
+    def add_zone(self, zone):
+        """Navin zone - ata chalu block windows fakt tyala lagu kara.
+
+        Baki zones che chalu fog runs tasech rahtat; pudhche triggers
+        _controllers() madhun navin zone aapoaap ghetat.
+        """
+        now = self._clock()
+        for program in self.programs.values():
+            if program.kind != 'block' or program.zone_id not in (None, zone.zone_id):
+                continue
+            if program.block_state(now)[0]:
+                zone.controller.set_block(program.program_id, program.name, True)
+
+    def _release_all(self):
+        for program in self.programs.values():
+            if program.kind == 'block':
+                for controller in self._controllers(program):
+                    controller.set_block(program.program_id, program.name, False)
+            elif program.program_id in self._running:
+                for controller in self._controllers(program):
+                    controller.program_stop(program.program_id, program.name)
+        self._running = {}
+
+    def _controllers(self, program):
+        if program.zone_id is None:
+            return [zone.controller for zone in self.zones]
+        zone = self.zones.get(program.zone_id)
+        return [zone.controller] if zone is not None else []
+
+    def _push(self, ts, action, program):
+        if ts is not None:
+            heapq.heappush(self._heap, (ts, next(self._seq), action, program.program_id))
+
+    def _schedule(self, program, now):
+        if program.kind == 'fog':
+            self._push(program.next_run(now), 'start', program)
+            return
+        active, transition = program.block_state(now)
+        if active:
+            for controller in self._controllers(program):
+                controller.set_block(program.program_id, program.name, True)
+        self._push(transition, 'unblock' if active else 'block', program)
+
+    def poll(self):
+        """Due triggers chalva; return kiti chalale"""
+        now = self._clock()
+        fired = 0
+        while self._heap and self._heap[0][0] <= now:
+            ts, _, action, program_id = heapq.heappop(self._heap)
+            program = self.programs.get(program_id)
+            if program is None:
+                continue
+            fired += 1
+            if action == 'start':
+                if program_id in self._running:
+                    # Magcha run ajun chalu (juni overlap row) - skip, nahitar tyacha
+                    # stop ha navin run madhech band karel
+                    log.warning("program %s: run still active, skipping start", program.name)
+                    started = None
+                else:
+                    started = {
+                        controller.zone_id for controller in self._controllers(program)
+                        if controller.program_start(program_id, program.name, program.duration_s)
+                    }
+                if started:
+                    self._running[program_id] = started
+                    self._push(ts + program.duration_s, 'stop', program)
+                # App sleep madhe asel tar chukalele runs ekdam chalvat nahi
+                self._push(program.next_run(max(ts, now)), 'start', program)
+            elif action == 'stop':
+                for zone_id in self._running.pop(program_id, ()):
+                    zone = self.zones.get(zone_id)
+                    if zone is not None:
+                        zone.controller.program_stop(program.program_id, program.name)
+            else:
+                # Trigger ushira challa (app pause / sleep) tar window sampli
+                # asu shakte - action nahi, ata cha state lagu kara
+                active, transition = program.block_state(now)
+                for controller in self._controllers(program):
+                    controller.set_block(program_id, program.name, active)
+                self._push(transition, 'unblock' if active else 'block', program)
+        return fired
+
+    def seconds_until_next(self):
+        """Pudhcha trigger kiti seconds nantar (None = kahi nahi)"""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - self._clock())
+
+    def upcoming(self, limit=5):
+        """[(ts, action, Program)] - UI / CLI sathi"""
+        return [
+            (ts, action, self.programs[program_id])
+            for ts, _, action, program_id in heapq.nsmallest(limit, self._heap)
+            if program_id in self.programs
+        ]
+
+
+# ==========================================
+#  CLI
+# ==========================================
+def main(argv=None):
+    from fogger_db import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="Auto Fogger programs")
+    parser.add_argument('--db', default=None, help="SQLite file (default: auto_fogger.db)")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list')
+    sub.add_parser('next')
+    add = sub.add_parser('add')
+    add.add_argument('name')
+    add.add_argument('kind', choices=('fog', 'block'))
+    add.add_argument('window', help="HH:MM-HH:MM (local time)")
+    add.add_argument('--every', type=int, default=None, help="fog: dar kiti minutes")
+    add.add_argument('--duration', type=int, default=None, help="fog: seconds")
+    add.add_argument('--zone', type=int, default=None, help="default sagle zones")
+    add.add_argument('--days', default='all', help="all | weekdays | weekends | mon-fri | mon,wed")
+    for name in ('delete', 'enable', 'disable'):
+        sub.add_parser(name).add_argument('program_id', type=int)
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db)
+    try:
+        if args.command == 'add':
+            if args.kind == 'fog' and not args.duration:
+                parser.error("fog programs need --duration")
+            if args.kind == 'fog' and args.every and args.duration >= args.every * 60:
+                parser.error("--duration must be shorter than --every (runs would overlap)")
+            try:
+                start_min, end_min = parse_window(args.window)
+            except ValueError as exc:
+                parser.error(str(exc))
+            program_id = db.add_program(
+                args.name, args.kind, start_min, end_min,
+                every_min=args.every, duration_s=args.duration,
+                zone_id=args.zone, days=parse_days(args.days),
+            )
+            print(f"added program {program_id}")
+        elif args.command == 'delete':
+            db.delete_program(args.program_id)
+        elif args.command in ('enable', 'disable'):
+            db.set_program_enabled(args.program_id, args.command == 'enable')
+        elif args.command == 'list':
+            for row in db.get_programs():
+                program = Program.from_row(row)
+                zone = "all zones" if program.zone_id is None else f"zone {program.zone_id}"
+                state = "" if row[-1] else "  (disabled)"
+                print(f"{program.program_id:>3}  {program.name:<20} {program.describe()}  "
+                      f"- {zone}{state}")
+        else:
+            programs = {p.program_id: p for p in map(Program.from_row, db.get_programs(True))}
+            now = time.time()
+            upcoming = []
+            for program in programs.values():
+                if program.kind == 'fog':
+                    upcoming.append((program.next_run(now), "run", program))
+                else:
+                    active, ts = program.block_state(now)
+                    upcoming.append((ts, "unblock" if active else "block", program))
+            for ts, action, program in sorted((u for u in upcoming if u[0]), key=lambda u: u[0]):
+                when = datetime.fromtimestamp(ts).strftime("%a %d %b %H:%M")
+                print(f"{when}  {action:<8} {program.name}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import csv
+import json
+import logging
+import random
+import threading
+import time
+from collections import namedtuple
+
+log = logging.getLogger(__name__)
+
+SensorReading = namedtuple('SensorReading', 'temperature humidity ts')
+
+
+# ==========================================
+#  SENSOR SOURCE INTERFACE
+# ==========================================
+class SensorSource:
+    """Temperature/humidity readings cha source.
+
+    read() kadhich block karat nahi - latest reading (kiva ajun kahi nasel tar
+    None) lagech return karto. Slow hardware background thread var vachla jato.
+    """
+
+    def start(self):
+        return self
+
+    def stop(self):
+        pass
+
+    def read(self):
+        raise NotImplementedError
+
+
+class SimulatedSensor(SensorSource):
+    """Juna random generator - desktop / demo sathi"""
+
+    def __init__(self, seed=None, temp_range=(28.0, 44.0), humidity_range=(55.0, 75.0),
+                 clock=time.time):
+        self._rng = random.Random(seed)
+        self.temp_range = temp_range
+        self.humidity_range = humidity_range
+        self._clock = clock
+
+    def read(self):
+        return SensorReading(
+            round(self._rng.uniform(*self.temp_range), 1),
+            round(self._rng.uniform(*self.humidity_range), 1),
+            self._clock(),
+        )
+
+
+class TraceReplaySensor(SensorSource):
+    """CSV trace madhun ek-ek reading (temperature, humidity columns).
+
+    History export CSV pan chalto. File stream hote, purn memory madhe yet nahi.
+    """
+
+    def __init__(self, path, loop=True, clock=time.time):
+        self.path = path
+        self.loop = loop
+        self._clock = clock
+        self._file = None
+        self._reader = None
+
+    def start(self):
+        self._open()
+        return self
+
+    def _open(self):
+        self.stop()
+        self._file = open(self.path, newline='', encoding='utf-8')
+        self._reader = csv.DictReader(self._file)
+
+    def stop(self):
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._reader = None
+
+    def read(self):
+        if self._reader is None:
+            return None
+        for _ in range(2):
+            for row in self._reader:
+                try:
+                    return SensorReading(
+                        float(row['temperature']), float(row['humidity']), self._clock()
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+            if not self.loop:
+                return None
+            self._open()
+        return None
+
+
+class QueueSensor(SensorSource):
+    """Push-based source - MQTT on_message sarkhe callbacks push() kartat"""
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._latest = None
+        self._lock = threading.Lock()
+
+    def push(self, temperature, humidity, ts=None):
+        reading = SensorReading(float(temperature), float(humidity), ts or self._clock())
+        with self._lock:
+            self._latest = reading
+
+    def read(self):
+        with self._lock:
+            return self._latest
+
+
+def parse_sensor_line(line):
+    """'32.5,61.0' / '32.5 61.0' / '{"temperature": 32.5, "humidity": 61}' -> (t, h)"""
+    if isinstance(line, bytes):
+        line = line.decode('utf-8', 'replace')
+    line = line.strip()
+    if not line:
+        return None
+    if line.startswith('{'):
+        data = json.loads(line)
+        return float(data['temperature']), float(data['humidity'])
+    parts = line.replace(',', ' ').split()
+    return float(parts[0]), float(parts[1])
+
+
+class StreamSensor(QueueSensor):
+    """Serial port / socket / file madhun line-by-line readings.
+
+    `opener()` ek file-like object deto jyachi readline() block karu shakte
+    (pyserial: lambda: serial.Serial('/dev/ttyUSB0', 9600, timeout=1)).
+    Vachan background thread var, read() fakt latest value deto.
+    Local testing sathi opener=lambda: io.StringIO("32.1,60\n...").
+    """
+
+    def __init__(self, opener, reconnect_delay=5.0, clock=time.time):
+        super().__init__(clock=clock)
+        self._opener = opener
+        self.reconnect_delay = reconnect_delay
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='fogger-sensor', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                stream = self._opener()
+            except Exception as exc:
+                log.warning("sensor open failed: %s", exc)
+                self._stop.wait(self.reconnect_delay)
+                continue
+            try:
+                while not self._stop.is_set():
+                    line = stream.readline()
+                    if not line:
+                        # EOF (StringIO / file) - thoda thamba ani parat open kara
+                        break
+                    try:
+                        parsed = parse_sensor_line(line)
+                    except (ValueError, KeyError, IndexError):
+                        continue
+                    if parsed is not None:
+                        self.push(*parsed)
+            except Exception as exc:
+                log.warning("sensor read failed: %s", exc)
+            finally:
+                close = getattr(stream, 'close', None)
+                if close is not None:
+                    close()
+            self._stop.wait(self.reconnect_delay)
+
+
+def sensor_from_spec(spec):
+    """'sim' | 'sim:<seed>' | 'trace:<file.csv>' | 'serial:<port>[@baud]' -> SensorSource"""
+    kind, _, arg = (spec or 'sim').partition(':')
+    if kind == 'sim':
+        return SimulatedSensor(seed=int(arg) if arg else None)
+    if kind == 'trace':
+        return TraceReplaySensor(arg)
+    if kind == 'serial':
+        port, _, baud = arg.partition('@')
+        # pyserial fakt ya mode sathi lagto
+        import serial
+        return StreamSensor(lambda: serial.Serial(port, int(baud or 9600), timeout=1))
+    raise ValueError(f"Unknown sensor spec: {spec}")
@@ -0,0 +1,277 @@
+"""Deterministic control-logic simulation - virtual clock, in-memory SQLite.
+
+Synthetic kiva recorded traces FoggerController / ZoneScheduler madhun real
+time peksha hajaro pat vegane chalavto ani motor cycles, ON time, history
+events report karto. Regression / performance test bed:
+
+    python fogger_sim.py --trace diurnal --days 7 --zones 20
+    python fogger_sim.py --trace csv:history.csv --interval 5 --json
+"""
+import argparse
+import json
+import math
+import random
+import time
+from datetime import datetime
+
+from fogger_control import AdaptiveSampler, ControlConfig, FoggerController, Zone, ZoneScheduler
+from fogger_db import DatabaseManager, event_row
+from fogger_programs import ProgramScheduler, parse_window
+from fogger_sensors import SensorReading, SensorSource, TraceReplaySensor
+from fogger_telemetry import TelemetryBuffer
+
+DAY = 24 * 60 * 60
+# 2024-06-01 00:00 local - rollup buckets sathi fixed suruvat
+DEFAULT_START = datetime(2024, 6, 1).timestamp()
+
+
+# ==========================================
+#  VIRTUAL CLOCK + SOURCES
+# ==========================================
+class VirtualClock:
+    """time.time() sarkha callable - fakt advance() ne pudhe jato"""
+
+    def __init__(self, start=DEFAULT_START):
+        self.start = start
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+    @property
+    def elapsed(self):
+        return self.now - self.start
+
+
+class FunctionSensor(SensorSource):
+    """fn(seconds since midnight) + gaussian noise - seed mule deterministic"""
+
+    def __init__(self, fn, clock, noise=0.2, humidity=60.0, seed=0):
+        self.fn = fn
+        self._clock = clock
+        self.noise = noise
+        self.humidity = humidity
+        self._rng = random.Random(seed)
+
+    def read(self):
+        now = self._clock()
+        local = datetime.fromtimestamp(now)
+        t = local.hour * 3600 + local.minute * 60 + local.second
+        return SensorReading(
+            round(self.fn(t) + self._rng.gauss(0, self.noise), 2),
+            round(self.humidity + self._rng.gauss(0, self.noise * 2), 2),
+            now,
+        )
+
+
+def diurnal(t):
+    """30 C raatri, ~41 C dupari 3 vajta"""
+    return 35.5 - 5.5 * math.cos(2 * math.pi * (t - 3 * 3600) / DAY)
+
+
+def heat_spike(t):
+    """34 C, 12:00 la 2 C/min ne 42 C, tasabhar nantar halu khali"""
+    start = 12 * 3600
+    if start <= t < start + 3600:
+        return min(42.0, 34.0 + (t - start) / 30)
+    if start + 3600 <= t < start + 7200:
+        return 42.0 - (t - start - 3600) / 450
+    return 34.0
+
+
+def step(t):
+    """Sakali 30 C, 10:00 te 14:00 43 C"""
+    return 43.0 if 10 * 3600 <= t < 14 * 3600 else 30.0
+
+
+TRACES = {'diurnal': diurnal, 'spike': heat_spike, 'step': step}
+
+
+def make_source(spec, clock, seed=0, noise=0.2):
+    """'diurnal' | 'spike' | 'step' | 'csv:<file>' -> SensorSource (virtual clock var)"""
+    kind, _, arg = spec.partition(':')
+    if kind == 'csv':
+        return TraceReplaySensor(arg, loop=True, clock=clock)
+    if kind not in TRACES:
+        raise ValueError(f"Unknown trace: {spec}")
+    return FunctionSensor(TRACES[kind], clock, noise=noise, seed=seed)
+
+
+# ==========================================
+#  SIMULATION
+# ==========================================
+class SimWriter:
+    """Controller writer - virtual timestamp ne history rows, batch madhe save_events"""
+
+    def __init__(self, db, clock, batch=500):
+        self.db = db
+        self._clock = clock
+        self.batch = batch
+        self._rows = []
+        self.written = 0
+
+    def __call__(self, status, temperature, humidity, duration_s, reason, zone_id=1):
+        when = datetime.fromtimestamp(self._clock())
+        self._rows.append(event_row(status, temperature, humidity, duration_s, reason,
+                                    when=when, zone_id=zone_id))
+        if len(self._rows) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        if self._rows:
+            self.written += self.db.save_events(self._rows)
+            self._rows = []
+
+
+def simulate(trace='diurnal', days=1.0, zones=1, interval=5.0, config=None,
+             adaptive=False, telemetry=False, noise=0.2, seed=0, db=None, programs=()):
+    """Purn run karun summary dict return kara (wall time sakat).
+
+    `programs` - DatabaseManager.add_program() kwargs chi list.
+    """
+    clock = VirtualClock()
+    db = db or DatabaseManager(':memory:')
+    # Zones table madhe simulated zones (zone 1 already asto)
+    for zone_id in range(2, zones + 1):
+        if db.get_zone(zone_id) is None:
+            db.add_zone(f"Sim {zone_id}")
+    writer = SimWriter(db, clock)
+    sampler = AdaptiveSampler(fast_s=min(1.0, interval), normal_s=interval,
+                              clock=clock) if adaptive else None
+    scheduler = ZoneScheduler(sampler=sampler)
+    stats = {}
+    for zone_id in range(1, zones + 1):
+        controller = FoggerController(writer=writer, config=config or ControlConfig(),
+                                      clock=clock, zone_id=zone_id)
+        zone = scheduler.add(Zone(zone_id, f"Sim {zone_id}", controller,
+                                  make_source(trace, clock, seed=seed + zone_id, noise=noise)))
+        stats[zone_id] = zone_stats = {'cycles': 0, 'on_seconds': 0.0, 'predictive': 0,
+                                       'program': 0}
+        controller.subscribe(
+            lambda event, data, s=zone_stats:
+            _count(s, data) if event == 'motor' else None
+        )
+    buffer = None
+    if telemetry:
+        buffer = TelemetryBuffer(db, clock=clock)
+        for zone in scheduler:
+            buffer.track(zone)
+
+    for program in programs:
+        db.add_program(**program)
+    program_scheduler = ProgramScheduler(scheduler, clock=clock)
+    program_scheduler.load(db.get_programs(enabled_only=True))
+
+    scheduler.start()
+    end = days * DAY
+    ticks = 0
+    wall = time.perf_counter()
+    while clock.elapsed < end:
+        program_scheduler.poll()
+        scheduler.tick()
+        ticks += 1
+        step_s = scheduler.next_interval(default=interval)
+        until_program = program_scheduler.seconds_until_next()
+        if until_program is not None:
+            step_s = min(step_s, max(until_program, 0.001))
+        for zone in scheduler:
+            if zone.controller.motor_on:
+                stats[zone.zone_id]['on_seconds'] += step_s
+        clock.advance(step_s)
+    scheduler.stop()
+    writer.flush()
+    if buffer is not None:
+        buffer.close()
+    wall = time.perf_counter() - wall
+
+    return {
+        'trace': trace,
+        'days': days,
+        'zones': zones,
+        'ticks': ticks,
+        'samples': ticks * zones,
+        'cycles': sum(s['cycles'] for s in stats.values()),
+        'predictive_starts': sum(s['predictive'] for s in stats.values()),
+        'program_starts': sum(s['program'] for s in stats.values()),
+        'on_hours': round(sum(s['on_seconds'] for s in stats.values()) / 3600, 2),
+        'events_written': writer.written,
+        'history_rows': db.get_count(),
+        'wall_seconds': round(wall, 3),
+        'speedup': round(end / wall) if wall else None,
+        'per_zone': stats,
+    }
+
+
+def _count(stats, data):
+    if data['on']:
+        stats['cycles'] += 1
+        if data['reason'].startswith("Predictive"):
+            stats['predictive'] += 1
+        elif data['source'] == 'program':
+            stats['program'] += 1
+
+
+def _program_spec(spec):
+    """'fog,11:00-16:00,30,120' / 'block,20:00-06:00' -> add_program() kwargs"""
+    kind, window, *rest = spec.split(',')
+    start_min, end_min = parse_window(window)
+    program = {'name': spec, 'kind': kind, 'start_min': start_min, 'end_min': end_min}
+    if kind == 'fog':
+        every_min, duration_s = (int(v) for v in rest)
+        program.update(every_min=every_min or None, duration_s=duration_s)
+    return program
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Auto Fogger control simulation")
+    parser.add_argument('--trace', default='diurnal', help="diurnal | spike | step | csv:<file>")
+    parser.add_argument('--days', type=float, default=1.0)
+    parser.add_argument('--zones', type=int, default=1)
+    parser.add_argument('--interval', type=float, default=5.0, help="sample interval (s)")
+    parser.add_argument('--adaptive', action='store_true', help="AdaptiveSampler vapra")
+    parser.add_argument('--telemetry', action='store_true', help="TelemetryBuffer pan chalva")
+    parser.add_argument('--noise', type=float, default=0.2, help="sensor noise sigma (C)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--on-temp', type=float, default=40.0)
+    parser.add_argument('--off-temp', type=float, default=38.5)
+    parser.add_argument('--min-on', type=float, default=60)
+    parser.add_argument('--min-off', type=float, default=30)
+    parser.add_argument('--smoothing', choices=('ema', 'sma', 'none'), default='ema')
+    parser.add_argument('--forecast', type=float, default=0, help="predictive horizon (s)")
+    parser.add_argument('--program', action='append', default=[],
+                        help="fog,HH:MM-HH:MM,every_min,duration_s | block,HH:MM-HH:MM (parat deta yeto)")
+    parser.add_argument('--json', action='store_true', help="summary JSON madhe")
+    args = parser.parse_args(argv)
+    try:
+        program_specs = [_program_spec(spec) for spec in args.program]
+    except ValueError as exc:
+        parser.error(f"--program: {exc}")
+
+    config = ControlConfig(
+        on_temp=args.on_temp, off_temp=args.off_temp,
+        min_on_s=args.min_on, min_off_s=args.min_off,
+        smoothing=None if args.smoothing == 'none' else args.smoothing,
+        forecast_s=args.forecast,
+    )
+    result = simulate(args.trace, args.days, args.zones, args.interval, config,
+                      adaptive=args.adaptive, telemetry=args.telemetry,
+                      noise=args.noise, seed=args.seed,
+                      programs=program_specs)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return result
+    print(f"trace {result['trace']}, {result['days']:g} day(s), {result['zones']} zone(s), "
+          f"{result['ticks']} ticks / {result['samples']} samples")
+    print(f"motor cycles      {result['cycles']} ({result['predictive_starts']} predictive, "
+          f"{result['program_starts']} program)")
+    print(f"motor ON          {result['on_hours']} h (all zones)")
+    print(f"events written    {result['events_written']} (history rows {result['history_rows']})")
+    print(f"wall time         {result['wall_seconds']} s  ({result['speedup']}x real time)")
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+import atexit
+import operator
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from array import array
+from itertools import accumulate
+
+
+# 0.1 C / 0.1 % resolution, int16 madhe. Garbage readings clamp hotat mhanje
+# delta pan int16 madhe basto.
+SCALE = 10
+_LIMIT = 0x3FFF
+# Block madhle offsets uint16 - ek block 65535 s paryantach pasarto
+MAX_BLOCK_SPAN = 0xFFFF
+
+
+# ==========================================
+#  BLOCK ENCODING
+# ==========================================
+def _delta(values):
+    """Pahila value tasach, baki maglya value pasun farak (slow signals -> lahan sankhya)"""
+    out = array(values.typecode, values[:1])
+    out.extend(map(operator.sub, values[1:], values[:-1]))
+    return out
+
+
+def _undelta(values):
+    return array(values.typecode, accumulate(values))
+
+
+def _to_le(values):
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def encode_block(offsets, temps, hums):
+    """array('H') offsets + array('h') scaled temp/humidity -> zlib blob.
+
+    Teeni columns delta-encoded, little-endian, ekamagun ek (columnar).
+    """
+    payload = b''.join(_to_le(_delta(col)) for col in (offsets, temps, hums))
+    return zlib.compress(payload, 6)
+
+
+def decode_block(start_ts, count, data):
+    """Blob -> (timestamps, temperatures, humidities) lists"""
+    payload = zlib.decompress(data)
+    size = count * 2
+    offsets = _undelta(_from_le('H', payload[:size]))
+    temps = _undelta(_from_le('h', payload[size:size * 2]))
+    hums = _undelta(_from_le('h', payload[size * 2:size * 3]))
+    return (
+        [start_ts + o for o in offsets],
+        [t / SCALE for t in temps],
+        [h / SCALE for h in hums],
+    )
+
+
+class _Block:
+    """Ekach zone che chalu (ajun na lihilele) samples"""
+
+    __slots__ = ('zone_id', 'start_ts', 'last_ts', 'offsets', 'temps', 'hums')
+
+    def __init__(self, zone_id, start_ts):
+        self.zone_id = zone_id
+        self.start_ts = start_ts
+        self.last_ts = start_ts
+        self.offsets = array('H')
+        self.temps = array('h')
+        self.hums = array('h')
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def fits(self, ts):
+        return self.last_ts <= ts <= self.start_ts + MAX_BLOCK_SPAN
+
+    def append(self, ts, temperature, humidity):
+        self.offsets.append(ts - self.start_ts)
+        self.temps.append(max(-_LIMIT, min(_LIMIT, round(temperature * SCALE))))
+        self.hums.append(max(-_LIMIT, min(_LIMIT, round(humidity * SCALE))))
+        self.last_ts = ts
+
+    def row(self):
+        """save_telemetry_blocks() sathi (zone_id, start_ts, end_ts, count, data)"""
+        return (self.zone_id, self.start_ts, self.last_ts, len(self),
+                encode_block(self.offsets, self.temps, self.hums))
+
+
+# ==========================================
+#  TELEMETRY BUFFER
+# ==========================================
+class TelemetryBuffer:
+    """Pratyek sensor sample zone-wise arrays madhe; block bharla ki ek row.
+
+    Block `block_size` samples zala kiva tyacha pahila sample `max_age_s` juna
+    zala ki compress houn DB la jato (DBWorker asel tar tyavar). Ek sample
+    mhanje tin array slots - per-sample Python objects / rows nahit.
+    """
+
+    def __init__(self, db, worker=None, block_size=600, max_age_s=300, clock=time.time):
+        self.db = db
+        self.worker = worker
+        self.block_size = block_size
+        self.max_age_s = max_age_s
+        self._clock = clock
+        self._blocks = {}
+        self._lock = threading.Lock()
+        self._last_future = None
+        atexit.register(self.close)
+
+    @property
+    def pending(self):
+        return sum(len(b) for b in self._blocks.values())
+
+    def track(self, zone):
+        """Zone chya controller che 'reading' events record kara"""
+        zone.controller.subscribe(
+            lambda event, data, zone_id=zone.zone_id:
+            self.add(zone_id, data['temperature'], data['humidity'])
+            if event == 'reading' else None
+        )
+
+    def add(self, zone_id, temperature, humidity, ts=None):
+        ts = int(ts if ts is not None else self._clock())
+        ready = []
+        with self._lock:
+            block = self._blocks.get(zone_id)
+            if block is not None and not block.fits(ts):
+                # Clock maage gela kiva block span sampla
+                ready.append(self._blocks.pop(zone_id))
+                block = None
+            if block is None:
+                block = self._blocks[zone_id] = _Block(zone_id, ts)
+            block.append(ts, temperature, humidity)
+            if len(block) >= self.block_size or ts - block.start_ts >= self.max_age_s:
+                ready.append(self._blocks.pop(zone_id))
+        if ready:
+            self._write([b.row() for b in ready])
+
+    def flush(self, wait=False):
+        """Sagle ardhavat blocks lihun kadha"""
+        with self._lock:
+            blocks, self._blocks = list(self._blocks.values()), {}
+        if blocks:
+            self._write([b.row() for b in blocks], wait)
+        elif wait and self._last_future is not None:
+            self._last_future.result()
+        return len(blocks)
+
+    def _write(self, rows, wait=False):
+        if self.worker is not None and self.worker.running:
+            self._last_future = self.worker.submit(self.db.save_telemetry_blocks, rows)
+            if wait:
+                self._last_future.result()
+        else:
+            self.db.save_telemetry_blocks(rows)
+
+    def close(self):
+        try:
+            self.flush(wait=True)
+        except sqlite3.ProgrammingError:
+            # DB already closed - atexit la kahi karu shakat nahi
+            pass
+        atexit.unregister(self.close)
+
+
+# ==========================================
+#  QUERIES
+# ==========================================
+def read_telemetry(db, zone_id, since_ts, until_ts):
+    """[since_ts, until_ts) madhle samples -> (timestamps, temperatures, humidities)"""
+    out_ts, out_t, out_h = [], [], []
+    for start_ts, end_ts, count, data in db.get_telemetry_blocks(
+            zone_id, since_ts, until_ts, max_span=MAX_BLOCK_SPAN):
+        ts, temps, hums = decode_block(start_ts, count, data)
+        if start_ts >= since_ts and end_ts < until_ts:
+            out_ts += ts
+            out_t += temps
+            out_h += hums
+            continue
+        # Range chya kadevarcha block - fakt aatle samples
+        for i, t in enumerate(ts):
+            if since_ts <= t < until_ts:
+                out_ts.append(t)
+                out_t.append(temps[i])
+                out_h.append(hums[i])
+    return out_ts, out_t, out_h
+
+
+# ==========================================
+#  RING BUFFER (live charts)
+# ==========================================
+class RingBuffer:
+    """Fixed-size, preallocated array - append la allocation nahi, juna value overwrite"""
+
+    def __init__(self, capacity, typecode='d'):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._data = array(typecode, [0]) * capacity
+        self._head = 0   # pudhcha write index
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value):
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+    @property
+    def latest(self):
+        if not self._count:
+            return None
+        return self._data[self._head - 1]
+
+    def values(self):
+        """Oldest -> newest (copy)"""
+        if self._count < self.capacity:
+            return self._data[:self._count]
+        return self._data[self._head:] + self._data[:self._head]
+
+    def bounds(self):
+        """(min, max) - kram mahatvacha nahi mhanun rotate na karta"""
+        data = self._data if self._count == self.capacity else self._data[:self._count]
+        return min(data), max(data)
+
+
+class GridRing(RingBuffer):
+    """RingBuffer fixed time grid var - pratyek `step_s` slot la ek value.
+
+    Adaptive polling (1 s / 5 s / 15 s) madhe pan capacity * step_s itkach vel
+    disto. Ekach slot madhle readings shevatchi value thevtat; chukalele slots
+    maglya ani navin value madhe linear interpolate hotat.
+    """
+
+    def __init__(self, capacity, step_s, typecode='d'):
+        super().__init__(capacity, typecode)
+        self.step_s = step_s
+        self._slot = None
+
+    def add(self, ts, value):
+        slot = int(ts // self.step_s)
+        if not self._count:
+            self.append(value)
+        elif slot <= self._slot:
+            # Tyach slot madhe (kiva clock maghe gela) - shevatchi value badla
+            self._data[self._head - 1] = value
+            return
+        else:
+            last = self.latest
+            gap = slot - self._slot
+            for i in range(max(1, gap - self.capacity + 1), gap):
+                self.append(last + (value - last) * i / gap)
+            self.append(value)
+        self._slot = slot
+
+    def clear(self):
+        super().clear()
+        self._slot = None
+
+
+def sparkline_points(ring, x, y, width, height, out=None):
+    """Ring che values [x, y, width, height] box madhe Line.points sathi.
+
+    Newest value ujvya kadela; x-step capacity varun fix, mhanje buffer
+    bharat astana line ujvikadun vadhte. `out` list reuse hote.
+    """
+    if out is None:
+        out = []
+    n = len(ring)
+    if n < 2:
+        del out[:]
+        return out
+    lo, hi = ring.bounds()
+    step = width / (ring.capacity - 1)
+    x0 = x + width - (n - 1) * step
+    if hi > lo:
+        scale = height / (hi - lo)
+        ys = [y + (v - lo) * scale for v in ring.values()]
+    else:
+        ys = [y + height / 2] * n
+    if len(out) != 2 * n:
+        out[:] = [0.0] * (2 * n)
+    out[0::2] = [x0 + i * step for i in range(n)]
+    out[1::2] = ys
+    return out